@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Report the memory saved by ``FeatureEngineer(compact=True)`` and its AUC cost.
+
+Usage:
+  python scripts/bench_compact.py [--rows 100000] [--tolerance 0.005]
+
+Engineers cleaned synthetic loan rows with the default float64/int64 output
+and with ``compact=True``, prints bytes saved per column, then trains each
+model on both frames and exits non-zero if a compact validation ROC-AUC falls
+more than ``--tolerance`` below the float64 one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import warnings
+
+import pandas as pd
+
+from scripts.bench_utils import loan_frame
+from src.dataprep import clean, memory_report
+from src.features import FeatureEngineer
+from src.models import cart, logreg, random_forest
+
+
+def main() -> None:
+    """Print the per-column memory report and the AUC comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--tolerance", type=float, default=0.005)
+    ns = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    df = clean(loan_frame(ns.rows))
+    full = FeatureEngineer(preallocate=True).transform(df)
+    compact = FeatureEngineer(preallocate=True, compact=True).transform(df)
+    report = memory_report(full, compact)
+    report[["bytes_before", "bytes_after", "bytes_saved"]] /= 2**20
+    print(
+        report.rename(columns=lambda c: c.replace("bytes", "mib")).round(2).to_string()
+    )
+
+    rows = []
+    for module in (logreg, cart, random_forest):
+        base = module.train_from_df(full)
+        small = module.train_from_df(compact)
+        rows.append({"model": module.__name__, "auc": base, "auc_compact": small})
+    result = pd.DataFrame(rows).assign(delta=lambda r: r.auc_compact - r.auc)
+    print(result.round(4).to_string(index=False))
+    if (result.delta < -ns.tolerance).any():
+        sys.exit(f"compact AUC dropped by more than {ns.tolerance}")
+
+
+if __name__ == "__main__":
+    main()
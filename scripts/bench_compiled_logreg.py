@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare sklearn and compiled NumPy scoring latency for logistic regression.
+
+Usage:
+  python scripts/bench_compiled_logreg.py [--batch 10000]
+
+Fits :func:`src.models.logreg.build_pipeline` on synthetic engineered rows,
+exports it with :func:`src.compiled_logreg.compile_logreg` and reports the
+median single-row latency (one dict) plus batch throughput for both paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from scripts.bench_utils import loan_frame
+from src.compiled_logreg import compile_logreg
+from src.dataprep import clean
+from src.features import FeatureEngineer
+from src.models import logreg
+
+
+def _median_latency(fn, n: int = 500) -> float:
+    times = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times))
+
+
+def main() -> None:
+    """Print latency and batch timings for both scorers."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=10_000)
+    ns = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    df = FeatureEngineer().transform(clean(loan_frame(max(ns.batch, 2_000))))
+    x, y = df.drop(columns=["loan_status"]), df["loan_status"]
+    cat_cols = x.select_dtypes(include=["object", "category"]).columns.tolist()
+    num_cols = [c for c in x.columns if c not in cat_cols]
+    pipe = logreg.build_pipeline(cat_cols, num_cols).fit(x, y)
+    plan = compile_logreg(pipe)
+
+    row_df = x.iloc[[0]]
+    row = x.iloc[0].to_dict()
+    batch = x.iloc[: ns.batch]
+    diff = np.abs(plan.predict_proba(batch) - pipe.predict_proba(batch)).max()
+
+    res = pd.DataFrame(
+        {
+            "single_row_us": [
+                _median_latency(lambda: pipe.predict_proba(row_df)) * 1e6,
+                _median_latency(lambda: plan.predict_proba(row)) * 1e6,
+            ],
+            f"batch_{ns.batch}_ms": [
+                _median_latency(lambda: pipe.predict_proba(batch), 5) * 1e3,
+                _median_latency(lambda: plan.predict_proba(batch), 5) * 1e3,
+            ],
+        },
+        index=["sklearn", "compiled"],
+    )
+    print(res.round(1).to_string())
+    print(f"max |Δp| = {diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark array-backed tree inference against sklearn ``predict_proba``.
+
+Usage:
+  python scripts/bench_compiled_trees.py [--sizes 1 100 10000 1000000]
+
+Fits CART, a 200-tree random forest and a 200-stage gradient boosting model
+on synthetic engineered loan features, compiles each with
+:func:`src.compiled_trees.compile_trees` and reports the time per batch for
+both paths across batch sizes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from scripts.bench_utils import best_time, loan_frame
+from src.compiled_trees import compile_trees
+from src.dataprep import clean
+from src.features import FeatureEngineer
+
+
+def main() -> None:
+    """Print sklearn vs compiled timings per model and batch size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1_000, 10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--float32", action="store_true", help="float32 thresholds")
+    ns = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    df = FeatureEngineer().transform(clean(loan_frame(4_000)))
+    y = df.pop("loan_status").astype(int)
+    X_train = df.select_dtypes("number").to_numpy(float)
+    pool = X_train[np.random.default_rng(1).integers(0, len(X_train), max(ns.sizes))]
+
+    models = {
+        "cart": DecisionTreeClassifier(random_state=42),
+        "random_forest": RandomForestClassifier(n_estimators=200, random_state=42),
+        "gboost": GradientBoostingClassifier(n_estimators=200, random_state=42),
+    }
+    dtype = np.float32 if ns.float32 else np.float64
+    rows = []
+    for name, model in models.items():
+        model.fit(X_train, y)
+        plan = compile_trees(model, threshold_dtype=dtype)
+        for n in ns.sizes:
+            X = pool[:n]
+            assert np.array_equal(plan.predict_proba(X), model.predict_proba(X))
+            repeat = 5 if n <= 10_000 else 1
+            t_sk = best_time(lambda: model.predict_proba(X), repeat)
+            t_np = best_time(lambda: plan.predict_proba(X), repeat)
+            rows.append(
+                {
+                    "model": name,
+                    "batch": n,
+                    "sklearn_ms": t_sk * 1e3,
+                    "compiled_ms": t_np * 1e3,
+                    "speedup": t_sk / t_np,
+                }
+            )
+    print(pd.DataFrame(rows).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
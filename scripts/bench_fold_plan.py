@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Measure fold encoding in ``evaluate_models`` with and without a fold plan.
+
+Usage:
+  python scripts/bench_fold_plan.py [--rows 2000] [--models logreg cart]
+
+Runs :func:`src.evaluate.evaluate_models` on cleaned synthetic loan rows once
+with the shared :func:`src.cv_utils.build_fold_plan` (the default) and once
+re-splitting and re-encoding inside every model's nested CV, and prints the
+number of one-hot encoder calls, the time spent in them, the total wall time
+and the mean ROC-AUC.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from unittest import mock
+
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+
+from scripts.bench_utils import loan_frame
+from src import evaluate
+from src.dataprep import clean
+
+
+def _counted(stats: dict, fn):
+    def wrapper(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        out = fn(self, *args, **kwargs)
+        stats["calls"] += 1
+        stats["seconds"] += time.perf_counter() - t0
+        return out
+
+    return wrapper
+
+
+def main() -> None:
+    """Print encoder calls and time per setting."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument("--models", nargs="+", default=["logreg", "cart"])
+    ns = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    df = clean(loan_frame(ns.rows))
+    rows = []
+    for planned in (False, True):
+        stats = {"calls": 0, "seconds": 0.0}
+        patches = [
+            mock.patch.object(
+                ColumnTransformer,
+                name,
+                _counted(stats, getattr(ColumnTransformer, name)),
+            )
+            for name in ("fit_transform", "transform")
+        ]
+        if not planned:
+            patches.append(mock.patch.object(evaluate, "build_fold_plan"))
+        with tempfile.TemporaryDirectory() as tmp:
+            for p in patches:
+                p.start()
+            try:
+                t0 = time.perf_counter()
+                if not planned:
+                    evaluate.build_fold_plan.return_value = None
+                out = evaluate.evaluate_models(
+                    df,
+                    csv_path=Path(tmp) / "metrics.csv",
+                    models=ns.models,
+                    n_jobs=1,
+                )
+                seconds = time.perf_counter() - t0
+            finally:
+                for p in patches:
+                    p.stop()
+        rows.append(
+            {
+                "fold_plan": planned,
+                "encoder_calls": stats["calls"],
+                "encoder_seconds": stats["seconds"],
+                "seconds": seconds,
+                "roc_auc": out["roc_auc"].mean(),
+            }
+        )
+    print(pd.DataFrame(rows).round(4).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
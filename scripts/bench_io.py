@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Compare CSV and Parquet load time for the loan schema.
+
+Usage:
+  python scripts/bench_io.py [--rows 100000 1000000 5000000]
+
+Writes synthetic loan rows as CSV, Parquet and Arrow IPC in a temporary
+directory and times :func:`src.dataprep.load_raw` for each file, both for all
+columns and for a four-column projection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.bench_utils import loan_frame
+from src.dataprep import load_raw
+from src.tabular_io import write_table
+
+PROJECTION = ["income_annum", "loan_amount", "cibil_score", "loan_status"]
+
+
+def _best(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    """Print load timings and file sizes per format."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    ns = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in ns.rows:
+            df = loan_frame(n)
+            for suffix in (".csv", ".parquet", ".arrow"):
+                path = write_table(df, Path(tmp) / f"loans_{n}{suffix}")
+                rows.append(
+                    {
+                        "rows": n,
+                        "format": suffix[1:],
+                        "size_mib": path.stat().st_size / 2**20,
+                        "all_cols_s": _best(lambda: load_raw(path)),
+                        "4_cols_s": _best(lambda: load_raw(path, PROJECTION)),
+                    }
+                )
+    print(pd.DataFrame(rows).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Compare untyped and schema-typed loading of the loan CSV.
+
+Usage:
+  python scripts/bench_load.py [--rows 1000000]
+
+Writes synthetic loan rows to a temporary CSV and reports load time and the
+resident size of the resulting frame (``memory_usage(deep=True)``) for
+:func:`src.dataprep.load_raw` and the :func:`src.dataprep.load_typed`
+variants, with all columns and with a four-column projection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.bench_utils import loan_frame, measure
+from src.dataprep import load_raw, load_typed
+
+PROJECTION = ["income_annum", "loan_amount", "cibil_score", "loan_status"]
+
+
+def main() -> None:
+    """Print load time and frame size per loader."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    ns = parser.parse_args()
+
+    loaders = {
+        "load_raw": lambda p, c: load_raw(p, c),
+        "typed": lambda p, c: load_typed(p, c),
+        "typed pyarrow": lambda p, c: load_typed(p, c, engine="pyarrow"),
+        "typed arrow dtypes": lambda p, c: load_typed(
+            p, c, engine="pyarrow", arrow_dtypes=True
+        ),
+    }
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "loans.csv"
+        loan_frame(ns.rows).to_csv(path, index=False)
+        for cols in (None, PROJECTION):
+            for name, load in loaders.items():
+                seconds, _ = measure(lambda: load(path, cols))
+                size = load(path, cols).memory_usage(deep=True).sum()
+                rows.append(
+                    {
+                        "loader": name,
+                        "columns": "all" if cols is None else len(cols),
+                        "seconds": seconds,
+                        "frame_mib": size / 2**20,
+                    }
+                )
+    print(pd.DataFrame(rows).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
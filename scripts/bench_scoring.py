@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare the bundled scoring path with the manual multi-copy path.
+
+Usage:
+  python scripts/bench_scoring.py [--rows 10000 100000 1000000]
+
+The manual path is what consumers wrote before :class:`src.scoring.
+ScoringModel` existed: ``clean`` → ``FeatureEngineer.transform`` → drop the
+target → ``predict_proba``. Both paths are timed on synthetic raw rows and
+their peak traced memory is reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from scripts.bench_utils import loan_frame, measure
+from src.dataprep import clean
+from src.features import FeatureEngineer
+from src.models import logreg
+from src.scoring import ScoringModel
+
+
+def _manual(pipe, df: pd.DataFrame) -> np.ndarray:
+    X = FeatureEngineer().transform(clean(df)).drop(columns=["loan_status"])
+    return pipe.predict_proba(X)[:, 1]
+
+
+def main() -> None:
+    """Print timing and memory for both scoring paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    ns = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    train = FeatureEngineer().transform(clean(loan_frame(2_000, seed=1)))
+    x, y = train.drop(columns=["loan_status"]), train["loan_status"]
+    cat_cols = x.select_dtypes(include=["object", "category"]).columns.tolist()
+    num_cols = [c for c in x.columns if c not in cat_cols]
+    pipe = logreg.build_pipeline(cat_cols, num_cols).fit(x, y)
+    bundle = ScoringModel(pipe, feature_engineer=FeatureEngineer().fit(x))
+
+    rows = []
+    for n in ns.rows:
+        df = loan_frame(n)
+        assert np.allclose(_manual(pipe, df), bundle.score(df))
+        t_old, m_old = measure(lambda: _manual(pipe, df))
+        t_new, m_new = measure(lambda: bundle.score(df))
+        rows.append(
+            {
+                "rows": n,
+                "manual_s": t_old,
+                "bundle_s": t_new,
+                "manual_peak_mib": m_old,
+                "bundle_peak_mib": m_new,
+            }
+        )
+    print(pd.DataFrame(rows).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
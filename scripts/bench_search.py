@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Compare exhaustive grid search with successive halving on the model grids.
+
+Usage:
+  python scripts/bench_search.py [--rows 2000] [--models gradient_boosting cart]
+                                 [--unstaged] [--prune]
+
+Runs each model's ``grid_train_from_df`` with ``search="grid"`` and
+``search="halving"`` on cleaned, engineered synthetic loan rows and prints
+wall time, number of fits, the best CV ROC-AUC each search reports and the
+exhaustive-grid CV score of the configuration halving picked (``parity``).
+``--unstaged`` adds a ``grid-unstaged`` run that fits every candidate from
+scratch instead of sharing fits along ``n_estimators`` or the ``C`` path.
+``--prune`` adds a ``prune`` run for CART that tunes ``ccp_alpha`` by
+pruning one tree per fold instead of searching depth and leaf sizes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import time
+import warnings
+from unittest import mock
+
+import pandas as pd
+
+from scripts.bench_utils import loan_frame
+from src.dataprep import clean
+from src.features import FeatureEngineer
+from src.pipeline_helpers import run_gs
+
+
+def _grid_score(gs, params: dict) -> float:
+    """Return the mean CV score ``gs`` recorded for ``params``."""
+    for cand, score in zip(gs.cv_results_["params"], gs.cv_results_["mean_test_score"]):
+        if all(cand.get(k) == v for k, v in params.items()):
+            return float(score)
+    return float("nan")
+
+
+def main() -> None:
+    """Print time, fit count and best score per model and search."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2_000)
+    parser.add_argument(
+        "--models", nargs="+", default=["gradient_boosting", "random_forest", "cart"]
+    )
+    parser.add_argument("--unstaged", action="store_true")
+    parser.add_argument("--prune", action="store_true")
+    ns = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    df = FeatureEngineer().transform(clean(loan_frame(ns.rows)))
+    rows = []
+    for name in ns.models:
+        module = importlib.import_module(f"src.models.{name}")
+        searches = {}
+        labels = ["grid", "halving"] + (["grid-unstaged"] if ns.unstaged else [])
+        if ns.prune and name == "cart":
+            labels.append("prune")
+        for search in labels:
+            seen = []
+
+            def record(*args, **kwargs):
+                if search == "grid-unstaged":
+                    kwargs["staged"] = kwargs["path"] = None
+                seen.append(run_gs(*args, **kwargs))
+                return seen[-1]
+
+            with mock.patch.object(module, "run_gs", record):
+                t0 = time.perf_counter()
+                if search == "prune":
+                    module.grid_train_from_df(df, prune=True)
+                else:
+                    module.grid_train_from_df(df, search=search.split("-")[0])
+                seconds = time.perf_counter() - t0
+            gs = searches[search] = seen[0]
+            rows.append(
+                {
+                    "model": name,
+                    "search": search,
+                    "seconds": seconds,
+                    "fits": len(gs.cv_results_["params"]) * gs.n_splits_,
+                    "best_cv_auc": gs.best_score_,
+                }
+            )
+        rows[len(rows) - len(labels) + 1]["parity"] = _grid_score(
+            searches["grid"], searches["halving"].best_params_
+        )
+    print(pd.DataFrame(rows).round(4).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
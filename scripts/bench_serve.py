@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Load-test the micro-batching scoring server.
+
+Usage:
+  python scripts/bench_serve.py [--model-path artefacts/logreg.joblib \
+      --data data/raw/loan_approval_dataset.csv] [--clients 32]
+
+Starts :func:`src.serve.make_server` in-process on a free port and fires
+single-row ``POST /predict`` requests from concurrent client threads, then
+prints p50/p99 latency and throughput. Without ``--model-path`` a small
+logistic regression is trained on synthetic data so the script runs
+anywhere.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+
+from src.serve import make_server
+
+
+def _toy_model() -> tuple[object, pd.DataFrame]:
+    X, y = make_classification(n_samples=500, n_features=8, random_state=0)
+    df = pd.DataFrame(X, columns=[f"f{i}" for i in range(X.shape[1])])
+    return LogisticRegression(max_iter=1000).fit(df, y), df
+
+
+def _client(url: str, rows: list[dict], latencies: list[float]) -> None:
+    for row in rows:
+        body = json.dumps(row).encode()
+        req = urllib.request.Request(
+            url, data=body, headers={"Content-Type": "application/json"}
+        )
+        t0 = time.perf_counter()
+        with urllib.request.urlopen(req) as resp:
+            resp.read()
+        latencies.append(time.perf_counter() - t0)
+
+
+def run(
+    model,
+    df: pd.DataFrame,
+    clients: int,
+    requests: int,
+    max_batch_size: int,
+    max_wait_ms: float,
+) -> dict[str, float]:
+    """Return latency percentiles (ms) and throughput (req/s)."""
+    server = make_server(
+        {"model": model}, port=0, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    url = f"http://{host}:{port}/predict/model"
+
+    records = json.loads(df.to_json(orient="records"))
+    latencies: list[float] = []
+    workers = []
+    t0 = time.perf_counter()
+    for c in range(clients):
+        rows = [records[(c * requests + i) % len(records)] for i in range(requests)]
+        t = threading.Thread(target=_client, args=(url, rows, latencies))
+        t.start()
+        workers.append(t)
+    for t in workers:
+        t.join()
+    wall = time.perf_counter() - t0
+
+    batches = server.batchers["model"].n_batches
+    server.shutdown()
+    server.server_close()
+    for b in server.batchers.values():
+        b.close()
+    lat = np.array(latencies) * 1000
+    return {
+        "p50_ms": float(np.percentile(lat, 50)),
+        "p99_ms": float(np.percentile(lat, 99)),
+        "throughput_rps": len(lat) / wall,
+        "mean_batch": len(lat) / max(batches, 1),
+    }
+
+
+def main() -> None:
+    """Run the load generator and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model-path", type=Path, default=None)
+    parser.add_argument("--data", type=Path, default=None, help="CSV of rows")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="per client")
+    parser.add_argument("--max-batch-size", type=int, nargs="+", default=[1, 64])
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    ns = parser.parse_args()
+
+    if ns.model_path and not ns.data:
+        parser.error("--data is required with --model-path")
+    if ns.model_path:
+        model = joblib.load(ns.model_path)
+        df = pd.read_csv(ns.data)
+    else:
+        model, df = _toy_model()
+
+    rows = []
+    for size in ns.max_batch_size:
+        res = run(model, df, ns.clients, ns.requests, size, ns.max_wait_ms)
+        rows.append({"max_batch_size": size, **res})
+    print(pd.DataFrame(rows).round(2).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
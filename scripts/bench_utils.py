@@ -0,0 +1,72 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+RAW_COLUMNS = [
+    "loan_id",
+    "no_of_dependents",
+    "education",
+    "self_employed",
+    "income_annum",
+    "loan_amount",
+    "loan_term",
+    "cibil_score",
+    "residential_assets_value",
+    "commercial_assets_value",
+    "luxury_assets_value",
+    "bank_asset_value",
+    "loan_status",
+]
+
+
+def loan_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """Return ``n`` synthetic rows following the Kaggle loan schema."""
+    rng = np.random.default_rng(seed)
+    income = rng.integers(200_000, 9_900_000, n)
+    cibil = rng.integers(300, 900, n)
+    approved = (cibil + rng.normal(0, 80, n)) > 550
+    return pd.DataFrame(
+        {
+            "loan_id": np.arange(1, n + 1),
+            "no_of_dependents": rng.integers(0, 6, n),
+            "education": rng.choice(["Graduate", "Not Graduate"], n),
+            "self_employed": rng.choice(["Yes", "No"], n),
+            "income_annum": income,
+            "loan_amount": (income * rng.uniform(0.5, 4.0, n)).astype(np.int64),
+            "loan_term": rng.integers(1, 11, n) * 2,
+            "cibil_score": cibil,
+            "residential_assets_value": rng.integers(0, 29_000_000, n),
+            "commercial_assets_value": rng.integers(0, 19_000_000, n),
+            "luxury_assets_value": rng.integers(300_000, 39_000_000, n),
+            "bank_asset_value": rng.integers(0, 14_000_000, n),
+            "loan_status": np.where(approved, "Approved", "Rejected"),
+        },
+        columns=RAW_COLUMNS,
+    )
+
+
+def best_time(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Return the best wall time (s) of ``repeat`` calls of ``fn``."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def measure(fn: Callable[[], object], repeat: int = 3) -> tuple[float, float]:
+    """Return best wall time (s) and peak traced memory (MiB) of ``fn``."""
+    best = best_time(fn, repeat)
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 2**20
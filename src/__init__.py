@@ -16,6 +16,7 @@ from .calibration import calibrate_model
 from .feature_importance import logreg_coefficients, tree_feature_importances
 from .manifest import write_manifest
 from .summary import dataset_summary
+from .scoring import ScoringModel
 
 __all__ = [
     "FeatureEngineer",
@@ -38,4 +39,5 @@ __all__ = [
     "tree_feature_importances",
     "write_manifest",
     "dataset_summary",
+    "ScoringModel",
 ]
@@ -9,6 +9,7 @@ from sklearn.base import ClassifierMixin
 import pandas as pd
 
 from .models import logreg
+from .scoring import unwrap
 
 
 def calibrate_model(
@@ -55,7 +56,7 @@ def main(args: list[str] | None = None) -> None:
         model_path = artefacts / f"{name}.joblib"
         if not model_path.exists():
             continue
-        est = joblib.load(model_path)
+        est = unwrap(joblib.load(model_path))
         cal = calibrate_model(est, X, y, ns.method)
         joblib.dump(cal, artefacts / f"{name}_calibrated.joblib")
         _plot_curve(cal, X, y, artefacts / f"{name}_calibration.png")
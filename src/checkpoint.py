@@ -0,0 +1,81 @@
+"""On-disk store of finished work units so long searches can resume.
+
+A :class:`ResultsStore` is a directory named by a hash of everything that
+determines the results (data, estimator, grid and splits). Each finished
+unit - one parameter group on one fold, or one outer fold of a nested CV -
+is written there as soon as it completes, so a run killed half-way and
+started again with the same inputs only computes what is missing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import joblib
+import pandas as pd
+
+__all__ = ["ResultsStore", "estimator_key", "frame_hash", "run_unit"]
+
+
+def frame_hash(obj: pd.DataFrame | pd.Series) -> str:
+    """Return a hash of the values, index, names and dtypes of ``obj``.
+
+    Unlike pickling, the result does not depend on pandas' internal caches,
+    so equal frames always hash alike.
+    """
+    frame = obj.to_frame() if isinstance(obj, pd.Series) else obj
+    h = hashlib.sha256(
+        repr([(str(c), str(t)) for c, t in frame.dtypes.items()]).encode()
+    )
+    h.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def estimator_key(estimator) -> dict:
+    """Return the parameters of ``estimator`` that affect its results.
+
+    Pipeline ``memory`` locations are left out because
+    :func:`~src.pipeline_helpers.fit_cache` picks a new directory every run.
+    """
+    params = estimator.get_params()
+    return {k: v for k, v in params.items() if k.rpartition("__")[2] != "memory"}
+
+
+class ResultsStore:
+    """Work units under ``root`` for one combination of ``key`` inputs."""
+
+    def __init__(self, root: str | Path, *key) -> None:
+        key = tuple(
+            frame_hash(k) if isinstance(k, (pd.DataFrame, pd.Series)) else k
+            for k in key
+        )
+        self.root = Path(root) / joblib.hash(key)
+
+    def __contains__(self, name: str) -> bool:
+        return (self.root / f"{name}.joblib").exists()
+
+    def get(self, name: str):
+        """Return the stored value of unit ``name``."""
+        return joblib.load(self.root / f"{name}.joblib")
+
+    def put(self, name: str, value):
+        """Write unit ``name`` atomically and return ``value``."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        os.close(fd)
+        joblib.dump(value, tmp)
+        os.replace(tmp, self.root / f"{name}.joblib")
+        return value
+
+    def names(self) -> list[str]:
+        """Return the names of the stored units, sorted."""
+        return sorted(p.stem for p in self.root.glob("*.joblib"))
+
+
+def run_unit(store: ResultsStore | None, name: str, fn, *args):
+    """Return ``fn(*args)``, saving it as unit ``name`` when ``store`` is set."""
+    value = fn(*args)
+    return value if store is None else store.put(name, value)
@@ -0,0 +1,119 @@
+"""One ``.npy`` file per column plus a JSON schema, loaded by memory map.
+
+Plain NumPy columns are saved as-is and come back as memory-mapped arrays,
+so loading costs a header read per column and processes opening the same
+store share its pages through the OS page cache. Categorical, string,
+nullable and other extension columns are stored as integer codes with their
+levels in the schema and rebuilt with the original dtype on load.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["save_columns", "load_columns", "store_size"]
+
+SCHEMA = "schema.json"
+
+
+def _plain(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype != object
+
+
+def _save_series(values: pd.Series | pd.Index, root: Path, stem: str) -> dict:
+    dtype = values.dtype
+    if _plain(dtype):
+        np.save(root / f"{stem}.npy", np.ascontiguousarray(values.to_numpy()))
+        return {"file": f"{stem}.npy", "kind": "array"}
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes, levels = values.cat.codes.to_numpy(), dtype.categories
+        ordered = bool(dtype.ordered)
+    else:
+        codes, levels = pd.factorize(values, use_na_sentinel=True)
+        ordered = False
+    np.save(root / f"{stem}.npy", codes.astype(np.int32))
+    return {
+        "file": f"{stem}.npy",
+        "kind": "codes",
+        "dtype": str(dtype),
+        "levels": pd.Index(levels).tolist(),
+        "ordered": ordered,
+    }
+
+
+def _load_series(meta: dict, root: Path, mmap_mode: str | None):
+    arr = np.load(root / meta["file"], mmap_mode=mmap_mode)
+    if meta["kind"] == "array":
+        # plain ndarray view; the memmap stays alive as its base
+        return arr.view(np.ndarray)
+    codes = np.asarray(arr)
+    if meta["dtype"] == "category":
+        return pd.Categorical.from_codes(
+            codes, categories=meta["levels"], ordered=meta["ordered"]
+        )
+    return pd.Categorical.from_codes(codes, categories=meta["levels"]).astype(
+        meta["dtype"]
+    )
+
+
+def save_columns(df: pd.DataFrame, path: str | Path) -> Path:
+    """Write ``df`` to directory ``path`` as per-column ``.npy`` files."""
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+    schema: dict = {"n_rows": len(df), "columns": []}
+    if isinstance(df.index, pd.RangeIndex):
+        idx = df.index
+        schema["index"] = {"range": [idx.start, idx.stop, idx.step]}
+    else:
+        schema["index"] = _save_series(df.index, root, "index")
+    schema["index"]["name"] = df.index.name
+    for i, (name, values) in enumerate(df.items()):
+        meta = _save_series(values, root, f"col_{i:04d}")
+        schema["columns"].append({"name": name, **meta})
+    (root / SCHEMA).write_text(json.dumps(schema, indent=1))
+    return root
+
+
+def load_columns(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    mmap_mode: str | None = "c",
+) -> pd.DataFrame:
+    """Return the frame saved in ``path``, reading only ``columns`` if given.
+
+    With the default ``mmap_mode="c"`` NumPy columns are copy-on-write memory
+    maps: nothing is read until used and writes stay private to the process.
+    Pass ``None`` to load everything into memory.
+    """
+    root = Path(path)
+    schema = json.loads((root / SCHEMA).read_text())
+    meta_idx = schema["index"]
+    if "range" in meta_idx:
+        index = pd.RangeIndex(*meta_idx["range"], name=meta_idx["name"])
+    else:
+        index = pd.Index(_load_series(meta_idx, root, None), name=meta_idx["name"])
+    metas = {m["name"]: m for m in schema["columns"]}
+    names = list(metas) if columns is None else list(columns)
+    missing = [c for c in names if c not in metas]
+    if missing:
+        raise KeyError(f"columns not in {root}: {missing}")
+    series = [
+        pd.Series(
+            _load_series(metas[c], root, mmap_mode), index=index, name=c, copy=False
+        )
+        for c in names
+    ]
+    if not series:
+        return pd.DataFrame(index=index)
+    # concat keeps one block per column, so memory maps are not copied
+    return pd.concat(series, axis=1)
+
+
+def store_size(path: str | Path) -> int:
+    """Return the total size in bytes of the files in store ``path``."""
+    return sum(p.stat().st_size for p in Path(path).iterdir() if p.is_file())
@@ -0,0 +1,200 @@
+"""Flat NumPy scoring plan exported from a fitted logistic-regression pipeline."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline as SkPipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from .scoring import unwrap
+
+__all__ = ["LogregPlan", "compile_logreg"]
+
+
+class LogregPlan:
+    """Score rows with arrays only: ``sigmoid(x_num @ w + b + cat lookups)``.
+
+    ``num_weight`` already folds the scaler in (``coef / scale``) and
+    ``intercept`` absorbs ``-mean * coef / scale``. Missing numeric values are
+    replaced by ``num_fill`` as the fitted imputer would. Each categorical
+    column maps a level to its one-hot coefficient; unseen levels add ``0``
+    like ``OneHotEncoder(handle_unknown="ignore")``.
+    """
+
+    def __init__(
+        self,
+        num_cols: Sequence[str],
+        num_weight: np.ndarray,
+        num_fill: np.ndarray,
+        cat_cols: Sequence[str],
+        cat_levels: Sequence[np.ndarray],
+        cat_weight: Sequence[np.ndarray],
+        intercept: float,
+        classes: np.ndarray,
+    ) -> None:
+        self.num_cols = list(num_cols)
+        self.num_weight = np.asarray(num_weight, dtype=float)
+        self.num_fill = np.asarray(num_fill, dtype=float)
+        self.cat_cols = list(cat_cols)
+        self.cat_levels = [np.asarray(lv, dtype=str) for lv in cat_levels]
+        self.cat_weight = [np.asarray(w, dtype=float) for w in cat_weight]
+        self.intercept = float(intercept)
+        self.classes_ = np.asarray(classes)
+        self._lookup = [
+            dict(zip(lv.tolist(), w.tolist()))
+            for lv, w in zip(self.cat_levels, self.cat_weight)
+        ]
+
+    def decision_function(self, rows) -> np.ndarray:
+        """Return the linear score for a dict, list of dicts or column batch."""
+        get = _column_getter(rows)
+        z = np.full(_n_rows(rows), self.intercept)
+        if self.num_cols:
+            x = np.column_stack([get(c).astype(float) for c in self.num_cols])
+            nan = np.isnan(x)
+            if nan.any():
+                x = np.where(nan, self.num_fill, x)
+            z += x @ self.num_weight
+        for col, lut in zip(self.cat_cols, self._lookup):
+            z += np.fromiter((lut.get(str(v), 0.0) for v in get(col)), float)
+        return z
+
+    def predict_proba(self, rows) -> np.ndarray:
+        p = 1.0 / (1.0 + np.exp(-self.decision_function(rows)))
+        return np.column_stack([1.0 - p, p])
+
+    def predict(self, rows) -> np.ndarray:
+        return self.classes_[(self.decision_function(rows) > 0).astype(int)]
+
+    def save(self, path: str | Path) -> Path:
+        """Write the plan as an ``.npz`` archive of plain arrays."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "num_weight": self.num_weight,
+            "num_fill": self.num_fill,
+            "intercept": np.array(self.intercept),
+            "classes": self.classes_,
+        }
+        for i, (lv, w) in enumerate(zip(self.cat_levels, self.cat_weight)):
+            arrays[f"cat_levels_{i}"] = lv
+            arrays[f"cat_weight_{i}"] = w
+        meta = {"num_cols": self.num_cols, "cat_cols": self.cat_cols}
+        np.savez(path, meta=np.array(json.dumps(meta)), **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LogregPlan":
+        with np.load(Path(path)) as data:
+            meta = json.loads(str(data["meta"]))
+            n_cat = len(meta["cat_cols"])
+            return cls(
+                meta["num_cols"],
+                data["num_weight"],
+                data["num_fill"],
+                meta["cat_cols"],
+                [data[f"cat_levels_{i}"] for i in range(n_cat)],
+                [data[f"cat_weight_{i}"] for i in range(n_cat)],
+                float(data["intercept"]),
+                data["classes"],
+            )
+
+
+def _n_rows(rows) -> int:
+    if isinstance(rows, Mapping):
+        first = next(iter(rows.values()), None)
+        return int(np.size(first)) if np.ndim(first) else 1
+    return len(rows)
+
+
+def _column_getter(rows):
+    if isinstance(rows, Mapping) or hasattr(rows, "columns"):
+        return lambda c: np.atleast_1d(np.asarray(rows[c]))
+    return lambda c: np.array([r[c] for r in rows])
+
+
+def _steps(trans) -> list:
+    if isinstance(trans, SkPipeline):
+        return [t for _, t in trans.steps if t not in (None, "passthrough")]
+    return [] if trans == "passthrough" else [trans]
+
+
+def compile_logreg(model) -> LogregPlan:
+    """Return a :class:`LogregPlan` equivalent to ``model.predict_proba``.
+
+    ``model`` is a fitted logistic-regression pipeline (or its
+    :class:`~src.scoring.ScoringModel` bundle) whose ``prep`` step is a
+    ``ColumnTransformer`` built from imputers, ``StandardScaler``,
+    ``OneHotEncoder`` and passthrough blocks.
+    """
+    pipe = unwrap(model)
+    prep = pipe.named_steps["prep"]
+    clf = pipe.named_steps["model"]
+    if not isinstance(clf, LogisticRegression) or clf.coef_.shape[0] != 1:
+        raise ValueError("compile_logreg needs a binary LogisticRegression model")
+    if not isinstance(prep, ColumnTransformer):
+        raise ValueError("compile_logreg needs a ColumnTransformer 'prep' step")
+    coef = clf.coef_.ravel()
+    intercept = float(clf.intercept_[0])
+
+    num_cols: list[str] = []
+    num_weight: list[float] = []
+    num_fill: list[float] = []
+    cat_cols: list[str] = []
+    cat_levels: list[np.ndarray] = []
+    cat_weight: list[np.ndarray] = []
+    offset = 0
+    for name, trans, cols in prep.transformers_:
+        if trans == "drop" or len(cols) == 0:
+            continue
+        cols = [prep.feature_names_in_[c] if isinstance(c, int) else c for c in cols]
+        steps = _steps(trans)
+        if steps and isinstance(steps[-1], OneHotEncoder):
+            enc = steps[-1]
+            if len(steps) > 1 or enc.drop_idx_ is not None:
+                raise ValueError(f"unsupported categorical block {name!r}")
+            for col, cats in zip(cols, enc.categories_):
+                end = offset + len(cats)
+                w = coef[offset:end]
+                cat_cols.append(col)
+                cat_levels.append(np.asarray([str(c) for c in cats]))
+                cat_weight.append(w.copy())
+                offset = end
+            continue
+        fill = np.full(len(cols), np.nan)
+        mean = np.zeros(len(cols))
+        scale = np.ones(len(cols))
+        for step in steps:
+            if isinstance(step, SimpleImputer):
+                fill = step.statistics_.astype(float)
+            elif isinstance(step, StandardScaler):
+                mean = step.mean_ if step.with_mean else mean
+                scale = step.scale_ if step.with_std else scale
+            else:
+                raise ValueError(f"unsupported step {type(step).__name__}")
+        end = offset + len(cols)
+        w = coef[offset:end] / scale
+        intercept -= float(mean @ w)
+        num_cols.extend(cols)
+        num_weight.extend(w)
+        num_fill.extend(fill)
+        offset = end
+    if offset != coef.size:
+        raise ValueError("prep output width does not match model coefficients")
+    return LogregPlan(
+        num_cols,
+        np.array(num_weight),
+        np.array(num_fill),
+        cat_cols,
+        cat_levels,
+        cat_weight,
+        intercept,
+        clf.classes_,
+    )
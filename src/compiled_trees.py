@@ -0,0 +1,213 @@
+"""Array-backed batch inference for decision trees, forests and boosting."""
+
+from __future__ import annotations
+
+import numpy as np
+from scipy.special import expit
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+from .scoring import unwrap
+
+__all__ = ["TreeEnsemblePlan", "compile_trees"]
+
+# cap on rows x trees node indices held at once during traversal
+_BLOCK_CELLS = 1 << 22
+
+
+class TreeEnsemblePlan:
+    """All trees of a fitted ensemble packed into contiguous node arrays.
+
+    Node ``i`` splits on ``feature[i]`` at ``threshold[i]`` and moves to
+    ``left[i]`` or ``right[i]`` (global indices). Leaves point to themselves
+    with an infinite threshold, so a batch of rows walks every tree at once
+    for ``max_depth`` vectorised steps. ``kind`` is ``"forest"`` (average of
+    per-tree class probabilities in ``value``) or ``"boosting"`` (``init`` plus
+    ``learning_rate`` times the leaf values, passed through the sigmoid).
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        missing_left: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        classes: np.ndarray,
+        init: float = 0.0,
+        learning_rate: float = 1.0,
+        prep=None,
+    ) -> None:
+        if kind not in {"forest", "boosting"}:
+            raise ValueError("kind must be forest or boosting")
+        self.kind = kind
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.max_depth = max_depth
+        self.classes_ = classes
+        self.init = init
+        self.learning_rate = learning_rate
+        self.prep = prep
+        self._leaf = left == np.arange(left.size)
+
+    @property
+    def n_trees(self) -> int:
+        return int(self.roots.size)
+
+    def _matrix(self, X) -> np.ndarray:
+        if self.prep is not None:
+            X = self.prep.transform(X)
+        if hasattr(X, "toarray"):
+            X = X.toarray()
+        return np.ascontiguousarray(X, dtype=np.float32)
+
+    def _walk(self, X: np.ndarray) -> np.ndarray:
+        n, n_trees = X.shape[0], self.n_trees
+        flat = X.ravel()
+        node = np.tile(self.roots, n)
+        base = np.repeat(np.arange(n, dtype=np.int64) * X.shape[1], n_trees)
+        has_nan = np.isnan(flat).any()
+        # only (row, tree) cells that have not reached a leaf are advanced
+        active = np.flatnonzero(~self._leaf[node])
+        while active.size:
+            nd = node[active]
+            x = flat[base[active] + self.feature[nd]]
+            go_left = x <= self.threshold[nd]
+            if has_nan:
+                go_left |= np.isnan(x) & self.missing_left[nd]
+            nxt = np.where(go_left, self.left[nd], self.right[nd])
+            node[active] = nxt
+            active = active[~self._leaf[nxt]]
+        return node.reshape(n, n_trees)
+
+    def _blocks(self, X):
+        X = self._matrix(X)
+        step = max(1, _BLOCK_CELLS // max(self.n_trees, 1))
+        n_blocks = max(1, -(-X.shape[0] // step))
+        for block in np.array_split(X, n_blocks):
+            yield self._walk(block)
+
+    def apply(self, X) -> np.ndarray:
+        """Return global leaf indices with shape ``(n_rows, n_trees)``."""
+        return np.concatenate(list(self._blocks(X)))
+
+    def predict_proba(self, X) -> np.ndarray:
+        # add trees one at a time in fit order so sums match sklearn bit for bit
+        out = []
+        for leaves in self._blocks(X):
+            leaves = np.ascontiguousarray(leaves.T)
+            if self.kind == "forest":
+                proba = np.zeros((leaves.shape[1], self.value.shape[1]))
+                for tree_leaves in leaves:
+                    proba += self.value[tree_leaves]
+                out.append(proba / self.n_trees)
+                continue
+            raw = np.full(leaves.shape[1], self.init)
+            for tree_leaves in leaves:
+                raw += self.learning_rate * self.value[tree_leaves]
+            p = expit(raw)
+            out.append(np.column_stack([1.0 - p, p]))
+        return np.concatenate(out)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[self.predict_proba(X).argmax(axis=1)]
+
+
+def _tree_arrays(tree, offset: int, dtype) -> tuple[np.ndarray, ...]:
+    n = tree.node_count
+    idx = np.arange(n, dtype=np.int32) + offset
+    leaf = tree.children_left == -1
+    feature = np.where(leaf, 0, tree.feature).astype(np.int32)
+    thr = tree.threshold.astype(np.float64)
+    if np.dtype(dtype) == np.float32:
+        # X is compared as float32, so rounding each threshold down to the
+        # nearest float32 keeps every ``x <= t`` decision unchanged
+        t32 = thr.astype(np.float32)
+        over = t32.astype(np.float64) > thr
+        t32[over] = np.nextafter(t32[over], np.float32(-np.inf))
+        thr = t32
+    thr = np.where(leaf, np.inf, thr).astype(dtype)
+    left = np.where(leaf, idx, tree.children_left + offset).astype(np.int32)
+    right = np.where(leaf, idx, tree.children_right + offset).astype(np.int32)
+    missing = getattr(tree, "missing_go_to_left", np.zeros(n, dtype=np.uint8))
+    return feature, thr, left, right, np.asarray(missing, dtype=bool)
+
+
+def _pack(trees: list, values: list[np.ndarray], dtype) -> dict:
+    parts, roots, offset = [], [], 0
+    for tree in trees:
+        parts.append(_tree_arrays(tree, offset, dtype))
+        roots.append(offset)
+        offset += tree.node_count
+    feature, thr, left, right, missing = (np.concatenate(p) for p in zip(*parts))
+    return {
+        "feature": feature,
+        "threshold": thr,
+        "left": left,
+        "right": right,
+        "missing_left": missing,
+        "value": np.concatenate(values),
+        "roots": np.asarray(roots, dtype=np.int32),
+        "max_depth": max(t.max_depth for t in trees),
+    }
+
+
+def _class_proba(tree) -> np.ndarray:
+    value = tree.value[:, 0, :]
+    norm = value.sum(axis=1)[:, None]
+    norm[norm == 0.0] = 1.0
+    return value / norm
+
+
+def compile_trees(model, threshold_dtype=np.float64) -> TreeEnsemblePlan:
+    """Return a :class:`TreeEnsemblePlan` matching ``model.predict_proba``.
+
+    ``model`` may be a fitted ``DecisionTreeClassifier``,
+    ``RandomForestClassifier`` or binary ``GradientBoostingClassifier``, or a
+    pipeline (or :class:`~src.scoring.ScoringModel`) ending in one; the
+    pipeline's ``prep`` step is kept to transform inputs. Pass
+    ``threshold_dtype=np.float32`` to halve threshold storage without changing
+    any split decision.
+    """
+    model = unwrap(model)
+    prep = None
+    if hasattr(model, "named_steps"):
+        prep = model.named_steps.get("prep")
+        model = model.named_steps["model"]
+
+    if isinstance(model, DecisionTreeClassifier):
+        trees = [model.tree_]
+    elif isinstance(model, RandomForestClassifier):
+        trees = [est.tree_ for est in model.estimators_]
+    elif isinstance(model, GradientBoostingClassifier):
+        if model.estimators_.shape[1] != 1:
+            raise ValueError("only binary gradient boosting is supported")
+        trees = [est.tree_ for est in model.estimators_[:, 0]]
+    else:
+        raise ValueError(f"unsupported model {type(model).__name__}")
+    if any(t.n_outputs != 1 for t in trees):
+        raise ValueError("multi-output trees are not supported")
+
+    if isinstance(model, GradientBoostingClassifier):
+        arrays = _pack(trees, [t.value[:, 0, 0] for t in trees], threshold_dtype)
+        n_features = model.n_features_in_
+        init = float(model._raw_predict_init(np.zeros((1, n_features)))[0, 0])
+        return TreeEnsemblePlan(
+            "boosting",
+            classes=model.classes_,
+            init=init,
+            learning_rate=float(model.learning_rate),
+            prep=prep,
+            **arrays,
+        )
+    arrays = _pack(trees, [_class_proba(t) for t in trees], threshold_dtype)
+    return TreeEnsemblePlan("forest", classes=model.classes_, prep=prep, **arrays)
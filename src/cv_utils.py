@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import time
+from pathlib import Path
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import clone
 from sklearn.compose import ColumnTransformer
+from sklearn.metrics import check_scoring
 from sklearn.model_selection import (
     GridSearchCV,
     RepeatedStratifiedKFold,
@@ -11,7 +18,16 @@ from sklearn.model_selection import (
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder
 
-__all__ = ["build_outer_iter", "nested_cv"]
+from .checkpoint import ResultsStore, estimator_key, run_unit
+
+__all__ = [
+    "Fold",
+    "FoldPlan",
+    "build_fold_plan",
+    "build_outer_iter",
+    "nested_cv",
+    "worker_budget",
+]
 
 
 def build_outer_iter(
@@ -44,12 +60,123 @@ def build_outer_iter(
     return splits
 
 
-def _build_pipeline(model, cat_cols: list[str], num_cols: list[str]) -> Pipeline:
-    pre = ColumnTransformer(
+def worker_budget(
+    n_jobs: int | None, n_outer: int, outer_jobs: int | None = None
+) -> tuple[int, int]:
+    """Split ``n_jobs`` workers into ``(outer, inner)`` counts.
+
+    ``outer * inner`` never exceeds the budget. ``n_jobs`` follows joblib
+    (``None`` is 1, ``-1`` all CPUs). Outer folds are the coarser, evenly
+    sized tasks, so they get the workers first unless ``outer_jobs`` caps
+    them; what is left goes to each inner grid search.
+    """
+    total = effective_n_jobs(n_jobs)
+    outer = min(total, n_outer, outer_jobs or total)
+    return outer, max(1, total // outer)
+
+
+class Fold(NamedTuple):
+    """One outer split with its encoder fitted on the training rows."""
+
+    prep: ColumnTransformer
+    X_train: np.ndarray
+    y_train: np.ndarray
+    X_test: np.ndarray
+    y_test: np.ndarray
+
+
+class FoldPlan(NamedTuple):
+    """Outer splits of ``X, y`` and the encoded matrices of every fold."""
+
+    X: pd.DataFrame
+    y: pd.Series
+    splits: list[tuple[np.ndarray, np.ndarray]]
+    folds: list[Fold]
+
+
+def _split_columns(X: pd.DataFrame) -> tuple[list[str], list[str]]:
+    cat_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
+    return cat_cols, [c for c in X.columns if c not in cat_cols]
+
+
+def _encoder(cat_cols: list[str]) -> ColumnTransformer:
+    return ColumnTransformer(
         [("cat", OneHotEncoder(handle_unknown="ignore"), cat_cols)],
         remainder="passthrough",
     )
-    return Pipeline([("prep", pre), ("model", model)])
+
+
+def _build_pipeline(model, cat_cols: list[str], num_cols: list[str]) -> Pipeline:
+    return Pipeline([("prep", _encoder(cat_cols)), ("model", model)])
+
+
+def _dense(a) -> np.ndarray:
+    return np.asarray(a.toarray() if hasattr(a, "toarray") else a, dtype=float)
+
+
+def build_fold_plan(
+    df: pd.DataFrame,
+    target: str,
+    *,
+    seed: int = 0,
+    n_splits: int = 3,
+    n_repeats: int = 2,
+    bootstrap_iters: int = 100,
+    mmap_dir: str | Path | None = None,
+) -> FoldPlan:
+    """Split ``df`` once and encode every outer fold for :func:`nested_cv`.
+
+    Each fold's one-hot encoder is fitted on its training rows and both
+    sides are stored as dense arrays, so every model of a run reuses the same
+    slices instead of re-splitting and re-encoding. With ``mmap_dir`` the
+    arrays are written there as ``.npy`` files and memory-mapped read-only.
+    """
+    X = df.drop(columns=[target])
+    y = df[target]
+    splits = build_outer_iter(
+        y,
+        n_splits=n_splits,
+        n_repeats=n_repeats,
+        bootstrap_iters=bootstrap_iters,
+        seed=seed,
+    )
+    cat_cols, _ = _split_columns(X)
+    y_arr = y.to_numpy()
+    folds = []
+    for i, (train, test) in enumerate(splits):
+        prep = _encoder(cat_cols)
+        arrays = {
+            "X_train": _dense(prep.fit_transform(X.iloc[train])),
+            "y_train": y_arr[train],
+            "X_test": _dense(prep.transform(X.iloc[test])),
+            "y_test": y_arr[test],
+        }
+        if mmap_dir is not None:
+            root = Path(mmap_dir)
+            root.mkdir(parents=True, exist_ok=True)
+            for name, arr in arrays.items():
+                np.save(root / f"fold_{i:03d}_{name}.npy", arr)
+                arrays[name] = np.load(root / f"fold_{i:03d}_{name}.npy", "r")
+        folds.append(Fold(prep, **arrays))
+    return FoldPlan(X, y, splits, folds)
+
+
+def _plan_fold(fold: Fold, model, grid: dict, inner, scorers: dict, n_jobs: int):
+    t0 = time.perf_counter()
+    gs = GridSearchCV(
+        Pipeline([("model", clone(model))]),
+        grid,
+        cv=inner,
+        scoring="roc_auc",
+        refit="roc_auc",
+        n_jobs=n_jobs,
+    )
+    gs.fit(fold.X_train, fold.y_train)
+    t1 = time.perf_counter()
+    scores = check_scoring(gs, scoring=scorers)(gs, fold.X_test, fold.y_test)
+    # the wrapped estimator scores raw rows like the unplanned pipeline
+    est = Pipeline([("prep", fold.prep), ("search", gs)])
+    return est, scores, t1 - t0, time.perf_counter() - t1
 
 
 def nested_cv(
@@ -63,16 +190,90 @@ def nested_cv(
     n_splits: int = 3,
     n_repeats: int = 2,
     bootstrap_iters: int = 100,
+    n_jobs: int | None = None,
+    outer_jobs: int | None = None,
+    plan: FoldPlan | None = None,
+    checkpoint: str | Path | None = None,
 ) -> tuple[dict, pd.DataFrame, pd.Series]:
-    """Run nested cross-validation with bootstrap fallback."""
-    X = df.drop(columns=[target])
-    y = df[target]
-    cat_cols = X.select_dtypes(include="object").columns.tolist()
-    num_cols = [c for c in X.columns if c not in cat_cols]
-    pipe = _build_pipeline(model, cat_cols, num_cols)
+    """Run nested cross-validation with bootstrap fallback.
+
+    Outer folds run in parallel and each inner grid search gets the rest of
+    the ``n_jobs`` budget (see :func:`worker_budget`). Splits are fixed up
+    front and a model without a ``random_state`` is given ``seed``, so fold
+    results do not depend on the number of workers.
+
+    ``plan`` is a :func:`build_fold_plan` of ``df`` and ``target``. Its
+    splits and encoded fold matrices are used instead of splitting and
+    encoding again; the inner grid search then fits the model alone on the
+    outer fold's encoding. Each returned estimator is a pipeline of that
+    encoder and the fitted search, so it still takes raw rows.
+
+    With ``checkpoint`` (a directory) each outer fold's fitted search and
+    scores are saved as the fold finishes, and a rerun on the same data,
+    model, grid and splits loads them instead of refitting. A fold plan is
+    built when none is given.
+    """
+    if model.get_params().get("random_state", 0) is None:
+        model = clone(model).set_params(random_state=seed)
     inner = RepeatedStratifiedKFold(
         n_splits=n_splits, n_repeats=n_repeats, random_state=seed
     )
+    if checkpoint is not None and plan is None:
+        plan = build_fold_plan(
+            df,
+            target,
+            seed=seed,
+            n_splits=n_splits,
+            n_repeats=n_repeats,
+            bootstrap_iters=bootstrap_iters,
+        )
+    if plan is not None:
+        store = None
+        if checkpoint is not None:
+            store = ResultsStore(
+                checkpoint,
+                "nested_cv",
+                estimator_key(model),
+                grid,
+                scorers,
+                (seed, n_splits, n_repeats),
+                plan.X,
+                plan.y,
+                plan.splits,
+            )
+        names = [f"fold_{i:03d}" for i in range(len(plan.folds))]
+        done = {n: store.get(n) for n in names if store is not None and n in store}
+        todo = [i for i, n in enumerate(names) if n not in done]
+        n_outer, n_inner = worker_budget(n_jobs, max(len(todo), 1), outer_jobs)
+        computed = Parallel(n_jobs=n_outer)(
+            delayed(run_unit)(
+                store,
+                names[i],
+                _plan_fold,
+                plan.folds[i],
+                model,
+                grid,
+                inner,
+                scorers,
+                n_inner,
+            )
+            for i in todo
+        )
+        done.update(zip((names[i] for i in todo), computed))
+        out = [done[n] for n in names]
+        res = {
+            "fit_time": np.array([o[2] for o in out]),
+            "score_time": np.array([o[3] for o in out]),
+            "estimator": [o[0] for o in out],
+        }
+        for name in scorers:
+            res[f"test_{name}"] = np.array([o[1][name] for o in out])
+        return res, plan.X, plan.y
+
+    X = df.drop(columns=[target])
+    y = df[target]
+    cat_cols, num_cols = _split_columns(X)
+    pipe = _build_pipeline(model, cat_cols, num_cols)
     outer = build_outer_iter(
         y,
         n_splits=n_splits,
@@ -80,6 +281,17 @@ def nested_cv(
         bootstrap_iters=bootstrap_iters,
         seed=seed,
     )
-    gs = GridSearchCV(pipe, grid, cv=inner, scoring="roc_auc", refit="roc_auc")
-    res = cross_validate(gs, X, y, cv=outer, scoring=scorers, return_estimator=True)
+    n_outer, n_inner = worker_budget(n_jobs, len(outer), outer_jobs)
+    gs = GridSearchCV(
+        pipe, grid, cv=inner, scoring="roc_auc", refit="roc_auc", n_jobs=n_inner
+    )
+    res = cross_validate(
+        gs,
+        X,
+        y,
+        cv=outer,
+        scoring=scorers,
+        return_estimator=True,
+        n_jobs=n_outer,
+    )
     return res, X, y
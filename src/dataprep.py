@@ -3,20 +3,97 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+from .tabular_io import ChunkWriter, infer_format, iter_table, read_table, write_table
 
 CSV_PATH = Path("data/raw/loan_approval_dataset.csv")
 
+# column dtypes of the Kaggle loan CSV (header names after ``str.strip``);
+# integer widths leave room for the sums and squares in ``FeatureEngineer``
+LOAN_SCHEMA = {
+    "loan_id": "int32",
+    "no_of_dependents": "int8",
+    "education": "category",
+    "self_employed": "category",
+    "income_annum": "int32",
+    "loan_amount": "int32",
+    "loan_term": "int16",
+    "cibil_score": "int32",
+    "residential_assets_value": "int32",
+    "commercial_assets_value": "int32",
+    "luxury_assets_value": "int32",
+    "bank_asset_value": "int32",
+    "loan_status": "category",
+}
+
+
+def load_raw(
+    path: str | Path = CSV_PATH,
+    columns: Sequence[str] | None = None,
+    fmt: str | None = None,
+) -> pd.DataFrame:
+    """Return the raw dataset as a ``DataFrame``.
+
+    CSV, Parquet and Arrow IPC files are accepted; the format follows the
+    file extension unless ``fmt`` is given. ``columns`` limits the read to
+    those columns.
+    """
+    return read_table(path, columns, fmt)
 
-def load_raw(path: str | Path = CSV_PATH) -> pd.DataFrame:
-    """Return the raw dataset as a ``DataFrame``."""
-    return pd.read_csv(path)
+
+def load_typed(
+    path: str | Path = CSV_PATH,
+    columns: Sequence[str] | None = None,
+    engine: str = "c",
+    arrow_dtypes: bool = False,
+) -> pd.DataFrame:
+    """Return the loan CSV parsed with :data:`LOAN_SCHEMA` dtypes.
+
+    Only ``columns`` (names as in the schema, surrounding whitespace ignored)
+    are parsed. ``engine="pyarrow"`` uses the multithreaded Arrow parser and
+    ``arrow_dtypes=True`` returns Arrow-backed columns. Integer columns that
+    contain missing or fractional values are read as ``float64`` instead.
+    Columns outside the schema keep inferred dtypes.
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    names = {str(c).strip(): c for c in header}
+    if columns is not None:
+        unknown = [c for c in columns if c not in names]
+        if unknown:
+            raise KeyError(f"columns not in {path}: {unknown}")
+        names = {c: names[c] for c in columns}
+    dtype = {names[c]: t for c, t in LOAN_SCHEMA.items() if c in names}
+    kwargs = {"usecols": list(names.values()), "engine": engine}
+    if arrow_dtypes:
+        kwargs["dtype_backend"] = "pyarrow"
+    try:
+        return pd.read_csv(path, dtype=dtype, **kwargs)
+    except ValueError:
+        # integer columns cannot hold NaN or fractions: parse them as float
+        # and narrow back the ones with only whole values
+        ints = {c: t for c, t in dtype.items() if t.startswith("int")}
+        df = pd.read_csv(
+            path, dtype={**dtype, **dict.fromkeys(ints, "float64")}, **kwargs
+        )
+        whole = {c: t for c, t in ints.items() if (df[c] % 1 == 0).all()}
+        return df.astype(whole)
 
 
-def clean(df: pd.DataFrame) -> pd.DataFrame:
-    """Basic cleaning: drop duplicates/NA and normalise target column."""
-    df = df.drop_duplicates().dropna().copy()
+def clean(df: pd.DataFrame, drop_rows: bool = True) -> pd.DataFrame:
+    """Basic cleaning: drop duplicates/NA and normalise target column.
+
+    With ``drop_rows=False`` only the column and target normalisation is
+    applied on a shallow copy, keeping one output row per input row as
+    scoring requires.
+    """
+    if drop_rows:
+        df = df.drop_duplicates().dropna()
+    df = df.copy(deep=drop_rows)
     df.columns = df.columns.str.strip()
 
     if "loan_status" in df.columns and "Loan_Status" not in df.columns:
@@ -35,3 +112,143 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
         )
 
     return df
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Return a 64-bit hash per row of ``df`` (index ignored).
+
+    Numeric columns are hashed as float64, so equal rows hash alike even when
+    separately parsed blocks inferred ``int`` in one and ``float`` in another.
+    """
+    numeric = df.select_dtypes("number").columns
+    canon = df.astype(dict.fromkeys(numeric, "float64")) if len(numeric) else df
+    return pd.util.hash_pandas_object(canon, index=False).to_numpy()
+
+
+def downcast(
+    df: pd.DataFrame, columns: Sequence[str] | None = None, max_levels: float = 0.5
+) -> pd.DataFrame:
+    """Return ``df`` with ``columns`` (default all) stored in compact dtypes.
+
+    Floats become float32, integers the narrowest integer type that holds
+    their values, booleans uint8, and string columns whose distinct values
+    number at most ``max_levels`` times the row count become ``category``.
+    Nullable extension and categorical columns are left unchanged.
+
+    Apply it to model-ready frames: narrowed integers overflow silently in
+    later arithmetic (``FeatureEngineer`` squares and subtracts raw columns).
+    Integer widths follow the values in ``df``, so separately downcast chunks
+    may differ in width; ``pd.concat`` widens them again.
+    """
+    out = {}
+    for col in df.columns if columns is None else columns:
+        s = df[col]
+        if is_bool_dtype(s.dtype) and isinstance(s.dtype, np.dtype):
+            out[col] = s.astype(np.uint8)
+        elif s.dtype.kind == "f" and isinstance(s.dtype, np.dtype):
+            out[col] = s.astype(np.float32)
+        elif s.dtype.kind in "iu" and isinstance(s.dtype, np.dtype) and len(s):
+            unsigned = s.min() >= 0
+            out[col] = pd.to_numeric(s, downcast="unsigned" if unsigned else "integer")
+        elif s.dtype == object or pd.api.types.is_string_dtype(s.dtype):
+            if not isinstance(s.dtype, pd.CategoricalDtype) and s.nunique() <= max(
+                1, max_levels * len(s)
+            ):
+                out[col] = s.astype("category")
+    return df.assign(**out) if out else df
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Return dtype and deep byte size per column of ``before`` and ``after``.
+
+    Columns are those of ``after``; a final ``"total"`` row sums the bytes.
+    """
+    cols = list(after.columns)
+    b = before[cols].memory_usage(deep=True, index=False)
+    a = after.memory_usage(deep=True, index=False)
+    report = pd.DataFrame(
+        {
+            "dtype_before": before[cols].dtypes.astype(str),
+            "dtype_after": after.dtypes.astype(str),
+            "bytes_before": b,
+            "bytes_after": a,
+            "bytes_saved": b - a,
+        }
+    )
+    report.loc["total"] = ["", "", b.sum(), a.sum(), b.sum() - a.sum()]
+    return report
+
+
+def _union_dtype(a, b):
+    if a == b:
+        return a
+    if is_numeric_dtype(a) and is_numeric_dtype(b):
+        if not (is_bool_dtype(a) or is_bool_dtype(b)):
+            return np.result_type(a, b)
+    return np.dtype(object)
+
+
+def _csv_dtypes(path: str | Path, chunk_size: int) -> dict:
+    """Return the dtypes ``pd.read_csv`` would infer for the whole file."""
+    dtypes: dict = {}
+    all_na: dict = {}
+    for chunk in iter_table(path, chunk_size, fmt="csv"):
+        for col, dtype in chunk.dtypes.items():
+            empty = bool(chunk[col].isna().all())
+            if col not in dtypes or (all_na[col] and not empty):
+                dtypes[col], all_na[col] = dtype, empty
+            elif not empty:
+                dtypes[col] = _union_dtype(dtypes[col], dtype)
+    return dtypes
+
+
+def clean_chunked(
+    path: str | Path,
+    out: str | Path,
+    chunk_size: int = 100_000,
+    fmt: str | None = None,
+    out_fmt: str | None = None,
+    dtype: dict | None = None,
+) -> dict:
+    """Apply :func:`clean` to a file too large for memory, writing to ``out``.
+
+    Rows are read ``chunk_size`` at a time. NA rows are dropped per chunk and
+    duplicates are found across chunks with a sorted array of 64-bit row
+    hashes (8 bytes per kept row); the target mapping is applied per chunk
+    and each cleaned chunk is appended to ``out`` (Parquet, Arrow or CSV by
+    extension). Unless ``dtype`` is given, CSV input is scanned once
+    beforehand so every chunk parses with the dtypes a full read would
+    infer. The written rows equal
+    ``clean(load_raw(path))`` with a fresh index, up to 64-bit hash
+    collisions. Returns row counts.
+    """
+    if dtype is None and infer_format(path, fmt) == "csv":
+        dtype = _csv_dtypes(path, chunk_size)
+    seen = np.empty(0, dtype=np.uint64)
+    stats = {"rows_in": 0, "na_rows": 0, "duplicates": 0, "rows_out": 0}
+    last = None
+    with ChunkWriter(out, out_fmt) as writer:
+        for chunk in iter_table(path, chunk_size, fmt=fmt, dtype=dtype):
+            stats["rows_in"] += len(chunk)
+            # dropping NA rows before de-duplicating keeps the same survivors
+            # and leaves fewer hashes to remember
+            n_read = len(chunk)
+            chunk = chunk.dropna()
+            stats["na_rows"] += n_read - len(chunk)
+            hashes = row_hashes(chunk)
+            known = np.zeros(hashes.size, dtype=bool)
+            if seen.size:
+                pos = np.minimum(np.searchsorted(seen, hashes), seen.size - 1)
+                known = seen[pos] == hashes
+            keep = ~known & ~pd.Series(hashes).duplicated().to_numpy()
+            stats["duplicates"] += int((~keep).sum())
+            # kept hashes are new and distinct: sort only them and merge them
+            # into ``seen`` in one linear pass instead of re-sorting it
+            new = np.sort(hashes[keep])
+            seen = np.insert(seen, np.searchsorted(seen, new), new)
+            last = clean(chunk[keep], drop_rows=False)
+            writer.write(last)
+            stats["rows_out"] += len(last)
+    if last is None:
+        write_table(clean(read_table(path, fmt=fmt), drop_rows=False), out, out_fmt)
+    return stats
@@ -11,7 +11,9 @@ from sklearn.svm import SVC
 from sklearn.tree import DecisionTreeClassifier
 
 from . import dataprep
-from .cv_utils import nested_cv
+from .checkpoint import frame_hash
+from .cv_utils import build_fold_plan, nested_cv
+from .experiments import ExperimentStore, default_db
 from .fairness import (
     equal_opportunity_ratio,
     equalized_odds_diff,
@@ -76,12 +78,22 @@ def evaluate_models(
     csv_path: Path = Path("artefacts/summary_metrics.csv"),
     threshold: float | None = None,
     models: list[str] | None = None,
+    n_jobs: int | None = None,
+    checkpoint: str | Path | None = None,
+    results_db: str | Path | None = None,
 ) -> pd.DataFrame:
     """Return nested-CV metrics and write ``csv_path``.
 
     ``threshold`` sets the probability cutoff used for group metrics. When it
     is ``None`` the Youden J statistic is used instead. ``models`` selects which
-    pipelines to run.
+    pipelines to run. ``n_jobs`` is the worker budget shared by the outer
+    folds and inner grid searches of :func:`~src.cv_utils.nested_cv`; it
+    follows joblib, so the default ``None`` runs serially and ``-1`` uses
+    every CPU. ``checkpoint`` is a directory where finished outer folds are saved so
+    an interrupted run resumes where it stopped. With ``results_db`` each
+    model's per-fold results are looked up in that
+    :class:`~src.experiments.ExperimentStore` first and only models without
+    a stored run for the same data, grid, seed and CV settings are fitted.
     """
     df = dataprep.clean(df)
 
@@ -109,20 +121,34 @@ def evaluate_models(
     }
 
     selected = models or list(all_models.keys())
+    cv_config = {"n_splits": 3, "n_repeats": 2, "bootstrap_iters": 100}
+    store = ExperimentStore(results_db) if results_db else None
+    digest = frame_hash(df) if store else ""
+    X, y = df.drop(columns=[target]), df[target]
+    plan = None
     rows = []
     for name in selected:
         model, grid = all_models[name]
-        res, X, y = nested_cv(
-            df,
-            target,
-            model,
-            grid,
-            SCORERS,
-            seed=0,
-            n_splits=3,
-            n_repeats=2,
-            bootstrap_iters=100,
-        )
+        key = ExperimentStore.key(digest, name, grid, 0, cv_config)
+        res = store.get(key) if store else None
+        if res is None:
+            if plan is None:
+                # split and encode the outer folds once; every model reuses them
+                plan = build_fold_plan(df, target, seed=0, **cv_config)
+            res, X, y = nested_cv(
+                df,
+                target,
+                model,
+                grid,
+                SCORERS,
+                seed=0,
+                **cv_config,
+                n_jobs=n_jobs,
+                plan=plan,
+                checkpoint=checkpoint,
+            )
+            if store:
+                store.put(key, res)
         rows.append(
             {
                 "model": name,
@@ -171,13 +197,45 @@ def main(args: list[str] | None = None) -> None:
         default=None,
         help="models to evaluate (default: all)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=-1,
+        help="worker processes for nested CV (-1 for all CPUs)",
+    )
+    parser.add_argument(
+        "--results-db",
+        type=Path,
+        default=default_db(),
+        help="SQLite store of nested-CV results reused when nothing changed "
+        "(default: MLCLS_EXPERIMENTS or .cache/experiments.sqlite)",
+    )
+    parser.add_argument(
+        "--no-results-db",
+        dest="results_db",
+        action="store_const",
+        const=None,
+        help="always rerun nested CV",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        help="directory saving finished outer folds so a rerun resumes",
+    )
     ns = parser.parse_args(args)
 
-    from . import dataprep
+    from .feature_cache import load_cleaned
 
-    df = dataprep.clean(dataprep.load_raw())
+    df = load_cleaned(dataprep.CSV_PATH)
     metrics = evaluate_models(
-        df, group_col=ns.group_col, threshold=ns.threshold, models=ns.models
+        df,
+        group_col=ns.group_col,
+        threshold=ns.threshold,
+        models=ns.models,
+        n_jobs=ns.jobs,
+        checkpoint=ns.checkpoint,
+        results_db=ns.results_db,
     )
     print(metrics)
 
@@ -0,0 +1,183 @@
+"""SQLite store of nested-CV results so unchanged evaluations are skipped.
+
+:func:`~src.evaluate.evaluate_models` looks every model up by a key built
+from the data hash, model name, parameter grid, seed, CV configuration and
+the version of the evaluation code (plus scikit-learn's). A hit returns the
+stored per-fold scores and fit/score times without fitting anything; only
+missing models are cross-validated and then recorded.
+
+Two tables hold the results::
+
+    runs   key, model, data_hash, code_version, grid, seed, cv, created,
+           estimator (first outer fold's fitted search, joblib-pickled)
+    folds  key, fold, metric, value  (test_<scorer>, fit_time, score_time)
+
+``MLCLS_EXPERIMENTS`` sets the database path used by ``mlcls-eval`` (empty
+or ``0`` disables the store).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import io
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+__all__ = ["DB_PATH", "ExperimentStore", "code_version", "default_db"]
+
+DB_PATH = Path(".cache/experiments.sqlite")
+
+# every module whose code can change a stored nested-CV result
+_CODE_FILES = (
+    "checkpoint.py",
+    "cv_utils.py",
+    "dataprep.py",
+    "evaluate.py",
+    "fairness.py",
+    "pipeline_helpers.py",
+    "preprocessing.py",
+    "staged_search.py",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    code_version TEXT NOT NULL,
+    grid TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    cv TEXT NOT NULL,
+    created TEXT NOT NULL,
+    estimator BLOB
+);
+CREATE TABLE IF NOT EXISTS folds (
+    key TEXT NOT NULL REFERENCES runs(key) ON DELETE CASCADE,
+    fold INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (key, fold, metric)
+);
+"""
+
+
+def default_db() -> Path | None:
+    """Return the database path from ``MLCLS_EXPERIMENTS`` or :data:`DB_PATH`."""
+    path = os.environ.get("MLCLS_EXPERIMENTS", DB_PATH)
+    return None if str(path) in {"", "0"} else Path(path)
+
+
+def code_version() -> str:
+    """Return a short digest of the evaluation code and scikit-learn version."""
+    h = hashlib.sha256(sklearn.__version__.encode())
+    here = Path(__file__).parent
+    for name in _CODE_FILES:
+        h.update((here / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _json(obj) -> str:
+    return json.dumps(obj, sort_keys=True, default=repr)
+
+
+class ExperimentStore:
+    """Nested-CV results in the SQLite database at ``path``."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as con:
+            con.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        con = sqlite3.connect(self.path)
+        try:
+            con.execute("PRAGMA foreign_keys = ON")
+            # commits on success and rolls back on error
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    @staticmethod
+    def key(
+        data_hash: str, model: str, grid: dict, seed: int, cv: dict
+    ) -> dict[str, object]:
+        """Return the run key fields and their digest under ``"key"``.
+
+        ``data_hash`` is :func:`~src.checkpoint.frame_hash` of the evaluated
+        frame.
+        """
+        fields = {
+            "model": model,
+            "data_hash": data_hash,
+            "code_version": code_version(),
+            "grid": _json(grid),
+            "seed": seed,
+            "cv": _json(cv),
+        }
+        fields["key"] = hashlib.sha256(_json(fields).encode()).hexdigest()
+        return fields
+
+    def get(self, key: dict) -> dict | None:
+        """Return the stored ``cross_validate``-style result for ``key``.
+
+        ``estimator`` holds only the first outer fold's fitted search.
+        """
+        with self._connect() as con:
+            run = con.execute(
+                "SELECT estimator FROM runs WHERE key = ?", (key["key"],)
+            ).fetchone()
+            if run is None:
+                return None
+            rows = con.execute(
+                "SELECT fold, metric, value FROM folds WHERE key = ?", (key["key"],)
+            ).fetchall()
+        table = pd.DataFrame(rows, columns=["fold", "metric", "value"]).pivot(
+            index="fold", columns="metric", values="value"
+        )
+        res: dict = {m: table[m].to_numpy() for m in table.columns}
+        res["estimator"] = [joblib.load(io.BytesIO(run[0]))]
+        return res
+
+    def put(self, key: dict, res: dict) -> None:
+        """Record the nested-CV result ``res`` of ``key``, replacing any."""
+        buf = io.BytesIO()
+        joblib.dump(res["estimator"][0], buf)
+        metrics = [m for m in res if m != "estimator"]
+        folds = [
+            (key["key"], i, m, float(v))
+            for m in metrics
+            for i, v in enumerate(np.asarray(res[m]))
+        ]
+        run = dict(key)
+        run["created"] = dt.datetime.now(dt.timezone.utc).isoformat()
+        run["estimator"] = buf.getvalue()
+        with self._connect() as con:
+            con.execute("DELETE FROM runs WHERE key = ?", (key["key"],))
+            con.execute(
+                f"INSERT INTO runs ({', '.join(run)}) "
+                f"VALUES ({', '.join('?' * len(run))})",
+                tuple(run.values()),
+            )
+            con.executemany("INSERT INTO folds VALUES (?, ?, ?, ?)", folds)
+
+    def runs(self) -> pd.DataFrame:
+        """Return one row per stored run without the pickled estimators."""
+        with self._connect() as con:
+            return pd.read_sql_query(
+                "SELECT key, model, data_hash, code_version, grid, seed, cv, created "
+                "FROM runs ORDER BY created",
+                con,
+            )
@@ -0,0 +1,197 @@
+"""Content-addressed cache of cleaned and engineered loan frames.
+
+Entries are keyed by the SHA-256 of the raw data file and of the feature
+code (:mod:`src.dataprep`, :mod:`src.features` and :mod:`src.feature_graph`),
+so editing any of them invalidates old entries automatically. Each entry is a
+:mod:`~src.column_store` directory (one ``.npy`` per column) loaded by memory
+map, so concurrent training and evaluation processes share its pages. The
+least recently used entries are evicted once the cache exceeds its size cap.
+
+``MLCLS_FEATURE_CACHE`` sets the cache directory (empty or ``0`` disables
+caching) and ``MLCLS_FEATURE_CACHE_MB`` the size cap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from .column_store import load_columns, save_columns, store_size
+from .dataprep import clean, load_raw, load_typed
+from .tabular_io import infer_format
+from .features import FeatureEngineer
+from .manifest import sha256
+
+__all__ = [
+    "CACHE_DIR",
+    "MAX_BYTES",
+    "code_version",
+    "cache_key",
+    "load_features",
+    "load_cleaned",
+    "evict",
+    "clear_cache",
+]
+
+CACHE_DIR = Path(".cache/features")
+MAX_BYTES = 2 * 2**30
+
+_CODE_FILES = ("dataprep.py", "features.py", "feature_graph.py")
+_SUFFIX = ".cols"
+
+
+def _cache_dir(cache_dir: str | Path | None) -> Path | None:
+    if cache_dir is None:
+        cache_dir = os.environ.get("MLCLS_FEATURE_CACHE", CACHE_DIR)
+    return None if str(cache_dir) in {"", "0"} else Path(cache_dir)
+
+
+def _default_max_bytes() -> int:
+    env = os.environ.get("MLCLS_FEATURE_CACHE_MB")
+    return int(float(env) * 2**20) if env else MAX_BYTES
+
+
+def code_version() -> str:
+    """Return a short digest of the cleaning and feature-engineering code."""
+    h = hashlib.sha256()
+    here = Path(__file__).parent
+    for name in _CODE_FILES:
+        h.update((here / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def cache_key(path: str | Path) -> str:
+    """Return the cache key for raw data at ``path``."""
+    return f"{sha256(path)}-{code_version()}"
+
+
+def _entries(cache_dir: Path) -> list[Path]:
+    return [p for p in cache_dir.glob(f"*{_SUFFIX}") if p.is_dir()]
+
+
+def _write(df: pd.DataFrame, cache_dir: Path, name: str) -> Path:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=cache_dir, suffix=".tmp"))
+    entry = cache_dir / name
+    try:
+        save_columns(df, tmp)
+        # atomic rename so concurrent readers never see a partial entry
+        os.replace(tmp, entry)
+    except OSError:
+        if not entry.exists():
+            raise
+        # another process stored the same entry first
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return entry
+
+
+def evict(cache_dir: str | Path, max_bytes: int) -> list[Path]:
+    """Delete least recently used entries until the cache fits ``max_bytes``.
+
+    Returns the removed paths.
+    """
+    entries = sorted(_entries(Path(cache_dir)), key=lambda p: p.stat().st_mtime)
+    sizes = {p: store_size(p) for p in entries}
+    total = sum(sizes.values())
+    removed = []
+    while entries and total > max_bytes:
+        entry = entries.pop(0)
+        total -= sizes[entry]
+        shutil.rmtree(entry)
+        removed.append(entry)
+    return removed
+
+
+def clear_cache(cache_dir: str | Path | None = None) -> int:
+    """Remove every cache entry and return how many were deleted."""
+    cache_dir = _cache_dir(cache_dir)
+    if cache_dir is None or not cache_dir.exists():
+        return 0
+    entries = _entries(cache_dir)
+    for entry in entries:
+        shutil.rmtree(entry)
+    return len(entries)
+
+
+def _cached(
+    path: str | Path,
+    stage: str,
+    build: Callable[[], pd.DataFrame],
+    cache_dir: str | Path | None,
+    max_bytes: int | None,
+) -> pd.DataFrame:
+    cache_dir = _cache_dir(cache_dir)
+    if cache_dir is None:
+        return build()
+    name = f"{cache_key(path)}-{stage}{_SUFFIX}"
+    entry = cache_dir / name
+    if entry.exists():
+        os.utime(entry)
+        return load_columns(entry)
+    df = build()
+    _write(df, cache_dir, name)
+    evict(cache_dir, _default_max_bytes() if max_bytes is None else max_bytes)
+    return df
+
+
+def load_features(
+    path: str | Path,
+    cache_dir: str | Path | None = None,
+    max_bytes: int | None = None,
+) -> pd.DataFrame:
+    """Return ``FeatureEngineer().transform(clean(load_raw(path)))``.
+
+    CSV files are parsed with :func:`~src.dataprep.load_typed`, so schema
+    columns arrive in their compact :data:`~src.dataprep.LOAN_SCHEMA` dtypes.
+
+    The result is served from ``cache_dir`` (default ``MLCLS_FEATURE_CACHE``
+    or ``.cache/features``) when an entry for the same raw bytes and feature
+    code exists; otherwise it is computed, stored and the cache trimmed to
+    ``max_bytes``. ``cache_dir=""`` bypasses the cache.
+
+    A directory ``path`` is treated as a set of raw partitions and served by
+    :func:`src.ingest.load_directory`, which only processes new files.
+    """
+    if Path(path).is_dir():
+        from .ingest import load_directory
+
+        return load_directory(path)
+    return _cached(
+        path,
+        "features",
+        lambda: FeatureEngineer(preallocate=True).transform(clean(_read(path))),
+        cache_dir,
+        max_bytes,
+    )
+
+
+def load_cleaned(
+    path: str | Path,
+    cache_dir: str | Path | None = None,
+    max_bytes: int | None = None,
+) -> pd.DataFrame:
+    """Return ``clean(load_raw(path))`` through the same cache.
+
+    CSV files are parsed with :func:`~src.dataprep.load_typed` as in
+    :func:`load_features`.
+
+    A directory ``path`` is served by :func:`src.ingest.load_directory_cleaned`,
+    row-aligned with :func:`load_features` of the same directory.
+    """
+    if Path(path).is_dir():
+        from .ingest import load_directory_cleaned
+
+        return load_directory_cleaned(path)
+    return _cached(path, "clean", lambda: clean(_read(path)), cache_dir, max_bytes)
+
+
+def _read(path: str | Path) -> pd.DataFrame:
+    """Return raw ``path``, typed by :data:`~src.dataprep.LOAN_SCHEMA` if CSV."""
+    return load_typed(path) if infer_format(path) == "csv" else load_raw(path)
@@ -0,0 +1,305 @@
+"""Engineered loan features as a graph of named formulas.
+
+Every engineered column is a :class:`FeatureNode` with explicit inputs, and
+:data:`NODES` is the only place the formulas are written down:
+:meth:`FeatureEngineer.transform <src.features.FeatureEngineer.transform>`
+evaluates all of them. :func:`plan` resolves the nodes a set of output
+columns needs and :func:`transform_columns` evaluates only those, so a model
+fitted on a pruned feature set (e.g. after :func:`~src.selection.vif_prune`)
+does not pay for the full transform at scoring time. Values match
+``FeatureEngineer.transform(df)[columns]``.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import TYPE_CHECKING, Callable, Iterable, NamedTuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+if TYPE_CHECKING:
+    from .features import FeatureEngineer
+
+__all__ = [
+    "ASSET_COLS",
+    "MARKET_APR",
+    "FeatureNode",
+    "NODES",
+    "plan",
+    "transform_columns",
+]
+
+MARKET_APR = 0.090
+ASSET_COLS = [
+    "residential_assets_value",
+    "commercial_assets_value",
+    "luxury_assets_value",
+    "bank_asset_value",
+]
+
+_CIBIL = CategoricalDtype(
+    ["poor", "fair", "good", "verygood", "excellent"], ordered=True
+)
+
+
+class FeatureNode(NamedTuple):
+    """Engineered column ``name`` computed by ``fn`` from ``inputs``."""
+
+    name: str
+    inputs: tuple[str, ...]
+    fn: Callable[["_Env"], pd.Series]
+
+
+class _Env:
+    """Demand-driven column store over one standardised raw frame."""
+
+    def __init__(self, fe: FeatureEngineer, raw: pd.DataFrame) -> None:
+        self.fe = fe
+        self.raw = raw
+        self.values: dict[str, pd.Series] = {}
+        self._medians = None
+
+    def __getitem__(self, name: str) -> pd.Series:
+        if name not in self.values:
+            if name in NODES:
+                self.values[name] = NODES[name].fn(self)
+            elif name in self.raw.columns:
+                self.values[name] = self.raw[name]
+            elif name in ASSET_COLS:
+                warnings.warn(f"Asset column `{name}` missing – created 0-filled.")
+                self.values[name] = pd.Series(0.0, index=self.raw.index, name=name)
+            else:
+                raise KeyError(f"columns missing for scoring: {[name]}")
+        return self.values[name]
+
+    def medians(self) -> tuple[float, float]:
+        if self._medians is None:
+            self._medians = self.fe._medians(self.raw)
+        return self._medians
+
+
+def _income(env: _Env) -> pd.Series:
+    for col in ("income_annum", "incomeannum"):
+        if col in env.raw.columns:
+            return env.raw[col].fillna(0) / 12.0
+    warnings.warn("No `income_annum` column – filling income with zeros.")
+    return pd.Series(0.0, index=env.raw.index)
+
+
+def _total_assets(env: _Env) -> pd.Series:
+    cols = ASSET_COLS
+    total = env[cols[0]].fillna(0)
+    for c in cols[1:]:
+        total = total + env[c].fillna(0)
+    return total
+
+
+def _term(env: _Env) -> pd.Series:
+    return env["loan_term"].replace(0, np.nan).fillna(env.medians()[1])
+
+
+def _principal(env: _Env) -> pd.Series:
+    return env["loan_amount"].fillna(env.medians()[0])
+
+
+def _emi_amortised(env: _Env) -> pd.Series:
+    r = MARKET_APR / 12.0
+    n = _term(env)
+    return _principal(env) * r * (1 + r) ** n / ((1 + r) ** n - 1 + 1e-6)
+
+
+def _dependents(env: _Env) -> pd.Series:
+    raw = env.raw.get("no_of_dependents", pd.Series(0, index=env.raw.index))
+    return pd.to_numeric(raw, errors="coerce").fillna(0).astype(int)
+
+
+def _diversity(env: _Env) -> pd.Series:
+    count = np.zeros(len(env.raw), dtype=np.int64)
+    for c in ASSET_COLS:
+        count += (env[c] > 0).to_numpy()
+    return pd.Series(count, index=env.raw.index)
+
+
+_ASSETS = tuple(ASSET_COLS)
+_INC = "total_income_month"
+
+NODES: dict[str, FeatureNode] = {
+    node.name: node
+    for node in [
+        FeatureNode(_INC, ("income_annum",), _income),
+        FeatureNode("total_assets", _ASSETS, _total_assets),
+        FeatureNode(
+            "net_worth",
+            ("total_assets", "loan_amount"),
+            lambda e: e["total_assets"] - e["loan_amount"],
+        ),
+        FeatureNode(
+            "emi_simple",
+            ("loan_amount", "loan_term"),
+            lambda e: _principal(e) / _term(e),
+        ),
+        FeatureNode("emi_amortised", ("loan_amount", "loan_term"), _emi_amortised),
+        FeatureNode(
+            "debt_to_income_ratio",
+            ("loan_amount", _INC),
+            lambda e: e["loan_amount"] / (e[_INC] * 12 + 1e-6),
+        ),
+        FeatureNode(
+            "dscr",
+            (_INC, "emi_amortised"),
+            lambda e: e[_INC] / (e["emi_amortised"] + 1e-6),
+        ),
+        FeatureNode(
+            "log_loan_amount", ("loan_amount",), lambda e: np.log1p(e["loan_amount"])
+        ),
+        FeatureNode("log_total_income_month", (_INC,), lambda e: np.log1p(e[_INC])),
+        FeatureNode(
+            "log_total_assets", ("total_assets",), lambda e: np.log1p(e["total_assets"])
+        ),
+        FeatureNode(
+            "cibil_score_sq", ("cibil_score",), lambda e: e["cibil_score"] ** 2
+        ),
+        FeatureNode(
+            "cibil_score_bin",
+            ("cibil_score",),
+            lambda e: pd.cut(
+                e["cibil_score"],
+                bins=[-np.inf, 579, 679, 779, 850, np.inf],
+                labels=_CIBIL.categories,
+            ).astype(_CIBIL),
+        ),
+        FeatureNode(
+            "loan_term_bin",
+            ("loan_term",),
+            lambda e: pd.cut(
+                e["loan_term"],
+                bins=[0, 9, 12, 18, 24, np.inf],
+                labels=["≤9 m", "10–12 m", "13–18 m", "19–24 m", ">24 m"],
+            ),
+        ),
+        FeatureNode("number_of_dependents", ("no_of_dependents",), _dependents),
+        FeatureNode(
+            "many_dependents_flag",
+            ("number_of_dependents",),
+            lambda e: (e["number_of_dependents"] >= 3).astype(int),
+        ),
+        FeatureNode(
+            "income_per_dependent",
+            (_INC, "number_of_dependents"),
+            lambda e: e[_INC] / (e["number_of_dependents"] + 1),
+        ),
+        FeatureNode(
+            "luxury_asset_ratio",
+            ("luxury_assets_value", "total_assets"),
+            lambda e: e["luxury_assets_value"] / (e["total_assets"] + 1e-6),
+        ),
+        FeatureNode(
+            "liquid_asset_ratio",
+            ("bank_asset_value", "residential_assets_value", "total_assets"),
+            lambda e: (
+                e["bank_asset_value"].fillna(0)
+                + e["residential_assets_value"].fillna(0)
+            )
+            / (e["total_assets"] + 1e-6),
+        ),
+        FeatureNode("asset_diversity_count", _ASSETS, _diversity),
+        FeatureNode(
+            "graduate_flag",
+            ("education",),
+            lambda e: e["education"].str.lower().str.contains("graduate").astype(int),
+        ),
+        FeatureNode(
+            "income_times_graduate",
+            (_INC, "graduate_flag"),
+            lambda e: e[_INC] * e["graduate_flag"],
+        ),
+        FeatureNode(
+            "self_employed_flag",
+            ("self_employed",),
+            lambda e: e["self_employed"]
+            .astype(str)
+            .str.lower()
+            .isin(["yes", "y", "1"])
+            .astype(int),
+        ),
+        FeatureNode(
+            "selfemp_loan_to_income",
+            ("self_employed_flag", "loan_amount", _INC),
+            lambda e: e["self_employed_flag"]
+            * (e["loan_amount"] / (e[_INC] * 12 + 1e-6)),
+        ),
+        FeatureNode(
+            "highrisk_combo_flag",
+            ("cibil_score", "loan_amount", "total_assets"),
+            lambda e: (
+                (e["cibil_score"] < 600)
+                & (e["loan_amount"] / (e["total_assets"] + 1e-6) > 0.80)
+            ).astype(int),
+        ),
+    ]
+}
+
+
+def plan(columns: Iterable[str]) -> list[str]:
+    """Return the engineered nodes needed for ``columns`` in evaluation order.
+
+    Dummy columns such as ``"gender=M"`` and raw pass-through columns need no
+    node and are not listed.
+    """
+    order: list[str] = []
+
+    def visit(name: str) -> None:
+        if name in NODES and name not in order:
+            for dep in NODES[name].inputs:
+                visit(dep)
+            order.append(name)
+
+    for col in columns:
+        visit(col)
+    return order
+
+
+def _dummies(env: _Env, base: str) -> pd.DataFrame:
+    key = f"{base}="
+    if key not in env.values:
+        cats = env.fe._categorical(env.raw, [base])
+        env.values[key] = pd.get_dummies(
+            cats, prefix_sep="=", drop_first=True, dtype=np.uint8
+        )
+    return env.values[key]
+
+
+def transform_columns(
+    fe: FeatureEngineer, df: pd.DataFrame, columns: Iterable[str]
+) -> pd.DataFrame:
+    """Return ``fe.transform(df)[columns]`` evaluating only required features.
+
+    Dummy columns whose level (or source column) is absent from the batch are
+    returned as zeros. A missing raw input raises ``KeyError``.
+    """
+    columns = list(columns)
+    raw = df.copy(deep=False)
+    raw.columns = fe._standardise_columns(df.iloc[:0]).columns
+    env = _Env(fe, raw)
+    out = {}
+    for col in columns:
+        base, sep, _ = col.partition("=")
+        if col in NODES or col in raw.columns or not sep:
+            values = env[col]
+            if values.dtype == bool:
+                values = values.astype("uint8")
+            out[col] = values
+        else:
+            dummies = _dummies(env, base) if base in raw.columns else {}
+            out[col] = (
+                dummies[col]
+                if col in dummies
+                else pd.Series(0, index=raw.index, dtype=np.uint8)
+            )
+    res = pd.DataFrame(out, index=raw.index, columns=columns)
+    n_missing = sum(int(res[c].isna().sum()) for c in res.columns)
+    if n_missing:
+        warnings.warn(f"Feature matrix has {n_missing} missing values.")
+    return fe._finish(res)
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from .scoring import unwrap
 from .shap_utils import compute_shap_values, plot_shap_summary
 
 __all__ = ["logreg_coefficients", "tree_feature_importances"]
@@ -37,7 +38,7 @@ def logreg_coefficients(
     X: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Save logistic-regression coefficients and odds ratios."""
-    pipe = joblib.load(Path(model_path))
+    pipe = unwrap(joblib.load(Path(model_path)))
     coef = pipe.named_steps["model"].coef_.ravel()
     names = _feature_names(pipe, coef.size)
     df = pd.DataFrame({"feature": names, "coef": coef, "odds_ratio": np.exp(coef)})
@@ -80,7 +81,7 @@ def tree_feature_importances(
     X: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Save decision-tree feature importances."""
-    pipe = joblib.load(Path(model_path))
+    pipe = unwrap(joblib.load(Path(model_path)))
     imps = pipe.named_steps["model"].feature_importances_
     names = _feature_names(pipe, imps.size)
     df = pd.DataFrame({"feature": names, "importance": imps}).sort_values(
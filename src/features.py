@@ -2,41 +2,117 @@
 
 from __future__ import annotations
 
+from itertools import groupby
+
 import numpy as np
 import pandas as pd
 import warnings
-from pandas.api.types import CategoricalDtype
+from sklearn.base import BaseEstimator, TransformerMixin
 
-__all__ = ["FeatureEngineer"]
+from .dataprep import downcast
+from .feature_graph import ASSET_COLS, MARKET_APR, NODES, _Env
 
+__all__ = ["FeatureEngineer"]
 
-class FeatureEngineer:
-    """Encapsulates feature engineering logic."""
 
-    MARKET_APR = 0.090
-    ASSET_COLS = [
-        "residential_assets_value",
-        "commercial_assets_value",
-        "luxury_assets_value",
-        "bank_asset_value",
+class FeatureEngineer(TransformerMixin, BaseEstimator):
+    """Encapsulates feature engineering logic.
+
+    The formulas live in :data:`src.feature_graph.NODES`; this class decides
+    how their results are imputed, encoded and assembled into one frame.
+
+    Unfitted, :meth:`transform` imputes ``loan_amount``/``loan_term`` with the
+    medians of the batch it is given and one-hot encodes the levels present
+    in that batch. After :meth:`fit` the learned medians and levels are used
+    instead, so chunks, single rows and the full frame get the same features.
+
+    With ``preallocate=True`` the derived features are written into one
+    float64 and one int64 block and the result frame is assembled once,
+    instead of deep-copying the input and inserting columns one by one. The
+    output is identical; only peak memory and run time differ.
+
+    With ``compact=True`` the output is passed through
+    :func:`~src.dataprep.downcast`: ratios and other floats become float32,
+    0/1 flags and small counts uint8, and string columns ``category``.
+    """
+
+    # class-level defaults keep instances pickled before the options loadable
+    preallocate = False
+    compact = False
+
+    MARKET_APR = MARKET_APR
+    ASSET_COLS = ASSET_COLS
+
+    # derived columns in output order with their storage: "f" float64 block,
+    # "i" int64 block, "s" kept as its own Series (dtype follows the input)
+    _DERIVED = [
+        ("total_income_month", "f"),
+        ("total_assets", "s"),
+        ("net_worth", "s"),
+        ("emi_simple", "f"),
+        ("emi_amortised", "f"),
+        ("debt_to_income_ratio", "f"),
+        ("dscr", "f"),
+        ("log_loan_amount", "f"),
+        ("log_total_income_month", "f"),
+        ("log_total_assets", "f"),
+        ("cibil_score_sq", "s"),
+        ("cibil_score_bin", "s"),
+        ("loan_term_bin", "s"),
+        ("number_of_dependents", "i"),
+        ("many_dependents_flag", "i"),
+        ("income_per_dependent", "f"),
+        ("luxury_asset_ratio", "f"),
+        ("liquid_asset_ratio", "f"),
+        ("asset_diversity_count", "i"),
+        ("graduate_flag", "i"),
+        ("income_times_graduate", "f"),
+        ("self_employed_flag", "i"),
+        ("selfemp_loan_to_income", "f"),
+        ("highrisk_combo_flag", "i"),
     ]
+    _CAT_COLS = ["gender", "married", "self_employed", "property_area"]
+
+    def __init__(self, preallocate: bool = False, compact: bool = False) -> None:
+        self.preallocate = preallocate
+        self.compact = compact
+
+    def fit(self, df: pd.DataFrame, y=None) -> "FeatureEngineer":
+        """Learn imputation medians and one-hot levels from ``df``."""
+        df = df.copy(deep=False)
+        df.columns = self._standardise_columns(df.iloc[:0]).columns
+        self.loan_median_, self.term_median_ = self._batch_medians(df)
+        self.categories_ = {
+            c: pd.Categorical(df[c].dropna()).categories.tolist()
+            for c in self._CAT_COLS
+            if c in df.columns
+        }
+        return self
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Return engineered feature DataFrame."""
+        if self.preallocate:
+            return self._finish(self._transform_preallocated(df))
+        return self._finish(self._transform_stepwise(df))
+
+    def _transform_stepwise(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the engineered frame built one derived column at a time."""
         df_fe = self._standardise_columns(df)
-        df_fe = self._derive_income(df_fe)
-        df_fe = self._aggregate_assets(df_fe)
-        df_fe = self._compute_emi(df_fe)
-        df_fe = self._derive_ratios(df_fe)
-        df_fe = self._encode_scores(df_fe)
-        df_fe = self._dependents_features(df_fe)
-        df_fe = self._asset_ratios(df_fe)
-        df_fe = self._education_employment_features(df_fe)
-        df_fe = self._flag_highrisk(df_fe)
+        env = _Env(self, df_fe.copy(deep=False))
+        for name, _ in self._DERIVED:
+            # 0-filled asset columns join the frame before their first use
+            for c in NODES[name].inputs:
+                if c in self.ASSET_COLS and c not in df_fe.columns:
+                    df_fe[c] = env[c]
+            df_fe[name] = env[name]
         df_fe = self._encode_categories(df_fe)
         self._warn_missing(df_fe)
         return df_fe
 
+    def _finish(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply the ``compact`` dtype downcast, if enabled."""
+        return downcast(df) if self.compact else df
+
     def _standardise_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Normalise column names."""
         df = df.copy(deep=True)
@@ -48,138 +124,110 @@ class FeatureEngineer:
         )
         return df
 
-    def _derive_income(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Create monthly income feature."""
-        if "income_annum" in df.columns:
-            df["total_income_month"] = df["income_annum"].fillna(0) / 12.0
-        elif "incomeannum" in df.columns:
-            df["total_income_month"] = df["incomeannum"].fillna(0) / 12.0
-        else:
-            warnings.warn("No `income_annum` column – filling income with zeros.")
-            df["total_income_month"] = pd.Series(0.0, index=df.index)
-        return df
-
-    def _aggregate_assets(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Ensure asset columns and compute totals."""
-        for c in self.ASSET_COLS:
-            if c not in df.columns:
-                warnings.warn(f"Asset column `{c}` missing – created 0-filled.")
-                df[c] = 0.0
-        df["total_assets"] = df[self.ASSET_COLS].sum(axis=1)
-        df["net_worth"] = df["total_assets"] - df["loan_amount"]
-        return df
-
-    def _compute_emi(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Calculate simple and amortised EMIs."""
+    def _batch_medians(self, df: pd.DataFrame) -> tuple[float, float]:
+        """Return ``loan_amount`` and non-zero ``loan_term`` medians of ``df``."""
         loan_med = df["loan_amount"].median()
         term_med = df["loan_term"].replace(0, np.nan).median()
         if not np.isfinite(term_med) or term_med == 0:
             warnings.warn("loan_term median 0/NaN – defaulting to 120 months.")
             term_med = 120
-
-        df["emi_simple"] = df["loan_amount"].fillna(loan_med) / df["loan_term"].replace(
-            0, np.nan
-        ).fillna(term_med)
-
-        r = self.MARKET_APR / 12.0
-        n = df["loan_term"].replace(0, np.nan).fillna(term_med)
-        P = df["loan_amount"].fillna(loan_med)
-        df["emi_amortised"] = P * r * (1 + r) ** n / ((1 + r) ** n - 1 + 1e-6)
-        return df
-
-    def _derive_ratios(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Derive financial ratios and logs."""
-        df["debt_to_income_ratio"] = df["loan_amount"] / (
-            df["total_income_month"] * 12 + 1e-6
-        )
-        df["dscr"] = df["total_income_month"] / (df["emi_amortised"] + 1e-6)
-        df["log_loan_amount"] = np.log1p(df["loan_amount"])
-        df["log_total_income_month"] = np.log1p(df["total_income_month"])
-        df["log_total_assets"] = np.log1p(df["total_assets"])
-        return df
-
-    def _encode_scores(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Encode credit scores and term bins."""
-        df["cibil_score_sq"] = df["cibil_score"] ** 2
-        cibil_cat = CategoricalDtype(
-            ["poor", "fair", "good", "verygood", "excellent"], ordered=True
-        )
-        df["cibil_score_bin"] = pd.cut(
-            df["cibil_score"],
-            bins=[-np.inf, 579, 679, 779, 850, np.inf],
-            labels=cibil_cat.categories,
-        ).astype(cibil_cat)
-        df["loan_term_bin"] = pd.cut(
-            df["loan_term"],
-            bins=[0, 9, 12, 18, 24, np.inf],
-            labels=["≤9 m", "10–12 m", "13–18 m", "19–24 m", ">24 m"],
+        return loan_med, term_med
+
+    def _medians(self, df: pd.DataFrame) -> tuple[float, float]:
+        """Return the fitted medians, or those of ``df`` when unfitted."""
+        if hasattr(self, "loan_median_"):
+            return self.loan_median_, self.term_median_
+        return self._batch_medians(df)
+
+    def _categorical(self, df: pd.DataFrame, cat_cols: list[str]) -> pd.DataFrame:
+        """Return ``df[cat_cols]`` restricted to the fitted levels, if any."""
+        cats = df[cat_cols]
+        fitted = getattr(self, "categories_", {})
+        return cats.assign(
+            **{
+                c: pd.Categorical(cats[c], categories=fitted[c])
+                for c in cat_cols
+                if c in fitted
+            }
         )
-        return df
-
-    def _dependents_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add dependent count features."""
-        dep = (
-            pd.to_numeric(
-                df.get("no_of_dependents", pd.Series(0, index=df.index)),
-                errors="coerce",
-            )
-            .fillna(0)
-            .astype(int)
-        )
-        df["number_of_dependents"] = dep
-        df["many_dependents_flag"] = (df["number_of_dependents"] >= 3).astype(int)
-        df["income_per_dependent"] = df["total_income_month"] / (
-            df["number_of_dependents"] + 1
-        )
-        return df
-
-    def _asset_ratios(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Create asset ratio features."""
-        df["luxury_asset_ratio"] = df["luxury_assets_value"] / (
-            df["total_assets"] + 1e-6
-        )
-        liquid_assets = df["bank_asset_value"].fillna(0) + df[
-            "residential_assets_value"
-        ].fillna(0)
-        df["liquid_asset_ratio"] = liquid_assets / (df["total_assets"] + 1e-6)
-        df["asset_diversity_count"] = (df[self.ASSET_COLS] > 0).astype(int).sum(axis=1)
-        return df
-
-    def _education_employment_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add education and employment flags."""
-        df["graduate_flag"] = (
-            df["education"].str.lower().str.contains("graduate").astype(int)
-        )
-        df["income_times_graduate"] = df["total_income_month"] * df["graduate_flag"]
-        df["self_employed_flag"] = (
-            df["self_employed"].astype(str).str.lower().isin(["yes", "y", "1"])
-        ).astype(int)
-        df["selfemp_loan_to_income"] = df["self_employed_flag"] * (
-            df["loan_amount"] / (df["total_income_month"] * 12 + 1e-6)
-        )
-        return df
-
-    def _flag_highrisk(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Identify risky borrower combinations."""
-        df["highrisk_combo_flag"] = (
-            (df["cibil_score"] < 600)
-            & (df["loan_amount"] / (df["total_assets"] + 1e-6) > 0.80)
-        ).astype(int)
-        return df
 
     def _encode_categories(self, df: pd.DataFrame) -> pd.DataFrame:
         """One-hot encode common categorical features."""
-        cat_cols = [
-            c
-            for c in ["gender", "married", "self_employed", "property_area"]
-            if c in df.columns
-        ]
+        cat_cols = [c for c in self._CAT_COLS if c in df.columns]
         if cat_cols:
+            if hasattr(self, "categories_"):
+                df[cat_cols] = self._categorical(df, cat_cols)
             df = pd.get_dummies(df, columns=cat_cols, prefix_sep="=", drop_first=True)
         bool_cols = df.select_dtypes("bool").columns
         df[bool_cols] = df[bool_cols].astype("uint8")
         return df
 
+    def _transform_preallocated(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return the same frame as the stepwise path with fewer copies.
+
+        Each formula's float or int result is copied into a shared block and
+        later formulas read that block column, so the intermediate Series are
+        dropped as soon as they are stored.
+        """
+        base = df.copy(deep=False)
+        base.columns = self._standardise_columns(df.iloc[:0]).columns
+        if any(name in base.columns for name, _ in self._DERIVED):
+            # re-engineering an engineered frame overwrites columns in place
+            return self._transform_stepwise(df)
+
+        n = len(base)
+        names = {kind: [c for c, k in self._DERIVED if k == kind] for kind in "fi"}
+        blocks = {
+            "f": np.empty((n, len(names["f"])), dtype=np.float64, order="F"),
+            "i": np.empty((n, len(names["i"])), dtype=np.int64, order="F"),
+        }
+        slot = {c: (k, j) for k in "fi" for j, c in enumerate(names[k])}
+        env = _Env(self, base)
+        for name, kind in self._DERIVED:
+            values = env[name]
+            if kind != "s":
+                _, j = slot[name]
+                blocks[kind][:, j] = np.asarray(values)
+                env.values[name] = pd.Series(
+                    blocks[kind][:, j], index=base.index, copy=False
+                )
+        added = [c for c in self.ASSET_COLS if c not in base.columns]
+
+        # assemble once; adjacent block columns become one view per run
+        cat_cols = [c for c in self._CAT_COLS if c in base.columns]
+        parts = [base.drop(columns=cat_cols)]
+        for kind, group in groupby(self._DERIVED, key=lambda item: item[1]):
+            run = [name for name, _ in group]
+            if kind == "s":
+                parts.extend(env[name].to_frame(name) for name in run)
+            else:
+                first = slot[run[0]][1]
+                stop = first + len(run)
+                block = blocks[kind][:, first:stop]
+                parts.append(
+                    pd.DataFrame(block, index=base.index, columns=run, copy=False)
+                )
+            if run[0] == "total_income_month":
+                parts.extend(env[c].to_frame(c) for c in added)
+        if cat_cols:
+            parts.append(
+                pd.get_dummies(
+                    self._categorical(base, cat_cols),
+                    prefix_sep="=",
+                    drop_first=True,
+                    dtype=np.uint8,
+                )
+            )
+        out = pd.concat(parts, axis=1)
+        bool_cols = out.select_dtypes("bool").columns
+        if len(bool_cols):
+            out[bool_cols] = out[bool_cols].astype("uint8")
+        # same check as ``_warn_missing`` without a full-frame ``isna`` mask
+        n_missing = sum(int(out[c].isna().sum()) for c in out.columns)
+        if n_missing:
+            warnings.warn(f"Feature matrix has {n_missing} missing values.")
+        return out
+
     def _warn_missing(self, df: pd.DataFrame) -> None:
         """Warn if the resulting DataFrame contains NaNs."""
         n_missing = int(df.isna().sum().sum())
@@ -0,0 +1,204 @@
+"""Append-only store of engineered loan partitions.
+
+Raw partitions (one file per day, say) are cleaned, de-duplicated against
+everything ingested before and engineered once; later runs only process
+files the store has not seen. The :class:`~src.features.FeatureEngineer` is
+fitted on the first partition and persisted, so every partition is encoded
+with the same imputation medians and one-hot levels. It is not refitted as
+partitions arrive, since that would change rows already stored: medians stay
+those of the first partition and a category level it lacks gets no dummy
+column (its rows read 0 in every dummy of that column). Call
+:meth:`IngestStore.reset` to refit on the files present.
+
+Layout under ``root``::
+
+    manifest.json             processed sources (sha256, size, mtime), row
+                              counts, code version
+    feature_engineer.joblib   fitted FeatureEngineer
+    row_hashes-00000.npy      sorted 64-bit hashes of every kept cleaned row
+    parts/part-00000.arrow    engineered rows per ingested source
+
+The manifest is the commit point: each source writes a new hash file and
+only the atomic manifest replace that records the partition also switches
+``row_hashes`` to it, so a run killed between the writes leaves the previous
+hashes in force and the rerun ingests the source again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from .dataprep import clean, load_raw, row_hashes
+from .feature_cache import code_version
+from .features import FeatureEngineer
+from .manifest import sha256
+from .tabular_io import FORMATS, read_table, write_table
+
+__all__ = ["IngestStore", "load_directory", "load_directory_cleaned"]
+
+STORE_DIR = ".ingest"
+
+
+class IngestStore:
+    """Engineered rows of every ingested source under ``root``."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        path = self.root / "manifest.json"
+        self.manifest = (
+            json.loads(path.read_text())
+            if path.exists()
+            else {"code_version": code_version(), "partitions": []}
+        )
+        if self.manifest["code_version"] != code_version():
+            # feature code changed: stored parts no longer match, start over
+            self.reset()
+
+    @property
+    def partitions(self) -> list[dict]:
+        """Manifest records of ingested sources in ingest order."""
+        return self.manifest["partitions"]
+
+    def reset(self) -> None:
+        """Forget every partition and delete the stored files."""
+        for part in self.partitions:
+            (self.root / part["file"]).unlink(missing_ok=True)
+        (self.root / "feature_engineer.joblib").unlink(missing_ok=True)
+        for path in self.root.glob("row_hashes*.npy"):
+            path.unlink()
+        self.manifest = {"code_version": code_version(), "partitions": []}
+        self._save_manifest()
+
+    def pending(self, sources: Iterable[str | Path]) -> list[Path]:
+        """Return the ``sources`` not yet ingested, sorted by name.
+
+        Raises ``ValueError`` if an ingested source changed on disk, since
+        the store is append-only. An ingested file is only hashed again when
+        its size or modification time differ from the recorded ones.
+        """
+        done = {p["source"]: p for p in self.partitions}
+        todo, touched = [], False
+        for src in sorted(Path(s) for s in sources):
+            record = done.get(src.name)
+            if record is None:
+                todo.append(src)
+                continue
+            stat = _stat(src)
+            if all(record.get(k) == v for k, v in stat.items()):
+                continue
+            if record["sha256"] != sha256(src):
+                raise ValueError(
+                    f"{src.name} changed since it was ingested; "
+                    "rebuild the store with reset()"
+                )
+            # same content, new timestamp: skip the hash next time
+            record.update(stat)
+            touched = True
+        if touched:
+            self._save_manifest()
+        return todo
+
+    def ingest(self, sources: Iterable[str | Path]) -> list[dict]:
+        """Clean, de-duplicate and engineer the new ``sources``.
+
+        Returns the manifest records added by this call.
+        """
+        todo = self.pending(sources)
+        if not todo:
+            return []
+        (self.root / "parts").mkdir(parents=True, exist_ok=True)
+        fe_path = self.root / "feature_engineer.joblib"
+        fe = joblib.load(fe_path) if fe_path.exists() else None
+        hash_file = self.manifest.get("row_hashes")
+        seen = np.load(self.root / hash_file) if hash_file else np.empty(0, np.uint64)
+
+        added = []
+        for src in todo:
+            raw = load_raw(src)
+            df = clean(raw)
+            hashes = row_hashes(df)
+            known = np.zeros(hashes.size, dtype=bool)
+            if seen.size:
+                pos = np.minimum(np.searchsorted(seen, hashes), seen.size - 1)
+                known = seen[pos] == hashes
+            df = df[~known]
+            seen = np.sort(np.concatenate([seen, hashes[~known]]), kind="stable")
+            if fe is None:
+                fe = FeatureEngineer(preallocate=True).fit(df)
+                joblib.dump(fe, fe_path)
+
+            file = f"parts/part-{len(self.partitions):05d}.arrow"
+            write_table(fe.transform(df), self.root / file)
+            record = {
+                "source": src.name,
+                "sha256": sha256(src),
+                **_stat(src),
+                "file": file,
+                "rows_in": len(raw),
+                "rows_out": len(df),
+            }
+            new_hash_file = f"row_hashes-{len(self.partitions):05d}.npy"
+            np.save(self.root / new_hash_file, seen)
+            self.partitions.append(record)
+            self.manifest["row_hashes"] = new_hash_file
+            self._save_manifest()
+            if hash_file:
+                (self.root / hash_file).unlink(missing_ok=True)
+            hash_file = new_hash_file
+            added.append(record)
+        return added
+
+    def load(self, columns: list[str] | None = None) -> pd.DataFrame:
+        """Return all ingested rows as one frame, in ingest order."""
+        parts = [read_table(self.root / p["file"], columns) for p in self.partitions]
+        if not parts:
+            raise FileNotFoundError(f"no partitions ingested in {self.root}")
+        return pd.concat(parts, ignore_index=True)
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / "manifest.json.tmp"
+        tmp.write_text(json.dumps(self.manifest, indent=2))
+        os.replace(tmp, self.root / "manifest.json")
+
+
+def load_directory(path: str | Path) -> pd.DataFrame:
+    """Ingest new partition files in directory ``path`` and return all rows.
+
+    The store lives in ``path/.ingest``; only files not seen before are
+    processed. Features are encoded with the engineer fitted on the first
+    ingested file (see :mod:`src.ingest`).
+    """
+    path = Path(path)
+    store = IngestStore(path / STORE_DIR)
+    store.ingest(_sources(path))
+    return store.load()
+
+
+def load_directory_cleaned(path: str | Path) -> pd.DataFrame:
+    """Return the cleaned rows behind :func:`load_directory`, in the same order.
+
+    Ingests new files first, then cleans every partition in ingest order as
+    one frame, which keeps the same rows as the store's de-duplication.
+    """
+    path = Path(path)
+    store = IngestStore(path / STORE_DIR)
+    store.ingest(_sources(path))
+    raw = [load_raw(path / p["source"]) for p in store.partitions]
+    return clean(pd.concat(raw, ignore_index=True)).reset_index(drop=True)
+
+
+def _sources(path: Path) -> list[Path]:
+    return [p for p in path.iterdir() if p.is_file() and p.suffix.lower() in FORMATS]
+
+
+def _stat(path: Path) -> dict:
+    st = path.stat()
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
@@ -13,6 +13,8 @@ import numpy as np
 import pandas as pd
 from sklearn.model_selection import GridSearchCV, ParameterGrid
 
+from .staged_search import StagedGridSearchCV
+
 __all__ = [
     "write_manifest",
     "sha256",
@@ -45,11 +47,28 @@ def save_folds(tag: str, cv, X, y, out_dir: Path = Path("artefacts")) -> Path:
 
 
 def run_grid(
-    pipe, grid, X, y, cv, tag: str, out_dir: Path = Path("artefacts")
+    pipe,
+    grid,
+    X,
+    y,
+    cv,
+    tag: str,
+    out_dir: Path = Path("artefacts"),
+    checkpoint: str | Path | None = None,
 ) -> GridSearchCV:
-    """Run ``GridSearchCV`` and persist results."""
+    """Run ``GridSearchCV`` and persist results.
+
+    With ``checkpoint`` each (candidate, fold) score is saved there as it
+    finishes and a rerun on the same inputs resumes from the saved scores
+    (see :class:`~src.staged_search.StagedGridSearchCV`).
+    """
     t0 = time.perf_counter()
-    gs = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc", n_jobs=-1)
+    if checkpoint is None:
+        gs = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc", n_jobs=-1)
+    else:
+        gs = StagedGridSearchCV(
+            pipe, grid, stage_param=None, cv=cv, n_jobs=-1, checkpoint=checkpoint
+        )
     gs.fit(X, y)
     runtime = time.perf_counter() - t0
     per_fit = runtime / (len(list(ParameterGrid(grid))) * cv.get_n_splits())
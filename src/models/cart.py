@@ -2,16 +2,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import joblib
 import pandas as pd
 from sklearn.metrics import roc_auc_score
 from imblearn.base import SamplerMixin
 from imblearn.pipeline import Pipeline
 from sklearn.tree import DecisionTreeClassifier
-from sklearn.model_selection import GridSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV
 
-from ..dataprep import clean, CSV_PATH
-from ..features import FeatureEngineer
+from ..dataprep import CSV_PATH
+from ..feature_cache import load_cleaned, load_features
+from ..scoring import ScoringModel, training_engineer
 from ..preprocessing import build_preprocessor, validate_prep
 from ..pipeline_helpers import tree_steps, run_gs
 from ..split import stratified_split
@@ -21,10 +22,11 @@ TARGET = "loan_status"
 
 
 def load_data(path: str | Path = DATA_PATH) -> pd.DataFrame:
-    """Return cleaned and engineered DataFrame loaded from ``path``."""
-    df = pd.read_csv(Path(path))
-    df = clean(df)
-    return FeatureEngineer().transform(df)
+    """Return cleaned and engineered DataFrame loaded from ``path``.
+
+    Results are cached by :func:`src.feature_cache.load_features`.
+    """
+    return load_features(path)
 
 
 def build_pipeline(
@@ -45,8 +47,13 @@ def train_from_df(
     target: str = TARGET,
     artefact_path: Path | None = None,
     sampler: SamplerMixin | None = None,
+    cleaned: pd.DataFrame | None = None,
 ) -> float:
-    """Train model on ``df`` and return validation ROC-AUC."""
+    """Train model on ``df`` and return validation ROC-AUC.
+
+    Saving to ``artefact_path`` needs ``cleaned``, the cleaned rows ``df`` was
+    engineered from (see :func:`~src.scoring.training_engineer`).
+    """
     train_df, val_df, _ = stratified_split(df, target)
     x_train = train_df.drop(columns=[target])
     y_train = train_df[target]
@@ -61,8 +68,8 @@ def train_from_df(
     pred = pipe.predict_proba(x_val)[:, 1]
     auc = roc_auc_score(y_val, pred)
     if artefact_path:
-        artefact_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(pipe, artefact_path)
+        fe = training_engineer(cleaned, df[target])
+        ScoringModel(pipe, feature_engineer=fe).save(artefact_path)
     return auc
 
 
@@ -71,10 +78,26 @@ def grid_train_from_df(
     target: str = TARGET,
     artefact_path: Path | None = None,
     sampler: SamplerMixin | None = None,
-) -> GridSearchCV:
+    search: str = "grid",
+    prune: bool = False,
+    cleaned: pd.DataFrame | None = None,
+    checkpoint: str | Path | None = None,
+) -> GridSearchCV | HalvingGridSearchCV:
     """Return fitted GridSearchCV and optionally save best model.
 
     If ``artefact_path`` is provided, the best estimator is persisted.
+    ``search="halving"`` uses successive halving instead of the full grid
+    (see :func:`~src.pipeline_helpers.run_gs`).
+
+    ``prune=True`` tunes ``ccp_alpha`` instead of depth and leaf sizes: one
+    full tree is grown per fold and class weight, and every alpha on its
+    cost-complexity pruning path is scored by pruning it. With
+    ``artefact_path`` the ``cv_results_`` table is also written next to it
+    as ``cv_results_tree_cart_prune.csv`` for :mod:`src.reporting`.
+
+    Saving to ``artefact_path`` needs ``cleaned`` as in :func:`train_from_df`.
+    ``checkpoint`` is a directory passed to :func:`~src.pipeline_helpers.run_gs`
+    so an interrupted grid search resumes from its finished fits.
     """
     x, y = df.drop(columns=[target]), df[target]
     cat_cols = x.select_dtypes(include=["object", "category"]).columns.tolist()
@@ -83,16 +106,33 @@ def grid_train_from_df(
     preproc.fit(x, y)
     validate_prep(preproc, x, "cart")
     steps = tree_steps(preproc, sampler or "passthrough")
-    grid = {
-        "model__max_depth": [None, 8, 15],
-        "model__min_samples_leaf": [1, 5],
-        "model__min_samples_split": [2, 10],
-        "model__class_weight": [None, "balanced"],
-    }
-    gs = run_gs(x, y, steps, DecisionTreeClassifier(random_state=42), grid)
+    if prune:
+        grid = {"model__class_weight": [None, "balanced"]}
+        extra = {"prune": "model__ccp_alpha"}
+    else:
+        grid = {
+            "model__max_depth": [None, 8, 15],
+            "model__min_samples_leaf": [1, 5],
+            "model__min_samples_split": [2, 10],
+            "model__class_weight": [None, "balanced"],
+        }
+        extra = {}
+    gs = run_gs(
+        x,
+        y,
+        steps,
+        DecisionTreeClassifier(random_state=42),
+        grid,
+        search=search,
+        checkpoint=checkpoint,
+        **extra,
+    )
     if artefact_path:
-        artefact_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(gs.best_estimator_, artefact_path)
+        fe = training_engineer(cleaned)
+        ScoringModel(gs.best_estimator_, feature_engineer=fe).save(artefact_path)
+        if prune:
+            out = Path(artefact_path).parent / "cv_results_tree_cart_prune.csv"
+            pd.DataFrame(gs.cv_results_).to_csv(out, index=False)
     return gs
 
 
@@ -101,7 +141,10 @@ def main(
 ) -> None:
     df = load_data(data_path)
     auc = train_from_df(
-        df, artefact_path=Path("artefacts/cart.joblib"), sampler=sampler
+        df,
+        artefact_path=Path("artefacts/cart.joblib"),
+        sampler=sampler,
+        cleaned=load_cleaned(data_path),
     )
     print(f"Validation ROC-AUC: {auc:.3f}")
 
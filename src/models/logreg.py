@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import joblib
 import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
@@ -12,8 +11,9 @@ from imblearn.base import SamplerMixin
 from imblearn.pipeline import Pipeline
 from imblearn.over_sampling import SMOTE, SMOTENC
 
-from ..dataprep import clean, CSV_PATH
-from ..features import FeatureEngineer
+from ..dataprep import CSV_PATH
+from ..feature_cache import load_cleaned, load_features
+from ..scoring import ScoringModel, training_engineer
 from ..preprocessing import build_preprocessor, validate_prep
 
 from ..pipeline_helpers import lr_steps, run_gs
@@ -42,10 +42,11 @@ _LOGREG_PARAM_GRID_BASE = [
 
 
 def load_data(path: str | Path = DATA_PATH) -> pd.DataFrame:
-    """Return cleaned and engineered DataFrame loaded from ``path``."""
-    df = pd.read_csv(Path(path))
-    df = clean(df)
-    return FeatureEngineer().transform(df)
+    """Return cleaned and engineered DataFrame loaded from ``path``.
+
+    Results are cached by :func:`src.feature_cache.load_features`.
+    """
+    return load_features(path)
 
 
 def build_pipeline(
@@ -66,8 +67,13 @@ def train_from_df(
     target: str = TARGET,
     artefact_path: Path | None = None,
     sampler: SamplerMixin | None = None,
+    cleaned: pd.DataFrame | None = None,
 ) -> float:
-    """Train model on ``df`` and return validation ROC-AUC."""
+    """Train model on ``df`` and return validation ROC-AUC.
+
+    Saving to ``artefact_path`` needs ``cleaned``, the cleaned rows ``df`` was
+    engineered from (see :func:`~src.scoring.training_engineer`).
+    """
     train_df, val_df, _ = stratified_split(df, target)
     x_train = train_df.drop(columns=[target])
     y_train = train_df[target]
@@ -82,8 +88,8 @@ def train_from_df(
     pred = pipe.predict_proba(x_val)[:, 1]
     auc = roc_auc_score(y_val, pred)
     if artefact_path:
-        artefact_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(pipe, artefact_path)
+        fe = training_engineer(cleaned, df[target])
+        ScoringModel(pipe, feature_engineer=fe).save(artefact_path)
     return auc
 
 
@@ -92,8 +98,19 @@ def grid_train_from_df(
     target: str = TARGET,
     artefact_path: Path | None = None,
     sampler: SamplerMixin | None = None,
+    search: str = "grid",
+    cleaned: pd.DataFrame | None = None,
+    checkpoint: str | Path | None = None,
 ) -> float:
-    """Grid-search logistic regression and return validation ROC-AUC."""
+    """Grid-search logistic regression and return validation ROC-AUC.
+
+    The ``C`` values are fitted as a warm-started regularisation path per
+    fold. ``search="halving"`` races the grid with successive halving instead.
+
+    Saving to ``artefact_path`` needs ``cleaned`` as in :func:`train_from_df`.
+    ``checkpoint`` is a directory passed to :func:`~src.pipeline_helpers.run_gs`
+    so an interrupted grid search resumes from its finished fits.
+    """
 
     train_df, val_df, _ = stratified_split(df, target)
     x_train = train_df.drop(columns=[target])
@@ -129,13 +146,22 @@ def grid_train_from_df(
         new_blk["sampler"] = base_samplers.copy()
         param_grid.append(new_blk)
 
-    gs = run_gs(x_train, y_train, steps, LogisticRegression(max_iter=1000), param_grid)
+    gs = run_gs(
+        x_train,
+        y_train,
+        steps,
+        LogisticRegression(max_iter=1000),
+        param_grid,
+        search=search,
+        checkpoint=checkpoint,
+        path="model__C",
+    )
     pred = gs.best_estimator_.predict_proba(x_val)[:, 1]
 
     auc = roc_auc_score(y_val, pred)
     if artefact_path:
-        artefact_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(gs.best_estimator_, artefact_path)
+        fe = training_engineer(cleaned, df[target])
+        ScoringModel(gs.best_estimator_, feature_engineer=fe).save(artefact_path)
     return auc
 
 
@@ -144,7 +170,10 @@ def main(
 ) -> None:
     df = load_data(data_path)
     auc = train_from_df(
-        df, artefact_path=Path("artefacts/logreg.joblib"), sampler=sampler
+        df,
+        artefact_path=Path("artefacts/logreg.joblib"),
+        sampler=sampler,
+        cleaned=load_cleaned(data_path),
     )
     print(f"Validation ROC-AUC: {auc:.3f}")
 
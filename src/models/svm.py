@@ -2,18 +2,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import joblib
 import pandas as pd
 from imblearn.base import SamplerMixin
 from imblearn.pipeline import Pipeline
 from sklearn.metrics import roc_auc_score
-from sklearn.model_selection import GridSearchCV
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import GridSearchCV, HalvingGridSearchCV
 from sklearn.svm import SVC
 
-from ..dataprep import CSV_PATH, clean
-from ..features import FeatureEngineer
+from ..dataprep import CSV_PATH
+from ..feature_cache import load_cleaned, load_features
 from ..pipeline_helpers import lr_steps, run_gs
 from ..preprocessing import build_preprocessor, validate_prep
+from ..scoring import ScoringModel, training_engineer
 from ..split import stratified_split
 
 DATA_PATH = CSV_PATH
@@ -21,10 +22,11 @@ TARGET = "loan_status"
 
 
 def load_data(path: str | Path = DATA_PATH) -> pd.DataFrame:
-    """Return cleaned and engineered DataFrame loaded from ``path``."""
-    df = pd.read_csv(Path(path))
-    df = clean(df)
-    return FeatureEngineer().transform(df)
+    """Return cleaned and engineered DataFrame loaded from ``path``.
+
+    Results are cached by :func:`src.feature_cache.load_features`.
+    """
+    return load_features(path)
 
 
 def build_pipeline(
@@ -45,8 +47,13 @@ def train_from_df(
     target: str = TARGET,
     artefact_path: Path | None = None,
     sampler: SamplerMixin | None = None,
+    cleaned: pd.DataFrame | None = None,
 ) -> float:
-    """Train model on ``df`` and return validation ROC-AUC."""
+    """Train model on ``df`` and return validation ROC-AUC.
+
+    Saving to ``artefact_path`` needs ``cleaned``, the cleaned rows ``df`` was
+    engineered from (see :func:`~src.scoring.training_engineer`).
+    """
     train_df, val_df, _ = stratified_split(df, target)
     x_train = train_df.drop(columns=[target])
     y_train = train_df[target]
@@ -61,8 +68,8 @@ def train_from_df(
     pred = pipe.predict_proba(x_val)[:, 1]
     auc = roc_auc_score(y_val, pred)
     if artefact_path:
-        artefact_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(pipe, artefact_path)
+        fe = training_engineer(cleaned, df[target])
+        ScoringModel(pipe, feature_engineer=fe).save(artefact_path)
     return auc
 
 
@@ -71,8 +78,19 @@ def grid_train_from_df(
     target: str = TARGET,
     artefact_path: Path | None = None,
     sampler: SamplerMixin | None = None,
-) -> GridSearchCV:
-    """Return fitted GridSearchCV and optionally save best model."""
+    search: str = "grid",
+    cleaned: pd.DataFrame | None = None,
+    checkpoint: str | Path | None = None,
+) -> GridSearchCV | HalvingGridSearchCV:
+    """Return fitted search and optionally save best model.
+
+    ``search`` is ``"grid"`` or ``"halving"`` (see
+    :func:`~src.pipeline_helpers.run_gs`).
+
+    Saving to ``artefact_path`` needs ``cleaned`` as in :func:`train_from_df`.
+    ``checkpoint`` is a directory passed to :func:`~src.pipeline_helpers.run_gs`
+    so an interrupted grid search resumes from its finished fits.
+    """
     x, y = df.drop(columns=[target]), df[target]
     cat_cols = x.select_dtypes(include=["object", "category"]).columns.tolist()
     num_cols = [c for c in x.columns if c not in cat_cols]
@@ -85,10 +103,18 @@ def grid_train_from_df(
         "model__C": [0.1, 1.0],
         "model__class_weight": [None, "balanced"],
     }
-    gs = run_gs(x, y, steps, SVC(probability=True), grid)
+    gs = run_gs(
+        x,
+        y,
+        steps,
+        SVC(probability=True),
+        grid,
+        search=search,
+        checkpoint=checkpoint,
+    )
     if artefact_path:
-        artefact_path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(gs.best_estimator_, artefact_path)
+        fe = training_engineer(cleaned)
+        ScoringModel(gs.best_estimator_, feature_engineer=fe).save(artefact_path)
     return gs
 
 
@@ -96,7 +122,12 @@ def main(
     data_path: str | Path = DATA_PATH, sampler: SamplerMixin | None = None
 ) -> None:
     df = load_data(data_path)
-    auc = train_from_df(df, artefact_path=Path("artefacts/svm.joblib"), sampler=sampler)
+    auc = train_from_df(
+        df,
+        artefact_path=Path("artefacts/svm.joblib"),
+        sampler=sampler,
+        cleaned=load_cleaned(data_path),
+    )
     print(f"Validation ROC-AUC: {auc:.3f}")
 
 
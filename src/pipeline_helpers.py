@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-from typing import Sequence
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Sequence
 
 from imblearn.base import SamplerMixin
 from imblearn.pipeline import Pipeline
 from sklearn.base import BaseEstimator
-from sklearn.model_selection import GridSearchCV, RepeatedStratifiedKFold
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    RepeatedStratifiedKFold,
+)
 
+from .staged_search import PathGridSearchCV, PrunedTreeSearchCV, StagedGridSearchCV
 
-__all__ = ["lr_steps", "tree_steps", "run_gs"]
+__all__ = ["SEARCHES", "lr_steps", "tree_steps", "fit_cache", "run_gs"]
+
+SEARCHES = ("grid", "halving")
 
 
 def lr_steps(preprocessor, sampler: SamplerMixin | str) -> list[tuple[str, object]]:
@@ -21,22 +33,131 @@ def tree_steps(preprocessor, sampler: SamplerMixin | str) -> list[tuple[str, obj
     return [("prep", preprocessor), ("sampler", sampler), ("model", None)]
 
 
+@contextmanager
+def fit_cache(memory: str | Path | None = "auto") -> Iterator[str | None]:
+    """Yield a ``Pipeline(memory=...)`` location for fitted transformers.
+
+    ``"auto"`` creates a temporary directory and removes it on exit; a path
+    is used as-is and kept; ``None`` disables caching.
+    """
+    if memory != "auto":
+        yield None if memory is None else str(memory)
+        return
+    tmp = tempfile.mkdtemp(prefix="mlcls-fitcache-")
+    try:
+        yield tmp
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _budget_grid(grid: dict | list[dict], resource: str) -> tuple[list[dict], int]:
+    """Drop ``resource`` from ``grid`` and return its largest value."""
+    blocks = grid if isinstance(grid, list) else [grid]
+    values = [v for blk in blocks for v in blk.get(resource, [])]
+    if not values:
+        raise ValueError(f"resource {resource!r} is not a parameter in the grid")
+    return [{k: v for k, v in blk.items() if k != resource} for blk in blocks], max(
+        values
+    )
+
+
 def run_gs(
     X,
     y,
     steps: Sequence[tuple[str, object]],
     estimator: BaseEstimator,
-    grid: dict,
+    grid: dict | list[dict],
     *,
     n_splits: int = 5,
     n_repeats: int = 3,
-) -> GridSearchCV:
-    """Fit ``GridSearchCV`` on ``X, y`` using ``steps`` and ``grid``."""
-    pipe = Pipeline(steps)
-    pipe.set_params(model=estimator)
+    memory: str | Path | None = "auto",
+    search: str = "grid",
+    resource: str = "n_samples",
+    factor: int = 3,
+    staged: str | None = None,
+    path: str | None = None,
+    prune: str | None = None,
+    checkpoint: str | Path | None = None,
+) -> GridSearchCV | HalvingGridSearchCV:
+    """Fit ``GridSearchCV`` on ``X, y`` using ``steps`` and ``grid``.
+
+    The ``prep`` and ``sampler`` steps do not depend on ``model__*``
+    parameters, so their fitted state is cached per CV fold (see
+    :func:`fit_cache`) and each fold's preprocessing is fitted once instead
+    of once per grid point.
+
+    ``search="halving"`` runs successive halving instead: every candidate is
+    scored on a small budget and only the best ``1/factor`` advance to the
+    next round with ``factor`` times more. The budget is ``resource``: the
+    number of training rows by default, or a grid parameter such as
+    ``"model__n_estimators"``, which is then removed from the grid and grows
+    up to its largest listed value.
+
+    ``staged`` names an ensemble-size parameter (``"model__n_estimators"``)
+    for the exhaustive grid: the largest size is fitted once per fold and the
+    smaller ones are scored from its first trees or boosting stages (see
+    :class:`~src.staged_search.StagedGridSearchCV`). ``path`` names a
+    regularisation parameter (``"model__C"``) fitted per fold as a
+    warm-started path on preprocessing fitted once (see
+    :class:`~src.staged_search.PathGridSearchCV`). ``prune`` names a
+    decision tree's ``ccp_alpha`` parameter: one unpruned tree is grown per
+    fold and each alpha is scored by pruning it; alphas missing from the grid
+    are taken from the tree's pruning path (see
+    :class:`~src.staged_search.PrunedTreeSearchCV`). At most one of
+    ``staged``, ``path`` and ``prune`` may be given.
+
+    ``checkpoint`` is a directory where every (parameter group, fold) score
+    is saved as it finishes. Rerunning with the same data, steps, grid and
+    folds skips the saved fits and refits only the best estimator. It is
+    not supported with ``search="halving"``.
+    """
+    if search not in SEARCHES:
+        raise ValueError(f"search must be one of {SEARCHES}, got {search!r}")
+    if checkpoint is not None and search != "grid":
+        raise ValueError("checkpoint needs search='grid'")
+    shortcuts = [
+        name
+        for name, value in (("staged", staged), ("path", path), ("prune", prune))
+        if value
+    ]
+    if len(shortcuts) > 1:
+        raise ValueError(f"staged, path and prune are exclusive, got {shortcuts}")
     cv = RepeatedStratifiedKFold(
         n_splits=n_splits, n_repeats=n_repeats, random_state=42
     )
-    gs = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc", n_jobs=-1)
-    gs.fit(X, y)
+    with fit_cache(memory) as location:
+        pipe = Pipeline(steps, memory=location)
+        pipe.set_params(model=estimator)
+        shared = {"cv": cv, "n_jobs": -1, "checkpoint": checkpoint}
+        if search == "grid" and staged:
+            gs = StagedGridSearchCV(pipe, grid, stage_param=staged, **shared)
+        elif search == "grid" and path:
+            gs = PathGridSearchCV(pipe, grid, stage_param=path, **shared)
+        elif search == "grid" and prune:
+            gs = PrunedTreeSearchCV(pipe, grid, stage_param=prune, **shared)
+        elif search == "grid" and checkpoint is not None:
+            gs = StagedGridSearchCV(pipe, grid, stage_param=None, **shared)
+        elif search == "grid":
+            gs = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc", n_jobs=-1)
+        else:
+            budget = {}
+            if resource != "n_samples":
+                grid, max_resources = _budget_grid(grid, resource)
+                budget = {"max_resources": max_resources}
+            gs = HalvingGridSearchCV(
+                pipe,
+                grid,
+                cv=cv,
+                scoring="roc_auc",
+                factor=factor,
+                resource=resource,
+                random_state=42,
+                n_jobs=-1,
+                **budget,
+            )
+        gs.fit(X, y)
+    if memory == "auto":
+        # the directory is gone; keep the fitted pipeline free of the path
+        gs.estimator.set_params(memory=None)
+        gs.best_estimator_.set_params(memory=None)
     return gs
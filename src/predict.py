@@ -1,11 +1,203 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import joblib
+import numpy as np
 import pandas as pd
 
+from .tabular_io import FORMATS, ChunkWriter, iter_table, read_table, write_table
+
+__all__ = [
+    "predict_frame",
+    "predict_chunked",
+    "expand_inputs",
+    "predict_many",
+    "worker_stats",
+    "main",
+]
+
+# model loaded once per pool worker by ``_init_worker``
+_WORKER_MODEL = None
+
+
+def predict_frame(model, df: pd.DataFrame) -> np.ndarray:
+    """Return positive-class probabilities or labels for ``df``."""
+    if hasattr(model, "predict_proba"):
+        return model.predict_proba(df)[:, 1]
+    return model.predict(df)
+
+
+def predict_chunked(
+    model,
+    data: str | Path,
+    out: Path,
+    chunk_size: int,
+    fmt: str | None = None,
+    out_fmt: str | None = None,
+) -> int:
+    """Score ``data`` in ``chunk_size`` row blocks appending to ``out``.
+
+    Only one input chunk and its predictions are held in memory at a time.
+    Returns the number of rows written.
+    """
+    n_rows = 0
+    with ChunkWriter(out, out_fmt) as writer:
+        for chunk in iter_table(data, chunk_size, fmt=fmt):
+            writer.write(pd.DataFrame({"prediction": predict_frame(model, chunk)}))
+            n_rows += len(chunk)
+    if n_rows == 0:
+        write_table(pd.DataFrame({"prediction": []}), out, out_fmt)
+    return n_rows
+
+
+def expand_inputs(data: str | Path) -> list[Path]:
+    """Return the sorted input files named by ``data``.
+
+    ``data`` may be a single file, a directory (every CSV, Parquet or Arrow
+    file directly inside it) or a glob pattern such as ``"parts/*.parquet"``.
+    """
+    data = str(data)
+    if os.path.isdir(data):
+        files = [p for p in Path(data).iterdir() if p.suffix.lower() in FORMATS]
+    elif glob.has_magic(data):
+        files = [Path(p) for p in glob.glob(data) if os.path.isfile(p)]
+    else:
+        files = [Path(data)]
+    if not files:
+        raise FileNotFoundError(f"no input files match {data}")
+    return sorted(files)
+
+
+def _init_worker(model_path: str | None) -> None:
+    global _WORKER_MODEL
+    # mmap_mode shares the pages of uncompressed array payloads across workers
+    _WORKER_MODEL = (
+        None if model_path is None else joblib.load(model_path, mmap_mode="r")
+    )
+
+
+def _predict_file(model, path, chunk_size: int | None, fmt: str | None) -> np.ndarray:
+    """Return predictions for ``path``, read in ``chunk_size`` row blocks."""
+    if chunk_size is None:
+        return predict_frame(model, read_table(path, fmt=fmt))
+    preds = [predict_frame(model, c) for c in iter_table(path, chunk_size, fmt=fmt)]
+    return np.concatenate(preds) if preds else np.empty(0)
+
+
+def _score_file(task: tuple) -> dict:
+    path, out_path, chunk_size, fmt, out_fmt = task
+    t0 = time.perf_counter()
+    pred = None
+    if out_path is None:
+        pred = _predict_file(_WORKER_MODEL, path, chunk_size, fmt)
+        n_rows = len(pred)
+    elif chunk_size is not None:
+        n_rows = predict_chunked(
+            _WORKER_MODEL, path, out_path, chunk_size, fmt, out_fmt
+        )
+    else:
+        pred = predict_frame(_WORKER_MODEL, read_table(path, fmt=fmt))
+        write_table(pd.DataFrame({"prediction": pred}), out_path, out_fmt)
+        n_rows, pred = len(pred), None
+    return {
+        "file": str(path),
+        "rows": n_rows,
+        "seconds": time.perf_counter() - t0,
+        "pid": os.getpid(),
+        "prediction": pred,
+    }
+
+
+def _gather(results, out: Path | None, out_fmt: str | None) -> list[dict]:
+    """Return the stats in ``results``, appending merged predictions to ``out``.
+
+    Each file's predictions are written as soon as its result arrives, so
+    only one file's predictions are held at a time.
+    """
+    stats = []
+    if out is None:
+        for s in results:
+            s.pop("prediction")
+            stats.append(s)
+        return stats
+    with ChunkWriter(out, out_fmt) as writer:
+        for s in results:
+            pred = s.pop("prediction")
+            if len(pred):
+                source = Path(s["file"]).name
+                writer.write(pd.DataFrame({"source": source, "prediction": pred}))
+            stats.append(s)
+    if not any(s["rows"] for s in stats):
+        write_table(pd.DataFrame({"source": [], "prediction": []}), out, out_fmt)
+    return stats
+
+
+def predict_many(
+    model_path: str | Path,
+    files: list[Path],
+    out: Path | None = None,
+    out_dir: Path | None = None,
+    n_jobs: int = 1,
+    chunk_size: int | None = None,
+    fmt: str | None = None,
+    out_fmt: str | None = None,
+) -> list[dict]:
+    """Score ``files`` across ``n_jobs`` worker processes.
+
+    Each worker loads ``model_path`` once. With ``out_dir`` every input gets
+    ``<out_dir>/<stem>.<ext>`` (extension from ``out_fmt``, default CSV);
+    otherwise predictions are merged into ``out`` with a ``source`` column, in
+    the sorted order of ``files`` regardless of which worker finished first.
+    ``chunk_size`` streams each input in blocks of that many rows in both
+    modes. Returns one stats record per file.
+    """
+    if out is None and out_dir is None:
+        raise ValueError("either out or out_dir is required")
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer")
+    ext = ".csv" if out_fmt in (None, "csv") else f".{out_fmt}"
+    tasks = [
+        (
+            str(path),
+            None if out_dir is None else str(Path(out_dir) / f"{path.stem}{ext}"),
+            chunk_size,
+            fmt,
+            out_fmt,
+        )
+        for path in files
+    ]
+    merged = out if out_dir is None else None
+    if n_jobs == 1:
+        _init_worker(str(model_path))
+        try:
+            return _gather(map(_score_file, tasks), merged, out_fmt)
+        finally:
+            # do not keep the model alive in the calling process
+            _init_worker(None)
+    with ProcessPoolExecutor(
+        max_workers=min(n_jobs, len(tasks)),
+        initializer=_init_worker,
+        initargs=(str(model_path),),
+    ) as pool:
+        # ``map`` yields in submission order, keeping the output stable
+        return _gather(pool.map(_score_file, tasks), merged, out_fmt)
+
+
+def worker_stats(stats: list[dict]) -> pd.DataFrame:
+    """Summarise per-file ``stats`` as files, rows and rows/s per worker."""
+    df = pd.DataFrame(stats)
+    res = df.groupby("pid").agg(
+        files=("file", "size"), rows=("rows", "sum"), seconds=("seconds", "sum")
+    )
+    res["rows_per_s"] = res["rows"] / res["seconds"]
+    return res.reset_index().rename(columns={"pid": "worker"})
+
 
 def main(args: list[str] | None = None) -> None:
     """CLI entry point applying a trained model to new data."""
@@ -20,27 +212,74 @@ def main(args: list[str] | None = None) -> None:
         "--data",
         type=Path,
         required=True,
-        help="CSV of features for prediction",
+        help=(
+            "CSV, Parquet or Arrow file of features for prediction, or a "
+            "directory or quoted glob of such files"
+        ),
     )
     parser.add_argument(
         "--out",
         type=Path,
         default=Path("predictions.csv"),
-        help="output CSV path",
+        help="output path; format follows the extension",
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        default=None,
+        help="write one prediction file per input here instead of merging",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes for directory or glob input (-1 for all CPUs)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(set(FORMATS.values())),
+        default=None,
+        help="input format (default: from the --data extension)",
+    )
+    parser.add_argument(
+        "--out-format",
+        choices=sorted(set(FORMATS.values())),
+        default=None,
+        help="output format (default: from the --out extension)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="stream the input in blocks of this many rows",
     )
     ns = parser.parse_args(args)
 
+    files = expand_inputs(ns.data)
+    if files != [ns.data] or ns.out_dir is not None:
+        n_jobs = (os.cpu_count() or 1) if ns.jobs == -1 else ns.jobs
+        stats = predict_many(
+            ns.model_path,
+            files,
+            out=None if ns.out_dir else ns.out,
+            out_dir=ns.out_dir,
+            n_jobs=n_jobs,
+            chunk_size=ns.chunk_size,
+            fmt=ns.format,
+            out_fmt=ns.out_format,
+        )
+        print(worker_stats(stats).round(1).to_string(index=False))
+        print(f"Predictions for {len(files)} files written to {ns.out_dir or ns.out}")
+        return
+
     model = joblib.load(ns.model_path)
-    df = pd.read_csv(ns.data)
 
-    if hasattr(model, "predict_proba"):
-        preds = model.predict_proba(df)[:, 1]
+    if ns.chunk_size is not None:
+        predict_chunked(model, ns.data, ns.out, ns.chunk_size, ns.format, ns.out_format)
     else:
-        preds = model.predict(df)
-
-    out_df = pd.DataFrame({"prediction": preds})
-    ns.out.parent.mkdir(parents=True, exist_ok=True)
-    out_df.to_csv(ns.out, index=False)
+        df = read_table(ns.data, fmt=ns.format)
+        out_df = pd.DataFrame({"prediction": predict_frame(model, df)})
+        write_table(out_df, ns.out, ns.out_format)
     print(f"Predictions written to {ns.out}")
 
 
@@ -8,7 +8,6 @@ from typing import Callable, Iterable
 
 import pandas as pd
 
-
 ROOT = Path(".")
 ART = ROOT / "artefacts"
 PLOTS = ROOT / "plots"
@@ -167,19 +166,27 @@ def dump_lr_params(ff) -> None:
     ff.write(", ".join(f"{k}={v}" for k, v in params.items()))
 
 
+def _best_row(df: pd.DataFrame) -> pd.Series:
+    """Return the rank-1 row of a ``cv_results_`` table."""
+    rank = "rank_test_roc_auc" if "rank_test_roc_auc" in df else "rank_test_score"
+    return df[df[rank] == 1].iloc[0]
+
+
+def _param(best: pd.Series, name: str):
+    """Return ``name`` from either ``clf__`` or ``model__`` step naming."""
+    for col in (f"param_clf__{name}", f"param_model__{name}", f"param_{name}"):
+        if col in best:
+            return best[col]
+    return None
+
+
 def dump_cart_params(ff) -> None:
     p = read_latest_glob("cv_results_tree_cart_*.csv")
     if not p:
         raise FileNotFoundError("no CART CV results")
-    df = pd.read_csv(p)
-    best = df[df["rank_test_roc_auc"] == 1].iloc[0]
-    params = {
-        "max_depth": best["param_clf__max_depth"],
-        "min_samples_leaf": best["param_clf__min_samples_leaf"],
-        "ccp_alpha": best["param_clf__ccp_alpha"],
-        "class_weight": best["param_clf__class_weight"],
-        "sampler": best["param_sampler"],
-    }
+    best = _best_row(pd.read_csv(p))
+    names = ["max_depth", "min_samples_leaf", "ccp_alpha", "class_weight", "sampler"]
+    params = {name: _param(best, name) for name in names}
     ff.write(", ".join(f"{k}={v}" for k, v in params.items()))
 
 
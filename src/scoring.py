@@ -0,0 +1,133 @@
+"""End-to-end scoring artefact bundling cleaning, features and model."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.utils.validation import check_is_fitted
+
+from .dataprep import clean
+from .feature_graph import transform_columns
+from .features import FeatureEngineer
+from .split import stratified_split
+
+__all__ = ["ScoringModel", "training_engineer", "unwrap"]
+
+
+class ScoringModel:
+    """Score raw loan applications with a fitted model pipeline.
+
+    Wraps ``pipeline`` (fitted on ``FeatureEngineer().transform(clean(df))``
+    output) so callers can pass rows exactly as they appear in the raw CSV.
+    Scoring never drops rows: only the column and target normalisation from
+    :func:`~src.dataprep.clean` is applied before feature engineering.
+
+    ``feature_engineer`` must be fitted on the training rows so each batch is
+    imputed and encoded with training statistics rather than its own; an
+    unfitted one would score a row differently alone and inside a batch, so
+    scoring and saving raise :class:`~sklearn.exceptions.NotFittedError`.
+    """
+
+    def __init__(
+        self, pipeline, feature_engineer: FeatureEngineer | None = None
+    ) -> None:
+        self.pipeline = pipeline
+        self.feature_engineer = feature_engineer or FeatureEngineer()
+
+    @property
+    def feature_names_in_(self) -> np.ndarray | None:
+        """Columns the wrapped pipeline was fitted on."""
+        return getattr(self.pipeline, "feature_names_in_", None)
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self.pipeline.classes_
+
+    def _check_fitted(self) -> None:
+        check_is_fitted(
+            self.feature_engineer,
+            ["loan_median_", "term_median_", "categories_"],
+            msg="ScoringModel needs a FeatureEngineer fitted on the training rows.",
+        )
+
+    def prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return model-ready features for raw ``df`` in one pass.
+
+        When the pipeline records ``feature_names_in_`` only the engineered
+        features it uses are computed (see :mod:`src.feature_graph`).
+        """
+        self._check_fitted()
+        df = clean(df, drop_rows=False)
+        cols = self.feature_names_in_
+        if cols is None:
+            return self.feature_engineer.transform(df)
+        return transform_columns(self.feature_engineer, df, cols)
+
+    def predict_proba(self, df: pd.DataFrame) -> np.ndarray:
+        return self.pipeline.predict_proba(self.prepare(df))
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        return self.pipeline.predict(self.prepare(df))
+
+    def score(self, df: pd.DataFrame) -> np.ndarray:
+        """Return positive-class probabilities for raw ``df``."""
+        return self.predict_proba(df)[:, 1]
+
+    def save(self, path: str | Path) -> Path:
+        """Persist the bundle with :mod:`joblib` and return ``path``."""
+        self._check_fitted()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        joblib.dump(self, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ScoringModel":
+        """Return the bundle saved at ``path``.
+
+        Raises ``TypeError`` for a bare pipeline saved before bundles carried
+        their fitted feature engineer: such artefacts cannot score raw rows
+        and have to be retrained.
+        """
+        obj = joblib.load(Path(path))
+        if not isinstance(obj, cls):
+            raise TypeError(
+                f"{path} holds a {type(obj).__name__}, not a ScoringModel bundle; "
+                "retrain it to score raw rows"
+            )
+        return obj
+
+
+def training_engineer(
+    cleaned: pd.DataFrame | None, y: pd.Series | None = None
+) -> FeatureEngineer:
+    """Return a :class:`FeatureEngineer` fitted on training rows of ``cleaned``.
+
+    ``cleaned`` holds the :func:`~src.dataprep.clean` rows a training frame
+    was engineered from, in the same order. With ``y``, that frame's target,
+    only the rows :func:`~src.split.stratified_split` puts in its training
+    split are used.
+    """
+    if cleaned is None:
+        raise ValueError(
+            "saving a scoring bundle needs the cleaned rows the features were "
+            "engineered from; pass cleaned="
+        )
+    if y is not None:
+        if len(y) != len(cleaned):
+            raise ValueError(
+                f"cleaned has {len(cleaned)} rows but the features have {len(y)}"
+            )
+        cleaned, _, _ = stratified_split(
+            cleaned.assign(_target=y.to_numpy()), "_target"
+        )
+        cleaned = cleaned.drop(columns="_target")
+    return FeatureEngineer().fit(cleaned)
+
+
+def unwrap(model):
+    """Return the fitted pipeline inside ``model`` if it is a bundle."""
+    return model.pipeline if isinstance(model, ScoringModel) else model
@@ -0,0 +1,260 @@
+"""Resident HTTP scoring server with request micro-batching."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Sequence
+
+import joblib
+import pandas as pd
+
+from .predict import predict_frame
+from .scoring import ScoringModel
+
+__all__ = ["MicroBatcher", "load_models", "make_server", "main"]
+
+
+class MicroBatcher:
+    """Group concurrent single-row requests into vectorised model calls.
+
+    A background thread waits for the first queued row, then keeps collecting
+    rows until ``max_batch_size`` is reached or ``max_wait_ms`` has elapsed and
+    scores them with one :func:`~src.predict.predict_frame` call.
+    """
+
+    def __init__(
+        self, model, max_batch_size: int = 64, max_wait_ms: float = 2.0
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.n_batches = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, row: dict) -> Future:
+        """Queue ``row`` for scoring and return a future for its prediction."""
+        if self._stop.is_set():
+            raise RuntimeError("MicroBatcher is closed")
+        fut: Future = Future()
+        self._queue.put((row, fut))
+        return fut
+
+    def predict(self, rows: Sequence[dict], timeout: float | None = None) -> list:
+        """Score ``rows`` through the batch queue and wait for the results."""
+        futures = [self.submit(r) for r in rows]
+        return [f.result(timeout) for f in futures]
+
+    def close(self) -> None:
+        """Stop the worker thread once queued rows are scored."""
+        self._stop.set()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self) -> list[tuple[dict, Future]] | None:
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            self._score(batch)
+
+    def _score(self, batch: list[tuple[dict, Future]]) -> None:
+        rows = [r for r, _ in batch]
+        try:
+            preds = predict_frame(self.model, pd.DataFrame.from_records(rows))
+        except Exception:
+            # fall back to per-row scoring so one malformed row does not fail
+            # every request that happened to share its batch
+            for row, fut in batch:
+                try:
+                    pred = predict_frame(self.model, pd.DataFrame([row]))[0]
+                    fut.set_result(pred.item())
+                except Exception as exc:
+                    fut.set_exception(exc)
+            return
+        self.n_batches += 1
+        for (_, fut), pred in zip(batch, preds):
+            fut.set_result(pred.item())
+
+
+def load_models(paths: Sequence[str | Path]) -> dict[str, object]:
+    """Return fitted models from ``paths`` keyed by file stem.
+
+    Directories are scanned for ``*.joblib`` files holding a
+    :class:`~src.scoring.ScoringModel` bundle; other artefacts there, such
+    as ``*_calibrated.joblib`` models or bare pipelines, are skipped. A file
+    path is loaded as given.
+    """
+    models: dict[str, object] = {}
+    for p in paths:
+        p = Path(p)
+        if p.is_dir():
+            for fp in sorted(p.glob("*.joblib")):
+                model = joblib.load(fp)
+                if isinstance(model, ScoringModel):
+                    models[fp.stem] = model
+        else:
+            models[p.stem] = joblib.load(p)
+    if not models:
+        raise FileNotFoundError(f"no model bundles found in {list(paths)}")
+    return models
+
+
+def _handler(batchers: dict[str, MicroBatcher], timeout: float):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if self.path.rstrip("/") == "/health":
+                self._reply(200, {"models": sorted(batchers)})
+            else:
+                self._reply(404, {"error": f"unknown path {self.path}"})
+
+        def do_POST(self) -> None:  # noqa: N802 - http.server API
+            parts = self.path.strip("/").split("/")
+            if len(parts) != 2 or parts[0] != "predict":
+                self._reply(404, {"error": f"unknown path {self.path}"})
+                return
+            batcher = batchers.get(parts[1])
+            if batcher is None:
+                self._reply(404, {"error": f"unknown model {parts[1]}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+            except (ValueError, json.JSONDecodeError) as exc:
+                self._reply(400, {"error": f"invalid JSON: {exc}"})
+                return
+            rows = payload if isinstance(payload, list) else [payload]
+            if not all(isinstance(r, dict) for r in rows):
+                self._reply(400, {"error": "expected an object or list of objects"})
+                return
+            try:
+                preds = batcher.predict(rows, timeout)
+            except Exception as exc:
+                self._reply(500, {"error": str(exc)})
+                return
+            result = preds if isinstance(payload, list) else preds[0]
+            self._reply(200, {"prediction": result})
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # the default backlog of 5 drops connections under concurrent load
+    request_queue_size = 128
+
+
+def make_server(
+    models: dict[str, object],
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    *,
+    max_batch_size: int = 64,
+    max_wait_ms: float = 2.0,
+    timeout: float = 30.0,
+) -> ThreadingHTTPServer:
+    """Return HTTP server scoring ``models`` through per-model batchers.
+
+    ``POST /predict/<name>`` accepts a JSON object (one row) or a list of
+    objects. ``GET /health`` lists the loaded model names.
+    """
+    batchers = {
+        name: MicroBatcher(m, max_batch_size, max_wait_ms) for name, m in models.items()
+    }
+    server = _Server((host, port), _handler(batchers, timeout))
+    server.batchers = batchers
+    return server
+
+
+def main(args: list[str] | None = None) -> None:
+    """CLI entry point serving saved models over local HTTP."""
+    parser = argparse.ArgumentParser(description="Serve saved models over HTTP")
+    parser.add_argument(
+        "models",
+        nargs="*",
+        type=Path,
+        default=[Path("artefacts")],
+        help="joblib model files, or directories whose ScoringModel bundles "
+        "are served (default: artefacts/)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="bind address")
+    parser.add_argument("--port", type=int, default=8000, help="bind port")
+    parser.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=64,
+        help="largest number of rows scored in one call",
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=2.0,
+        help="how long to wait for a batch to fill",
+    )
+    ns = parser.parse_args(args)
+
+    server = make_server(
+        load_models(ns.models),
+        ns.host,
+        ns.port,
+        max_batch_size=ns.max_batch_size,
+        max_wait_ms=ns.max_wait_ms,
+    )
+    host, port = server.server_address[:2]
+    print(f"Serving {', '.join(sorted(server.batchers))} on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for b in server.batchers.values():
+            b.close()
+
+
+if __name__ == "__main__":
+    main()
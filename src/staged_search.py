@@ -0,0 +1,497 @@
+"""Grid searches that share work along one parameter of the grid.
+
+The ``n_estimators`` candidates of a tree-ensemble grid differ only in how
+many trees are built. :class:`StagedGridSearchCV` fits the largest size once
+per (other parameters, fold) and scores each smaller size ``k`` from the same
+model: the average of the first ``k`` trees for a random forest and stage
+``k`` of ``staged_predict_proba`` for gradient boosting. With a fixed
+``random_state`` both equal a model fitted with ``n_estimators=k``, so the
+scores match :class:`~sklearn.model_selection.GridSearchCV` on the same grid.
+
+:class:`PathGridSearchCV` does the same for a regularisation path: per
+(other parameters, fold) the preprocessing and sampler steps are fitted once
+and the model is fitted along the increasing ``C`` values with warm starts,
+as :class:`~sklearn.linear_model.LogisticRegressionCV` does.
+
+:class:`PrunedTreeSearchCV` grows one unpruned decision tree per (other
+parameters, fold) and scores every ``ccp_alpha`` by pruning it in the
+weakest-link order of ``cost_complexity_pruning_path``, which gives the
+tree a refit with that ``ccp_alpha`` would grow.
+
+With ``stage_param=None`` :class:`StagedGridSearchCV` fits every candidate
+on its own, an exhaustive grid search that can be checkpointed: given a
+``checkpoint`` directory every search writes each (parameter group, fold)
+result there as it finishes and a rerun on the same data, estimator, grid
+and splits only fits what is missing.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+from joblib import Parallel, delayed
+from scipy.stats import rankdata
+from sklearn.base import clone
+from sklearn.metrics import check_scoring, roc_auc_score
+from sklearn.model_selection import GridSearchCV, ParameterGrid, check_cv
+from sklearn.utils import _safe_indexing, check_array
+
+from .checkpoint import ResultsStore, estimator_key, run_unit
+
+__all__ = [
+    "StagedGridSearchCV",
+    "PathGridSearchCV",
+    "PrunedTreeSearchCV",
+    "staged_proba",
+    "pruned_proba",
+]
+
+
+def staged_proba(estimator, X, sizes: Sequence[int]) -> list[np.ndarray]:
+    """Return ``predict_proba`` of the first ``k`` members for each ``k``.
+
+    ``estimator`` is a fitted forest or boosting model, or a pipeline ending
+    in one (earlier steps transform ``X``; samplers are skipped).
+    """
+    model = estimator
+    if hasattr(estimator, "steps"):
+        model = estimator[-1]
+        X = _transform_prefix(estimator, X)
+    wanted = set(sizes)
+    found: dict[int, np.ndarray] = {}
+    if hasattr(model, "staged_predict_proba"):
+        for k, proba in enumerate(model.staged_predict_proba(X), start=1):
+            if k in wanted:
+                found[k] = proba
+    elif hasattr(model, "estimators_"):
+        X = check_array(X, dtype=np.float32, accept_sparse="csr")
+        total = 0.0
+        for k, tree in enumerate(model.estimators_, start=1):
+            total = total + tree.predict_proba(X, check_input=False)
+            if k in wanted:
+                found[k] = total / k
+    else:
+        raise TypeError(f"{type(model).__name__} has no staged predictions")
+    missing = wanted - set(found)
+    if missing:
+        raise ValueError(f"model has fewer members than {sorted(missing)}")
+    return [found[k] for k in sizes]
+
+
+# the *_scores functions score one group of candidates on one fold and
+# return (scores, fit seconds, score seconds) for the whole group
+
+
+def _stage_scores(estimator, X, y, train, test, params, stage_param, sizes):
+    est = clone(estimator).set_params(**params, **{stage_param: max(sizes)})
+    start = time.perf_counter()
+    est.fit(_safe_indexing(X, train), _safe_indexing(y, train))
+    fit_time = time.perf_counter() - start
+    y_test = _safe_indexing(y, test)
+    pos = est.classes_[1]
+    probas = staged_proba(est, _safe_indexing(X, test), sizes)
+    scores = [roc_auc_score(y_test == pos, proba[:, 1]) for proba in probas]
+    return scores, fit_time, time.perf_counter() - start - fit_time
+
+
+def _fit_prefix(pipe, X, y):
+    """Fit every step of ``pipe`` but the last and return the training data."""
+    for _, step in pipe.steps[:-1]:
+        if step is None or step == "passthrough":
+            continue
+        if hasattr(step, "fit_resample"):
+            X, y = step.fit_resample(X, y)
+        else:
+            X = step.fit_transform(X, y)
+    return X, y
+
+
+def _transform_prefix(pipe, X):
+    """Apply the fitted non-final steps of ``pipe``; samplers are skipped."""
+    for _, step in pipe.steps[:-1]:
+        if step is not None and step != "passthrough" and hasattr(step, "transform"):
+            X = step.transform(X)
+    return X
+
+
+def _path_scores(estimator, X, y, train, test, params, path_param, values):
+    est = clone(estimator).set_params(**params)
+    X_train, y_train = _safe_indexing(X, train), _safe_indexing(y, train)
+    X_test, y_test = _safe_indexing(X, test), _safe_indexing(y, test)
+    model = est
+    fit_time = score_time = 0.0
+    if hasattr(est, "steps"):
+        model = est.steps[-1][1]
+        start = time.perf_counter()
+        X_train, y_train = _fit_prefix(est, X_train, y_train)
+        fitted = time.perf_counter()
+        X_test = _transform_prefix(est, X_test)
+        fit_time, score_time = fitted - start, time.perf_counter() - fitted
+    if "warm_start" in model.get_params():
+        model.set_params(warm_start=True)
+    name = path_param.rpartition("__")[2]
+    scores = []
+    for value in values:
+        start = time.perf_counter()
+        model.set_params(**{name: value}).fit(X_train, y_train)
+        fitted = time.perf_counter()
+        proba = model.predict_proba(X_test)[:, 1]
+        scores.append(roc_auc_score(y_test == model.classes_[1], proba))
+        fit_time += fitted - start
+        score_time += time.perf_counter() - fitted
+    return scores, fit_time, score_time
+
+
+def _fit_scores(estimator, X, y, train, test, params, stage_param, values):
+    est = clone(estimator).set_params(**params)
+    start = time.perf_counter()
+    est.fit(_safe_indexing(X, train), _safe_indexing(y, train))
+    fit_time = time.perf_counter() - start
+    scorer = check_scoring(est, "roc_auc")
+    score = scorer(est, _safe_indexing(X, test), _safe_indexing(y, test))
+    return [score], fit_time, time.perf_counter() - start - fit_time
+
+
+def _collapse_alphas(tree) -> np.ndarray:
+    """Return the ``ccp_alpha`` from which each node of ``tree`` is a leaf.
+
+    Replays minimal cost-complexity pruning: the internal node with the
+    smallest effective alpha is collapsed until only the root is left.
+    Leaves get 0; nodes removed with an ancestor keep ``inf``.
+    """
+    t = tree.tree_
+    left, right = t.children_left, t.children_right
+    n = t.node_count
+    parent = np.full(n, -1)
+    internal = left != -1
+    parent[left[internal]] = np.flatnonzero(internal)
+    parent[right[internal]] = np.flatnonzero(internal)
+    # same operation order as sklearn so path alphas compare exactly
+    w = t.weighted_n_node_samples
+    r_node = w * t.impurity / w[0]
+    r_branch = np.zeros(n)
+    n_leaves = np.zeros(n, dtype=np.int64)
+    for leaf in np.flatnonzero(~internal):
+        node = leaf
+        while node != -1:
+            r_branch[node] += r_node[leaf]
+            n_leaves[node] += 1
+            node = parent[node]
+
+    collapse = np.where(internal, np.inf, 0.0)
+    active = internal.copy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while active.any():
+            g = np.where(active, (r_node - r_branch) / (n_leaves - 1), np.inf)
+            node = int(np.argmin(g))
+            collapse[node] = g[node]
+            # drop the node and everything below it from later rounds
+            stack = [node]
+            while stack:
+                cur = stack.pop()
+                active[cur] = False
+                if internal[cur]:
+                    stack.extend((left[cur], right[cur]))
+            diff, pruned = r_node[node] - r_branch[node], n_leaves[node] - 1
+            anc = node
+            while anc != -1:
+                r_branch[anc] += diff
+                n_leaves[anc] -= pruned
+                anc = parent[anc]
+    return collapse
+
+
+def pruned_proba(tree, X, alphas: Sequence[float]) -> list[np.ndarray]:
+    """Return ``predict_proba`` of fitted ``tree`` pruned at each alpha.
+
+    Equals refitting with ``ccp_alpha=alpha`` (same data and random state)
+    without growing another tree. ``tree`` may be a pipeline ending in a
+    :class:`~sklearn.tree.DecisionTreeClassifier`.
+    """
+    if hasattr(tree, "steps"):
+        X = _transform_prefix(tree, X)
+        tree = tree.steps[-1][1]
+    t = tree.tree_
+    collapse = _collapse_alphas(tree)
+    left, right = t.children_left, t.children_right
+    internal = np.flatnonzero(left != -1)
+    value = t.value[:, 0, :]
+    value = value / value.sum(axis=1, keepdims=True)
+    leaves = tree.apply(X)
+
+    # nodes level by level so every parent is resolved before its children
+    levels, frontier = [], np.array([0])
+    while frontier.size:
+        kids = frontier[np.isin(frontier, internal)]
+        frontier = np.concatenate([left[kids], right[kids]])
+        if frontier.size:
+            levels.append((frontier, np.concatenate([kids, kids])))
+
+    out = []
+    for alpha in alphas:
+        # rep[n]: the highest ancestor of n (or n) that is a leaf at alpha
+        rep = np.arange(t.node_count)
+        for nodes, parents in levels:
+            top = rep[parents]
+            cut = (top != parents) | (collapse[parents] <= alpha)
+            rep[nodes] = np.where(cut, top, nodes)
+        out.append(value[rep[leaves]])
+    return out
+
+
+def _prune_scores(estimator, X, y, train, test, params, alpha_param, alphas):
+    est = clone(estimator).set_params(**params, **{alpha_param: 0.0})
+    start = time.perf_counter()
+    est.fit(_safe_indexing(X, train), _safe_indexing(y, train))
+    fit_time = time.perf_counter() - start
+    y_test = _safe_indexing(y, test)
+    pos = est.classes_[1]
+    probas = pruned_proba(est, _safe_indexing(X, test), alphas)
+    scores = [roc_auc_score(y_test == pos, proba[:, 1]) for proba in probas]
+    return scores, fit_time, time.perf_counter() - start - fit_time
+
+
+def _rank(mean: np.ndarray) -> np.ndarray:
+    """Return ranks as ``GridSearchCV`` does: ties share the lowest rank."""
+    if np.isnan(mean).all():
+        return np.ones(len(mean), dtype=np.int32)
+    # NaN scores rank last
+    mean = np.where(np.isnan(mean), np.nanmin(mean) - 1, mean)
+    return rankdata(-mean, method="min").astype(np.int32)
+
+
+class StagedGridSearchCV(GridSearchCV):
+    """ROC-AUC grid search sharing one ensemble fit across ``stage_param``.
+
+    Only :meth:`fit` differs from :class:`~sklearn.model_selection.GridSearchCV`.
+    It sets ``cv_results_`` (``params``, ``param_<name>``,
+    ``split<i>_test_score``, ``mean_test_score``, ``std_test_score``,
+    ``rank_test_score``, ``mean_fit_time``, ``std_fit_time``,
+    ``mean_score_time``, ``std_score_time``), ``best_index_``,
+    ``best_params_``, ``best_score_``, ``best_estimator_`` and ``n_splits_``,
+    so prediction, scoring and result tables work as they do for a grid
+    search. Tied candidates share the lowest rank. A fit or scoring pass
+    shared by several candidates has its time split evenly between them.
+    ``stage_param=None`` fits each candidate separately. With
+    ``checkpoint`` finished (group, fold) scores are kept in that directory
+    and reused by the next fit on the same inputs.
+    """
+
+    def __init__(
+        self,
+        estimator,
+        param_grid: dict | list[dict],
+        *,
+        stage_param: str = "model__n_estimators",
+        cv=5,
+        n_jobs: int | None = None,
+        refit: bool = True,
+        checkpoint: str | Path | None = None,
+    ) -> None:
+        super().__init__(
+            estimator,
+            param_grid,
+            scoring="roc_auc",
+            n_jobs=n_jobs,
+            refit=refit,
+            cv=cv,
+        )
+        self.stage_param = stage_param
+        self.checkpoint = checkpoint
+
+    def _groups(self, X, y) -> list[tuple[dict, list]]:
+        blocks = (
+            [self.param_grid] if isinstance(self.param_grid, dict) else self.param_grid
+        )
+        if self.stage_param is None:
+            return [(base, [None]) for blk in blocks for base in ParameterGrid(blk)]
+        default = self.estimator.get_params()[self.stage_param]
+        groups = []
+        for blk in blocks:
+            sizes = sorted(blk.get(self.stage_param, [default]))
+            rest = {k: v for k, v in blk.items() if k != self.stage_param}
+            groups.extend((base, sizes) for base in ParameterGrid(rest))
+        return groups
+
+    # scores one group of candidates on one fold; overridden by subclasses
+    _group_scores = staticmethod(_stage_scores)
+
+    def _store(self, X, y, splits) -> ResultsStore | None:
+        if self.checkpoint is None:
+            return None
+        skip = {"estimator", "cv", "n_jobs", "refit", "checkpoint"}
+        search = {k: v for k, v in self.get_params(deep=False).items() if k not in skip}
+        return ResultsStore(
+            self.checkpoint,
+            type(self).__name__,
+            search,
+            estimator_key(self.estimator),
+            X,
+            y,
+            splits,
+        )
+
+    def fit(self, X, y) -> "StagedGridSearchCV":
+        cv = check_cv(self.cv, y, classifier=True)
+        splits = list(cv.split(X, y))
+        groups = self._groups(X, y)
+        score_fn = self._group_scores if self.stage_param else _fit_scores
+        store = self._store(X, y, splits)
+        tasks = {
+            f"g{g:04d}_s{i:03d}": (train, test, base, self.stage_param, sizes)
+            for g, (base, sizes) in enumerate(groups)
+            for i, (train, test) in enumerate(splits)
+        }
+        done = {n: store.get(n) for n in tasks if store is not None and n in store}
+        todo = [n for n in tasks if n not in done]
+        computed = Parallel(n_jobs=self.n_jobs)(
+            delayed(run_unit)(store, name, score_fn, self.estimator, X, y, *tasks[name])
+            for name in todo
+        )
+        done.update(zip(todo, computed))
+        units = [done[n] for n in tasks]
+
+        params, rows, fit_times, score_times = [], [], [], []
+        for g, (base, sizes) in enumerate(groups):
+            start, stop = g * len(splits), (g + 1) * len(splits)
+            fold_scores = np.asarray([u[0] for u in units[start:stop]])
+            fold_fit = np.asarray([u[1] for u in units[start:stop]]) / len(sizes)
+            fold_score = np.asarray([u[2] for u in units[start:stop]]) / len(sizes)
+            for j, k in enumerate(sizes):
+                stage = {self.stage_param: k} if self.stage_param else {}
+                params.append({**base, **stage})
+                rows.append(fold_scores[:, j])
+                fit_times.append(fold_fit)
+                score_times.append(fold_score)
+        split_scores = np.vstack(rows)
+        mean = split_scores.mean(axis=1)
+        rank = _rank(mean)
+        fit_times, score_times = np.vstack(fit_times), np.vstack(score_times)
+
+        results: dict = {
+            "mean_fit_time": fit_times.mean(axis=1),
+            "std_fit_time": fit_times.std(axis=1),
+            "mean_score_time": score_times.mean(axis=1),
+            "std_score_time": score_times.std(axis=1),
+        }
+        for name in sorted({k for p in params for k in p}):
+            results[f"param_{name}"] = [p.get(name) for p in params]
+        results["params"] = params
+        for i in range(len(splits)):
+            results[f"split{i}_test_score"] = split_scores[:, i]
+        results["mean_test_score"] = mean
+        results["std_test_score"] = split_scores.std(axis=1)
+        results["rank_test_score"] = rank
+        self.cv_results_ = results
+        self.n_splits_ = len(splits)
+        self.multimetric_ = False
+        self.scorer_ = check_scoring(self.estimator, "roc_auc")
+        self.best_index_ = int(rank.argmin())
+        self.best_params_ = params[self.best_index_]
+        self.best_score_ = float(mean[self.best_index_])
+        if self.refit:
+            best = clone(self.estimator).set_params(**self.best_params_)
+            self.best_estimator_ = best.fit(X, y)
+        return self
+
+
+class PathGridSearchCV(StagedGridSearchCV):
+    """ROC-AUC grid search fitting ``stage_param`` as a warm-started path.
+
+    For each fold and combination of the other parameters the pipeline's
+    preprocessing and sampler steps are fitted once, then the final model is
+    refitted for each ``stage_param`` value in increasing order, starting
+    from the previous coefficients. Scores match an exhaustive grid search
+    up to the solver tolerance; liblinear ignores warm starts and matches
+    exactly.
+    """
+
+    _group_scores = staticmethod(_path_scores)
+
+    def __init__(
+        self,
+        estimator,
+        param_grid: dict | list[dict],
+        *,
+        stage_param: str = "model__C",
+        cv=5,
+        n_jobs: int | None = None,
+        refit: bool = True,
+        checkpoint: str | Path | None = None,
+    ) -> None:
+        super().__init__(
+            estimator,
+            param_grid,
+            stage_param=stage_param,
+            cv=cv,
+            n_jobs=n_jobs,
+            refit=refit,
+            checkpoint=checkpoint,
+        )
+
+
+class PrunedTreeSearchCV(StagedGridSearchCV):
+    """ROC-AUC grid search scoring ``ccp_alpha`` values by pruning one tree.
+
+    For each fold and combination of the other parameters the pipeline is
+    fitted once with ``ccp_alpha=0`` and every candidate alpha is scored on
+    the tree pruned at that alpha, which is the tree a refit would grow.
+    Grid blocks that do not list ``stage_param`` get ``n_alphas`` candidates
+    taken from the ``cost_complexity_pruning_path`` of a tree grown on all
+    of ``X``.
+    """
+
+    _group_scores = staticmethod(_prune_scores)
+
+    def __init__(
+        self,
+        estimator,
+        param_grid: dict | list[dict],
+        *,
+        stage_param: str = "model__ccp_alpha",
+        n_alphas: int = 20,
+        cv=5,
+        n_jobs: int | None = None,
+        refit: bool = True,
+        checkpoint: str | Path | None = None,
+    ) -> None:
+        super().__init__(
+            estimator,
+            param_grid,
+            stage_param=stage_param,
+            cv=cv,
+            n_jobs=n_jobs,
+            refit=refit,
+            checkpoint=checkpoint,
+        )
+        self.n_alphas = n_alphas
+
+    def _path_alphas(self, params: dict, X, y) -> list[float]:
+        est = clone(self.estimator).set_params(**params)
+        model = est
+        if hasattr(est, "steps"):
+            model = est.steps[-1][1]
+            X, y = _fit_prefix(est, X, y)
+        alphas = model.cost_complexity_pruning_path(X, y).ccp_alphas
+        # the last alpha prunes to the root, which scores 0.5 everywhere
+        alphas = alphas[:-1] if alphas.size > 1 else alphas
+        pick = np.linspace(0, alphas.size - 1, min(self.n_alphas, alphas.size))
+        return sorted({float(alphas[int(round(i))]) for i in pick})
+
+    def _groups(self, X, y) -> list[tuple[dict, list]]:
+        blocks = (
+            [self.param_grid] if isinstance(self.param_grid, dict) else self.param_grid
+        )
+        groups = []
+        for blk in blocks:
+            rest = {k: v for k, v in blk.items() if k != self.stage_param}
+            for base in ParameterGrid(rest):
+                if self.stage_param in blk:
+                    alphas = sorted(blk[self.stage_param])
+                else:
+                    alphas = self._path_alphas(base, X, y)
+                groups.append((base, alphas))
+        return groups
@@ -0,0 +1,159 @@
+"""Format-agnostic table readers and writers (CSV, Parquet, Arrow IPC)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import pandas as pd
+
+__all__ = [
+    "FORMATS",
+    "infer_format",
+    "read_table",
+    "iter_table",
+    "write_table",
+    "ChunkWriter",
+]
+
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def infer_format(path: str | Path, fmt: str | None = None) -> str:
+    """Return ``fmt`` or the format implied by the extension of ``path``.
+
+    Unrecognised extensions are read as CSV, as before this module existed.
+    """
+    if fmt:
+        if fmt not in set(FORMATS.values()):
+            raise ValueError(f"unknown format {fmt!r}")
+        return fmt
+    return FORMATS.get(Path(path).suffix.lower(), "csv")
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "Parquet and Arrow files need pyarrow: pip install pyarrow"
+        ) from exc
+    return pyarrow
+
+
+def read_table(
+    path: str | Path,
+    columns: Sequence[str] | None = None,
+    fmt: str | None = None,
+) -> pd.DataFrame:
+    """Return ``path`` as a ``DataFrame``, reading only ``columns`` if given."""
+    fmt = infer_format(path, fmt)
+    cols = list(columns) if columns is not None else None
+    if fmt == "csv":
+        return pd.read_csv(path, usecols=cols)
+    _pyarrow()
+    if fmt == "parquet":
+        return pd.read_parquet(path, columns=cols)
+    return pd.read_feather(path, columns=cols)
+
+
+def iter_table(
+    path: str | Path,
+    chunk_size: int,
+    columns: Sequence[str] | None = None,
+    fmt: str | None = None,
+    dtype: dict | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``path`` in blocks of at most ``chunk_size`` rows.
+
+    ``dtype`` fixes CSV column dtypes so every block parses alike; Parquet
+    and Arrow files carry their own schema.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    fmt = infer_format(path, fmt)
+    cols = list(columns) if columns is not None else None
+    if fmt == "csv":
+        yield from pd.read_csv(path, usecols=cols, chunksize=chunk_size, dtype=dtype)
+        return
+    pa = _pyarrow()
+    if fmt == "parquet":
+        batches = pa.parquet.ParquetFile(path).iter_batches(
+            batch_size=chunk_size, columns=cols
+        )
+        for batch in batches:
+            yield batch.to_pandas()
+        return
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if cols is not None:
+                batch = batch.select(cols)
+            for start in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(start, chunk_size).to_pandas()
+
+
+def write_table(df: pd.DataFrame, path: str | Path, fmt: str | None = None) -> Path:
+    """Write ``df`` to ``path`` in ``fmt`` (inferred from the extension)."""
+    path = Path(path)
+    fmt = infer_format(path, fmt)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+    else:
+        _pyarrow()
+        if fmt == "parquet":
+            df.to_parquet(path, index=False)
+        else:
+            df.reset_index(drop=True).to_feather(path)
+    return path
+
+
+class ChunkWriter:
+    """Append ``DataFrame`` chunks with a fixed schema to one output file."""
+
+    def __init__(self, path: str | Path, fmt: str | None = None) -> None:
+        self.path = Path(path)
+        self.fmt = infer_format(self.path, fmt)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._sink = None
+        self._writer = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.fmt == "csv":
+            header = self._sink is None
+            if header:
+                self._sink = open(self.path, "w", newline="")
+            df.to_csv(self._sink, index=False, header=header)
+            return
+        pa = _pyarrow()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            if self.fmt == "parquet":
+                self._writer = pa.parquet.ParquetWriter(self.path, table.schema)
+            else:
+                self._sink = pa.OSFile(str(self.path), "wb")
+                self._writer = pa.ipc.new_file(self._sink, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
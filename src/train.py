@@ -7,7 +7,9 @@ from imblearn.combine import SMOTETomek
 from imblearn.over_sampling import SMOTE, SMOTEN, SMOTENC, RandomOverSampler
 from imblearn.under_sampling import RandomUnderSampler
 
+from .feature_cache import load_cleaned
 from .models import cart, gradient_boosting, logreg, random_forest, svm
+from .pipeline_helpers import SEARCHES
 
 
 def main(args: list[str] | None = None) -> None:
@@ -24,7 +26,7 @@ def main(args: list[str] | None = None) -> None:
         "--data-path",
         type=Path,
         default=logreg.DATA_PATH,
-        help="CSV dataset path",
+        help="dataset file, or directory of partition files to ingest",
     )
     parser.add_argument(
         "--sampler",
@@ -45,7 +47,33 @@ def main(args: list[str] | None = None) -> None:
         action="store_true",
         help="use grid search to tune hyperparameters",
     )
+    parser.add_argument(
+        "--search",
+        choices=SEARCHES,
+        default=None,
+        help="hyperparameter search strategy; implies --grid-search "
+        "(halving drops weak candidates early on a reduced budget)",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="tune CART ccp_alpha by pruning one tree per fold; implies "
+        "--grid-search and writes artefacts/cv_results_tree_cart_prune.csv",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="directory saving finished grid-search fits so a rerun resumes; "
+        "implies --grid-search",
+    )
     ns = parser.parse_args(args)
+    if ns.search or ns.prune or ns.checkpoint:
+        ns.grid_search = True
+    if ns.checkpoint and ns.search == "halving":
+        parser.error("--checkpoint needs --search grid")
+    search = ns.search or "grid"
     models = ns.model or ["logreg", "cart", "random_forest", "gboost", "svm"]
 
     sampler_map = {
@@ -65,6 +93,9 @@ def main(args: list[str] | None = None) -> None:
                 df,
                 artefact_path=Path("artefacts/logreg.joblib"),
                 sampler=sampler,
+                search=search,
+                cleaned=load_cleaned(ns.data_path),
+                checkpoint=ns.checkpoint,
             )
             print(f"Validation ROC-AUC: {auc:.3f}")
         else:
@@ -72,28 +103,42 @@ def main(args: list[str] | None = None) -> None:
     if "cart" in models:
         if ns.grid_search:
             df = cart.load_data(ns.data_path)
-            gs = cart.grid_train_from_df(df, sampler=sampler)
+            gs = cart.grid_train_from_df(
+                df,
+                artefact_path=Path("artefacts/cart.joblib") if ns.prune else None,
+                sampler=sampler,
+                search=search,
+                prune=ns.prune,
+                cleaned=load_cleaned(ns.data_path) if ns.prune else None,
+                checkpoint=ns.checkpoint,
+            )
             print(f"Validation ROC-AUC: {gs.best_score_:.3f}")
         else:
             cart.main(ns.data_path, sampler)
     if "random_forest" in models:
         if ns.grid_search:
             df = random_forest.load_data(ns.data_path)
-            gs = random_forest.grid_train_from_df(df, sampler=sampler)
+            gs = random_forest.grid_train_from_df(
+                df, sampler=sampler, search=search, checkpoint=ns.checkpoint
+            )
             print(f"Validation ROC-AUC: {gs.best_score_:.3f}")
         else:
             random_forest.main(ns.data_path, sampler)
     if "gboost" in models:
         if ns.grid_search:
             df = gradient_boosting.load_data(ns.data_path)
-            gs = gradient_boosting.grid_train_from_df(df, sampler=sampler)
+            gs = gradient_boosting.grid_train_from_df(
+                df, sampler=sampler, search=search, checkpoint=ns.checkpoint
+            )
             print(f"Validation ROC-AUC: {gs.best_score_:.3f}")
         else:
             gradient_boosting.main(ns.data_path, sampler)
     if "svm" in models:
         if ns.grid_search:
             df = svm.load_data(ns.data_path)
-            gs = svm.grid_train_from_df(df, sampler=sampler)
+            gs = svm.grid_train_from_df(
+                df, sampler=sampler, search=search, checkpoint=ns.checkpoint
+            )
             print(f"Validation ROC-AUC: {gs.best_score_:.3f}")
         else:
             svm.main(ns.data_path, sampler)
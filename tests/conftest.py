@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path_factory, monkeypatch) -> None:
+    """Keep the feature cache and experiment store out of the working tree.
+
+    Both default to paths relative to the current directory; CLI tests run
+    in subprocesses, which inherit the environment set here.
+    """
+    root = tmp_path_factory.mktemp("mlcls")
+    monkeypatch.setenv("MLCLS_FEATURE_CACHE", str(root / "features"))
+    monkeypatch.setenv("MLCLS_EXPERIMENTS", str(root / "experiments.sqlite"))
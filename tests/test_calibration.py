@@ -73,7 +73,10 @@ def test_cli_calibration(tmp_path) -> None:
     artefacts = tmp_path / "artefacts"
     artefacts.mkdir()
     logreg.train_from_df(
-        df_fe, target="loan_status", artefact_path=artefacts / "logreg.joblib"
+        df_fe,
+        target="loan_status",
+        artefact_path=artefacts / "logreg.joblib",
+        cleaned=df_clean,
     )
 
     env = os.environ.copy()
@@ -44,13 +44,30 @@ def test_grid_train_from_df() -> None:
 
 def test_grid_train_saves_best(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     fp = tmp_path / "model.joblib"
-    grid_train_from_df(df, "target", artefact_path=fp)
+    grid_train_from_df(df, "target", artefact_path=fp, cleaned=cleaned)
     assert fp.exists()
 
 
+def test_grid_train_prune_writes_cv_results(tmp_path) -> None:
+    df = _toy_df(60)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
+    gs = grid_train_from_df(
+        df,
+        "target",
+        artefact_path=tmp_path / "model.joblib",
+        cleaned=cleaned,
+        prune=True,
+    )
+    res = pd.read_csv(tmp_path / "cv_results_tree_cart_prune.csv")
+    assert len(res) == len(gs.cv_results_["params"])
+    assert {"param_model__ccp_alpha", "rank_test_score"} <= set(res.columns)
+    assert gs.best_params_["model__ccp_alpha"] >= 0
+
+
 def test_validate_prep_called(monkeypatch) -> None:
     df = _toy_df()
     df = dataprep.clean(df)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src import staged_search
+from src.checkpoint import ResultsStore, frame_hash
+from src.cv_utils import nested_cv
+from src.evaluate import SCORERS
+from src.manifest import run_grid
+from src.pipeline_helpers import lr_steps, run_gs
+from src.staged_search import StagedGridSearchCV
+
+
+def _data():
+    X, y = make_classification(n_samples=60, n_features=4, random_state=0)
+    return pd.DataFrame(X, columns=list("abcd")), pd.Series(y)
+
+
+def test_results_store_put_get(tmp_path) -> None:
+    store = ResultsStore(tmp_path, "key", np.arange(3))
+    assert "unit" not in store
+    assert store.put("unit", [0.5]) == [0.5]
+    assert "unit" in store and store.get("unit") == [0.5]
+    assert store.names() == ["unit"]
+    assert ResultsStore(tmp_path, "key", np.arange(3)).names() == ["unit"]
+    assert ResultsStore(tmp_path, "key", np.arange(4)).names() == []
+
+
+def test_frame_hash_depends_on_content_only() -> None:
+    X, y = _data()
+    assert frame_hash(X) == frame_hash(X.copy()) == frame_hash(X.iloc[:, :4])
+    assert frame_hash(y) == frame_hash(y.copy())
+    assert frame_hash(X) != frame_hash(X.astype("float32"))
+    assert frame_hash(X) != frame_hash(X.iloc[::-1])
+
+
+def test_checkpointed_search_resumes(tmp_path, monkeypatch) -> None:
+    X, y = _data()
+    pipe = Pipeline([("prep", StandardScaler()), ("model", LogisticRegression())])
+    grid = {"model__C": [0.01, 0.1, 1.0]}
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    ref = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y)
+    first = StagedGridSearchCV(pipe, grid, stage_param=None, cv=cv, checkpoint=tmp_path)
+    first.fit(X, y)
+    np.testing.assert_allclose(
+        first.cv_results_["mean_test_score"], ref.cv_results_["mean_test_score"]
+    )
+    (unit_dir,) = tmp_path.iterdir()
+    units = sorted(unit_dir.glob("*.joblib"))
+    assert len(units) == 9
+    # drop a third of the work as if the run had been killed
+    for path in units[::3]:
+        path.unlink()
+
+    fitted = []
+    fit_scores = staged_search._fit_scores
+
+    def counting(*args):
+        fitted.append(args[5])
+        return fit_scores(*args)
+
+    monkeypatch.setattr(staged_search, "_fit_scores", counting)
+    again = StagedGridSearchCV(pipe, grid, stage_param=None, cv=cv, checkpoint=tmp_path)
+    again.fit(X, y)
+    assert len(fitted) == 3
+    assert again.best_params_ == ref.best_params_
+    np.testing.assert_allclose(
+        again.cv_results_["mean_test_score"], first.cv_results_["mean_test_score"]
+    )
+    assert again.score(X, y) == pytest.approx(ref.score(X, y))
+
+
+def test_run_gs_and_run_grid_checkpoint(tmp_path) -> None:
+    X, y = _data()
+    steps = lr_steps(StandardScaler(), "passthrough")
+    grid = {"model__C": [0.1, 1]}
+    est = LogisticRegression(max_iter=1000)
+    plain = run_gs(X, y, steps, est, grid, n_repeats=1)
+    ckpt = run_gs(X, y, steps, est, grid, n_repeats=1, checkpoint=tmp_path / "gs")
+    again = run_gs(X, y, steps, est, grid, n_repeats=1, checkpoint=tmp_path / "gs")
+    assert ckpt.best_params_ == again.best_params_ == plain.best_params_
+    assert len(list((tmp_path / "gs").iterdir())) == 1
+    with pytest.raises(ValueError):
+        run_gs(X, y, steps, est, grid, search="halving", checkpoint=tmp_path)
+
+    pipe = Pipeline([("prep", StandardScaler()), ("model", est)])
+    cv = StratifiedKFold(3)
+    gs = run_grid(pipe, grid, X, y, cv, "lr", tmp_path, checkpoint=tmp_path / "rg")
+    assert (tmp_path / "cv_results_lr.csv").exists()
+    assert (
+        gs.best_params_
+        == GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y).best_params_
+    )
+
+
+def test_nested_cv_checkpoint_resumes(tmp_path) -> None:
+    X, y = _data()
+    df = X.assign(Loan_Status=y)
+    args = (df, "Loan_Status", LogisticRegression(), {"model__C": [0.1, 1]}, SCORERS)
+    ref, _, _ = nested_cv(*args)
+    first, _, _ = nested_cv(*args, checkpoint=tmp_path)
+    (unit_dir,) = tmp_path.iterdir()
+    (unit_dir / "fold_002.joblib").unlink()
+    again, _, _ = nested_cv(*args, checkpoint=tmp_path)
+    for res in (first, again):
+        np.testing.assert_allclose(res["test_roc_auc"], ref["test_roc_auc"])
+    assert (unit_dir / "fold_002.joblib").exists()
@@ -58,3 +58,16 @@ def test_train_gridsearch(tmp_path) -> None:
         check=True,
     )
     assert "Validation ROC-AUC" in res.stdout
+
+    ckpt = tmp_path / "ckpt"
+    cmd = ["mlcls-train", "--model", "cart", "--checkpoint", str(ckpt)]
+    cmd += ["--data-path", str(csv_path)]
+    first = subprocess.run(
+        cmd, cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+    )
+    (unit_dir,) = ckpt.iterdir()
+    assert len(list(unit_dir.glob("*.joblib"))) > 0
+    again = subprocess.run(
+        cmd, cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+    )
+    assert first.stdout == again.stdout == res.stdout
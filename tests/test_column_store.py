@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.bench_utils import loan_frame
+from src.column_store import load_columns, save_columns, store_size
+from src.dataprep import clean
+from src.features import FeatureEngineer
+
+
+def test_round_trip_engineered_frame(tmp_path) -> None:
+    df = FeatureEngineer().transform(clean(loan_frame(200, 0)))
+    save_columns(df, tmp_path / "store")
+    out = load_columns(tmp_path / "store")
+    pd.testing.assert_frame_equal(out, df)
+    assert store_size(tmp_path / "store") > 0
+
+
+def test_round_trip_extension_dtypes_and_index(tmp_path) -> None:
+    df = pd.DataFrame(
+        {
+            "n": pd.array([1, None, 3], dtype="Int64"),
+            "s": ["a", None, "b"],
+            "c": pd.Categorical(["x", "y", "x"], ordered=True),
+        },
+        index=pd.Index([10, 5, 7], name="id"),
+    )
+    save_columns(df, tmp_path)
+    pd.testing.assert_frame_equal(load_columns(tmp_path), df)
+    pd.testing.assert_frame_equal(load_columns(tmp_path, ["c", "n"]), df[["c", "n"]])
+    with pytest.raises(KeyError):
+        load_columns(tmp_path, ["missing"])
+
+
+def test_memory_mapped_writes_stay_private(tmp_path) -> None:
+    save_columns(pd.DataFrame({"x": np.arange(5.0)}), tmp_path)
+    out = load_columns(tmp_path)
+    out.loc[0, "x"] = 99.0
+    assert load_columns(tmp_path)["x"].iloc[0] == 0.0
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from src import dataprep
+from src.compiled_logreg import LogregPlan, compile_logreg
+from src.features import FeatureEngineer
+from src.models import logreg
+from src.preprocessing import make_preprocessor
+
+
+def _engineered(n: int = 80) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    raw = pd.DataFrame(
+        {
+            "income_annum": rng.normal(200_000, 50_000, n),
+            "loan_amount": rng.normal(100_000, 20_000, n),
+            "loan_term": rng.integers(6, 24, n),
+            "cibil_score": rng.integers(400, 850, n),
+            "education": rng.choice(["Graduate", "Not Graduate"], n),
+            "self_employed": rng.choice(["Yes", "No"], n),
+            "residential_assets_value": rng.uniform(50_000, 150_000, n),
+            "commercial_assets_value": rng.uniform(0, 100_000, n),
+            "luxury_assets_value": rng.uniform(0, 50_000, n),
+            "bank_asset_value": rng.uniform(0, 50_000, n),
+            "no_of_dependents": rng.integers(0, 4, n),
+            "loan_status": rng.choice(["Approved", "Rejected"], n),
+        }
+    )
+    return FeatureEngineer().transform(dataprep.clean(raw))
+
+
+def _fit(df: pd.DataFrame):
+    x, y = df.drop(columns=["loan_status"]), df["loan_status"]
+    cat_cols = x.select_dtypes(include=["object", "category"]).columns.tolist()
+    num_cols = [c for c in x.columns if c not in cat_cols]
+    return logreg.build_pipeline(cat_cols, num_cols).fit(x, y), x
+
+
+def test_plan_matches_predict_proba(tmp_path) -> None:
+    pipe, x = _fit(_engineered())
+    plan = compile_logreg(pipe)
+    expected = pipe.predict_proba(x)
+    assert np.allclose(plan.predict_proba(x), expected, atol=1e-10)
+    records = x.to_dict(orient="records")
+    assert np.allclose(plan.predict_proba(records), expected, atol=1e-10)
+    assert np.allclose(plan.predict_proba(records[0]), expected[:1], atol=1e-10)
+    assert (plan.predict(x) == pipe.predict(x)).all()
+
+    loaded = LogregPlan.load(plan.save(tmp_path / "plan.npz"))
+    assert np.allclose(loaded.predict_proba(x), expected, atol=1e-10)
+
+
+def test_plan_imputer_and_unseen_level() -> None:
+    df = _engineered()
+    x, y = df.drop(columns=["loan_status"]), df["loan_status"]
+    num = [c for c in x.columns if x[c].dtype.kind in "iuf"]
+    prep = make_preprocessor(num, ["education"])
+    model = LogisticRegression(max_iter=1000)
+    pipe = Pipeline([("prep", prep), ("model", model)]).fit(x, y)
+    x_new = x.copy()
+    x_new.loc[0, num[0]] = np.nan
+    x_new.loc[1, "education"] = "PhD"
+    plan = compile_logreg(pipe)
+    assert np.allclose(plan.predict_proba(x_new), pipe.predict_proba(x_new))
+
+
+def test_compile_rejects_non_linear() -> None:
+    pipe, x = _fit(_engineered())
+    pipe.steps[-1] = ("model", DecisionTreeClassifier())
+    with pytest.raises(ValueError):
+        compile_logreg(pipe)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+from imblearn.pipeline import Pipeline
+
+from src.compiled_trees import compile_trees
+
+
+def _data():
+    X, y = make_classification(n_samples=300, n_features=6, random_state=0)
+    return X, y
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        DecisionTreeClassifier(random_state=0),
+        RandomForestClassifier(n_estimators=25, random_state=0),
+        GradientBoostingClassifier(n_estimators=30, random_state=0),
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_plan_exact_parity(model, dtype) -> None:
+    X, y = _data()
+    model.fit(X, y)
+    plan = compile_trees(model, threshold_dtype=dtype)
+    assert plan.threshold.dtype == dtype
+    np.testing.assert_array_equal(plan.predict_proba(X), model.predict_proba(X))
+    np.testing.assert_array_equal(plan.predict(X), model.predict(X))
+
+
+def test_plan_pipeline_and_missing_values() -> None:
+    X, y = _data()
+    X[::7, 0] = np.nan
+    model = RandomForestClassifier(n_estimators=10, random_state=0)
+    pipe = Pipeline([("prep", StandardScaler()), ("model", model)]).fit(X, y)
+    plan = compile_trees(pipe)
+    np.testing.assert_array_equal(plan.predict_proba(X), pipe.predict_proba(X))
+    plan = compile_trees(pipe.named_steps["model"])
+    assert plan.predict_proba(X[:0]).shape == (0, 2)
+
+
+def test_compile_rejects_linear() -> None:
+    X, y = _data()
+    with pytest.raises(ValueError):
+        compile_trees(LogisticRegression().fit(X, y))
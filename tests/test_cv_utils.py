@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 from sklearn.datasets import make_classification
 from sklearn.linear_model import LogisticRegression
+from sklearn.svm import SVC
 
 from src import dataprep
-from src.cv_utils import build_outer_iter, nested_cv
+from src.cv_utils import build_fold_plan, build_outer_iter, nested_cv, worker_budget
 from src.evaluate import SCORERS
 
 
@@ -49,3 +52,44 @@ def test_nested_cv_bootstrap_fallback() -> None:
         bootstrap_iters=2,
     )
     assert len(res["test_roc_auc"]) == 2
+
+
+@pytest.mark.parametrize(
+    "n_jobs, outer_jobs, expected",
+    [(None, None, (1, 1)), (8, None, (6, 1)), (12, None, (6, 2)), (8, 2, (2, 4))],
+)
+def test_worker_budget(n_jobs, outer_jobs, expected) -> None:
+    assert worker_budget(n_jobs, 6, outer_jobs) == expected
+
+
+def test_nested_cv_same_results_for_any_worker_count() -> None:
+    df = _df(20, 20)
+    runs = [
+        nested_cv(
+            df,
+            "Loan_Status",
+            SVC(probability=True),
+            {"model__C": [0.1, 1.0]},
+            SCORERS,
+            n_jobs=n_jobs,
+        )[0]
+        for n_jobs in (1, 2)
+    ]
+    for key in ("test_roc_auc", "test_f1"):
+        np.testing.assert_array_equal(runs[0][key], runs[1][key])
+
+
+def test_fold_plan_matches_unplanned_nested_cv(tmp_path) -> None:
+    df = _df(20, 20)
+    model = LogisticRegression(max_iter=1000, solver="liblinear")
+    grid = {"model__C": [0.1, 1.0]}
+    ref, _, _ = nested_cv(df, "Loan_Status", model, grid, SCORERS)
+    for mmap_dir in (None, tmp_path):
+        plan = build_fold_plan(df, "Loan_Status", mmap_dir=mmap_dir)
+        res, X, y = nested_cv(df, "Loan_Status", model, grid, SCORERS, plan=plan)
+        for name in SCORERS:
+            np.testing.assert_allclose(res[f"test_{name}"], ref[f"test_{name}"])
+        np.testing.assert_allclose(
+            res["estimator"][0].predict_proba(X), ref["estimator"][0].predict_proba(X)
+        )
+    assert isinstance(plan.folds[0].X_train, np.memmap)
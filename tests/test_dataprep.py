@@ -1,3 +1,4 @@
+import pytest
 import pandas as pd
 from src import dataprep
 
@@ -22,3 +23,72 @@ def test_clean_lowercase() -> None:
     )
     cleaned = dataprep.clean(df)
     assert list(cleaned["Loan_Status"]) == [1, 0, 1]
+
+
+def test_clean_keep_rows() -> None:
+    df = pd.DataFrame({" A ": [1, 1, None], "loan_status": ["Y", "Y", "N"]})
+    cleaned = dataprep.clean(df, drop_rows=False)
+    assert len(cleaned) == 3
+    assert list(cleaned.columns) == ["A", "Loan_Status"]
+    assert list(df.columns) == [" A ", "loan_status"]
+
+
+def test_load_typed(tmp_path):
+    csv = tmp_path / "loans.csv"
+    csv.write_text(
+        "loan_id, education, cibil_score, loan_amount, loan_term, loan_status\n"
+        "1, Graduate,700,100,12,Approved\n"
+        "2, Not Graduate,650,,10.5,Rejected\n"
+    )
+    df = dataprep.load_typed(csv)
+    assert df[" education"].dtype == "category"
+    assert df[" cibil_score"].dtype == "int32"
+    # NaN and fractions force the integer columns to float
+    assert df[" loan_amount"].dtype == "float64"
+    assert df[" loan_term"].tolist() == [12.0, 10.5]
+
+    proj = dataprep.load_typed(csv, ["cibil_score", "loan_status"])
+    assert list(proj.columns) == [" cibil_score", " loan_status"]
+    with pytest.raises(KeyError):
+        dataprep.load_typed(csv, ["gender"])
+
+
+def test_clean_chunked_matches_clean(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "A": [1, 2, 1, 3, 2, 4, 5, 4, 6],
+            "B": ["x", "y", "x", None, "y", "z", "w", "z", "v"],
+            "C": [1, 2, 1, 3, 2, 4, 5, 4, None],
+            "loan_status": ["Approved", "Rejected"] * 4 + ["Approved"],
+        }
+    )
+    csv = tmp_path / "raw.csv"
+    df.to_csv(csv, index=False)
+    out = tmp_path / "clean.parquet"
+    stats = dataprep.clean_chunked(csv, out, chunk_size=2)
+    expected = dataprep.clean(dataprep.load_raw(csv)).reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_parquet(out), expected)
+    assert stats == {"rows_in": 9, "na_rows": 2, "duplicates": 2, "rows_out": 5}
+
+
+def test_downcast_and_memory_report():
+    df = pd.DataFrame(
+        {
+            'ratio': [0.5, 1.5, 2.5, 3.5],
+            'flag': [0, 1, 1, 0],
+            'delta': [-3, 200, 5, 0],
+            'ok': [True, False, True, True],
+            'area': ['a', 'b', 'a', 'a'],
+            'target': pd.array([1, 0, None, 1], dtype='Int64'),
+        }
+    )
+    out = dataprep.downcast(df)
+    assert out.dtypes.astype(str).tolist() == [
+        'float32', 'uint8', 'int16', 'uint8', 'category', 'Int64'
+    ]
+    assert out['delta'].tolist() == df['delta'].tolist()
+    report = dataprep.memory_report(df, out)
+    assert report.loc['flag', 'bytes_saved'] == 4 * 7
+    assert report.loc['target', 'bytes_saved'] == 0
+    assert report.loc['total', 'bytes_saved'] == report['bytes_saved'].iloc[:-1].sum()
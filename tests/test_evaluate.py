@@ -48,9 +48,11 @@ def test_cli_evaluate(tmp_path) -> None:
     assert summary.exists()
 
 
-def test_evaluate_models_threshold_zero() -> None:
+def test_evaluate_models_threshold_zero(tmp_path) -> None:
     df = _toy_df()
-    metrics = evaluate.evaluate_models(df, group_col="group", threshold=0.0)
+    metrics = evaluate.evaluate_models(
+        df, csv_path=tmp_path / "metrics.csv", group_col="group", threshold=0.0
+    )
     assert all(metrics["fairness"] == 1.0)
     assert all(metrics["equal_opp"] == 1.0)
     assert all(metrics["eq_odds"] == 0.0)
@@ -15,9 +15,9 @@ def _df() -> pd.DataFrame:
     return dataprep.clean(df)
 
 
-def test_extended_metrics_and_grid() -> None:
+def test_extended_metrics_and_grid(tmp_path) -> None:
     df = _df()
-    metrics = evaluate.evaluate_models(df)
+    metrics = evaluate.evaluate_models(df, csv_path=tmp_path / "metrics.csv")
     for col in ["f1", "recall", "specificity", "bal_acc", "eq_odds"]:
         assert col in metrics.columns
     res, _, _ = nested_cv(
@@ -30,7 +30,11 @@ def test_extended_metrics_and_grid() -> None:
     assert len(res["estimator"][0].cv_results_["params"]) > 1
 
 
-def test_multiple_models_selection() -> None:
+def test_multiple_models_selection(tmp_path) -> None:
     df = _df()
-    metrics = evaluate.evaluate_models(df, models=["random_forest", "gboost", "svm"])
+    metrics = evaluate.evaluate_models(
+        df,
+        csv_path=tmp_path / "metrics.csv",
+        models=["random_forest", "gboost", "svm"],
+    )
     assert set(metrics["model"]) == {"random_forest", "gboost", "svm"}
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+from sklearn.datasets import make_classification
+
+from src import dataprep, evaluate, experiments
+from src.experiments import ExperimentStore, code_version
+
+
+def _df() -> pd.DataFrame:
+    x, y = make_classification(n_samples=40, n_features=4, random_state=1)
+    df = pd.DataFrame(x, columns=[f"f{i}" for i in range(x.shape[1])])
+    df["Loan_Status"] = pd.Series(y).map({1: "Y", 0: "N"})
+    return dataprep.clean(df)
+
+
+def test_store_round_trip(tmp_path) -> None:
+    store = ExperimentStore(tmp_path / "runs.sqlite")
+    key = store.key("abc", "logreg", {"model__C": [1, None]}, 0, {"n_splits": 3})
+    assert store.get(key) is None
+    res = {
+        "test_roc_auc": np.array([0.8, 0.9]),
+        "fit_time": np.array([1.0, 2.0]),
+        "estimator": [{"fitted": True}],
+    }
+    store.put(key, res)
+    store.put(key, res)
+    got = store.get(key)
+    np.testing.assert_array_equal(got["test_roc_auc"], res["test_roc_auc"])
+    np.testing.assert_array_equal(got["fit_time"], res["fit_time"])
+    assert got["estimator"] == [{"fitted": True}]
+    assert store.runs()["model"].tolist() == ["logreg"]
+    other = store.key("abc", "logreg", {"model__C": [1]}, 0, {"n_splits": 3})
+    assert other["key"] != key["key"] and store.get(other) is None
+
+
+def test_evaluate_models_reuses_stored_runs(tmp_path, monkeypatch) -> None:
+    df = _df()
+    db = tmp_path / "runs.sqlite"
+    first = evaluate.evaluate_models(
+        df, csv_path=tmp_path / "m.csv", models=["logreg", "cart"], results_db=db
+    )
+
+    calls = []
+    nested_cv = evaluate.nested_cv
+
+    def counting(df, target, model, *args, **kwargs):
+        calls.append(type(model).__name__)
+        return nested_cv(df, target, model, *args, **kwargs)
+
+    monkeypatch.setattr(evaluate, "nested_cv", counting)
+    again = evaluate.evaluate_models(
+        df, csv_path=tmp_path / "m.csv", models=["logreg", "cart"], results_db=db
+    )
+    assert calls == []
+    pdt.assert_frame_equal(again, first)
+
+    more = evaluate.evaluate_models(
+        df, csv_path=tmp_path / "m.csv", models=["logreg", "svm"], results_db=db
+    )
+    assert calls == ["SVC"]
+    assert more["roc_auc"].iloc[0] == first["roc_auc"].iloc[0]
+
+
+def test_code_version_covers_nested_cv_modules(tmp_path, monkeypatch) -> None:
+    src = Path(experiments.__file__).parent
+    for name in experiments._CODE_FILES:
+        shutil.copy(src / name, tmp_path / name)
+    monkeypatch.setattr(experiments, "__file__", str(tmp_path / "experiments.py"))
+    before = code_version()
+    for name in ("dataprep.py", "staged_search.py", "preprocessing.py"):
+        with open(tmp_path / name, "a") as fh:
+            fh.write("\n# changed\n")
+        assert code_version() != before
+        before = code_version()
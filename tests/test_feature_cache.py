@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+
+from scripts.bench_utils import loan_frame
+from src import column_store, feature_cache
+
+
+def _csv(tmp_path, n=60, seed=0, name="loan.csv"):
+    path = tmp_path / name
+    loan_frame(n, seed).to_csv(path, index=False)
+    return path
+
+
+def test_cache_hit_matches_fresh(tmp_path) -> None:
+    csv = _csv(tmp_path)
+    cache = tmp_path / "cache"
+    fresh = feature_cache.load_features(csv, cache_dir="")
+    first = feature_cache.load_features(csv, cache_dir=cache)
+    assert len(list(cache.iterdir())) == 1
+    second = feature_cache.load_features(csv, cache_dir=cache)
+    pd.testing.assert_frame_equal(fresh, first)
+    pd.testing.assert_frame_equal(fresh, second)
+    # CSVs are parsed with the loan schema dtypes
+    assert fresh["cibil_score"].dtype == "int32"
+    cleaned = feature_cache.load_cleaned(csv, cache_dir="")
+    assert cleaned["education"].dtype == "category"
+
+
+def test_cache_key_tracks_data_and_code(tmp_path, monkeypatch) -> None:
+    csv = _csv(tmp_path)
+    key = feature_cache.cache_key(csv)
+    _csv(tmp_path, seed=1)
+    assert feature_cache.cache_key(csv) != key
+    monkeypatch.setattr(feature_cache, "code_version", lambda: "changed")
+    assert feature_cache.cache_key(csv).endswith("-changed")
+
+
+def test_evict_removes_least_recently_used(tmp_path) -> None:
+    cache = tmp_path / "cache"
+    for i in range(3):
+        csv = _csv(tmp_path, seed=i, name=f"loan{i}.csv")
+        feature_cache.load_features(csv, cache_dir=cache, max_bytes=2**40)
+    entries = sorted(cache.iterdir(), key=lambda p: p.stat().st_mtime)
+    for i, entry in enumerate(entries):
+        os.utime(entry, (i, i))
+    size = column_store.store_size(entries[-1])
+    removed = feature_cache.evict(cache, size)
+    assert removed == entries[:2]
+    assert list(cache.iterdir()) == entries[2:]
+    assert feature_cache.clear_cache(cache) == 1
+
+
+def test_env_disables_cache(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MLCLS_FEATURE_CACHE", "")
+    monkeypatch.chdir(tmp_path)
+    feature_cache.load_features(_csv(tmp_path))
+    assert not (tmp_path / ".cache").exists()
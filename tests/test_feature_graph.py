@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scripts.bench_utils import loan_frame
+from src.dataprep import clean
+from src.feature_graph import NODES, plan, transform_columns
+from src.features import FeatureEngineer
+
+
+def _raw(n: int = 200) -> pd.DataFrame:
+    df = clean(loan_frame(n))
+    rng = np.random.default_rng(0)
+    df["gender"] = rng.choice(["M", "F"], len(df))
+    df.loc[df.index[3], "loan_amount"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("fitted", [False, True])
+def test_transform_columns_matches_full(fitted, compact) -> None:
+    df = _raw()
+    fe = FeatureEngineer(compact=compact)
+    fe = fe.fit(df) if fitted else fe
+    pre = FeatureEngineer(preallocate=True, compact=compact)
+    pre = pre.fit(df) if fitted else pre
+    with pytest.warns(UserWarning):
+        full = fe.transform(df)
+    with pytest.warns(UserWarning):
+        pd.testing.assert_frame_equal(pre.transform(df), full)
+    with pytest.warns(UserWarning):
+        out = transform_columns(fe, df, full.columns)
+    pd.testing.assert_frame_equal(out, full)
+
+    cols = ["dscr", "gender=M", "cibil_score", "asset_diversity_count"]
+    pd.testing.assert_frame_equal(transform_columns(fe, df, cols), full[cols])
+
+
+def test_plan_orders_dependencies() -> None:
+    order = plan(["dscr", "cibil_score", "gender=M"])
+    assert order == ["total_income_month", "emi_amortised", "dscr"]
+    assert set(plan(NODES)) == set(NODES)
+
+
+def test_transform_columns_missing_inputs() -> None:
+    df = _raw(20).drop(columns=["education"])
+    out = transform_columns(FeatureEngineer(), df, ["married=Yes", "log_loan_amount"])
+    assert (out["married=Yes"] == 0).all()
+    with pytest.raises(KeyError):
+        transform_columns(FeatureEngineer(), df, ["graduate_flag"])
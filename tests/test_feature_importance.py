@@ -35,10 +35,10 @@ def _toy_df(n: int = 50) -> pd.DataFrame:
 
 def test_logreg_coeff_csv(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     model_fp = tmp_path / "lr.joblib"
-    train_logreg(df, "target", artefact_path=model_fp)
+    train_logreg(df, "target", artefact_path=model_fp, cleaned=cleaned)
     csv = tmp_path / "coef.csv"
     logreg_coefficients(model_fp, csv)
     assert csv.exists()
@@ -46,10 +46,10 @@ def test_logreg_coeff_csv(tmp_path) -> None:
 
 def test_logreg_shap_png(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     model_fp = tmp_path / "lr.joblib"
-    train_logreg(df, "target", artefact_path=model_fp)
+    train_logreg(df, "target", artefact_path=model_fp, cleaned=cleaned)
     png = tmp_path / "shap.png"
     logreg_coefficients(model_fp, tmp_path / "coef.csv", shap_png_path=png, X=df)
     assert png.exists()
@@ -57,10 +57,10 @@ def test_logreg_shap_png(tmp_path) -> None:
 
 def test_cart_importance_csv(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     model_fp = tmp_path / "cart.joblib"
-    train_cart(df, "target", artefact_path=model_fp)
+    train_cart(df, "target", artefact_path=model_fp, cleaned=cleaned)
     csv = tmp_path / "imp.csv"
     tree_feature_importances(model_fp, csv)
     assert csv.exists()
@@ -68,10 +68,10 @@ def test_cart_importance_csv(tmp_path) -> None:
 
 def test_cart_shap_png(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     model_fp = tmp_path / "cart.joblib"
-    train_cart(df, "target", artefact_path=model_fp)
+    train_cart(df, "target", artefact_path=model_fp, cleaned=cleaned)
     png = tmp_path / "cart_shap.png"
     tree_feature_importances(model_fp, tmp_path / "imp.csv", shap_png_path=png, X=df)
     assert png.exists()
@@ -1,5 +1,8 @@
+import warnings
+
 import pandas as pd
 import pytest
+from src.feature_graph import transform_columns
 from src.features import FeatureEngineer
 
 
@@ -55,19 +58,131 @@ def test_aggregate_assets_and_ratios_and_flag():
             'cibil_score': [580, 650],
         }
     )
-    fe = FeatureEngineer()
+    cols = [
+        'commercial_assets_value',
+        'bank_asset_value',
+        'total_assets',
+        'net_worth',
+        'luxury_asset_ratio',
+        'liquid_asset_ratio',
+        'asset_diversity_count',
+        'highrisk_combo_flag',
+    ]
     with pytest.warns(UserWarning) as rec:
-        df = fe._aggregate_assets(df)
+        df = transform_columns(FeatureEngineer(), df, cols)
     # two missing asset columns should trigger warnings
     assert len(rec) == 2
     assert {'commercial_assets_value', 'bank_asset_value'} <= set(df.columns)
     # totals
     assert df.loc[0, 'total_assets'] == 60
     assert df.loc[0, 'net_worth'] == -30
-    df = fe._asset_ratios(df)
     assert pytest.approx(df.loc[0, 'luxury_asset_ratio']) == 10 / 60
     assert pytest.approx(df.loc[0, 'liquid_asset_ratio']) == 50 / 60
     assert df.loc[0, 'asset_diversity_count'] == 2
-    df = fe._flag_highrisk(df)
     assert df.loc[0, 'highrisk_combo_flag'] == 1
     assert df.loc[1, 'highrisk_combo_flag'] == 0
+
+
+def test_preallocated_transform_matches():
+    df = pd.DataFrame(
+        {
+            'income_annum': [120000.0, 240000.0, None],
+            'loan_amount': [100000.0, 200000.0, 50000.0],
+            'loan_term': [12, 24, 0],
+            'cibil_score': [550, 700, 810],
+            'education': ['Graduate', 'Not Graduate', 'Graduate'],
+            'self_employed': ['No', 'Yes', 'Yes'],
+            'residential_assets_value': [50000, 100000, 0],
+            'luxury_assets_value': [0, 20000, 5000],
+            'gender': ['M', 'F', 'F'],
+            'property_area': ['Urban', 'Rural', 'Semiurban'],
+            'no_of_dependents': [0, 3, 1],
+        }
+    )
+    with pytest.warns(UserWarning):
+        expected = FeatureEngineer().transform(df)
+    with pytest.warns(UserWarning):
+        out = FeatureEngineer(preallocate=True).transform(df)
+    pd.testing.assert_frame_equal(out, expected, check_exact=True)
+    assert 'total_assets' not in df.columns
+
+
+@pytest.mark.parametrize('preallocate', [False, True])
+def test_fitted_transform_is_chunk_consistent(preallocate):
+    df = pd.DataFrame(
+        {
+            'income_annum': [120000.0, 240000.0, 90000.0, 60000.0],
+            'loan_amount': [100000.0, None, 50000.0, 70000.0],
+            'loan_term': [12, 24, 0, 6],
+            'cibil_score': [550, 700, 810, 640],
+            'education': ['Graduate', 'Not Graduate', 'Graduate', 'Graduate'],
+            'self_employed': ['No', 'Yes', 'Yes', 'No'],
+            'residential_assets_value': [50000, 100000, 0, 1],
+            'commercial_assets_value': [0, 0, 0, 0],
+            'luxury_assets_value': [0, 20000, 5000, 0],
+            'bank_asset_value': [0, 0, 0, 0],
+            'property_area': ['Urban', 'Rural', 'Semiurban', 'Rural'],
+            'no_of_dependents': [0, 3, 1, 2],
+        }
+    )
+    fe = FeatureEngineer(preallocate=preallocate).fit(df)
+    full = fe.transform(df)
+    pd.testing.assert_frame_equal(full, FeatureEngineer().transform(df))
+    chunks = pd.concat([fe.transform(df.iloc[:1]), fe.transform(df.iloc[1:])])
+    pd.testing.assert_frame_equal(chunks, full)
+    one = fe.transform(df.iloc[[1]])
+    assert one['emi_simple'].iloc[0] == full['emi_simple'].iloc[1]
+    assert list(one.columns) == list(full.columns)
+
+
+def test_preallocated_fallback_keeps_fitted_state():
+    df = pd.DataFrame(
+        {
+            'income_annum': [120000.0, 240000.0, 90000.0],
+            'loan_amount': [100000.0, None, 50000.0],
+            'loan_term': [12, 0, 6],
+            'cibil_score': [550, 700, 810],
+            'education': ['Graduate', 'Not Graduate', 'Graduate'],
+            'self_employed': ['No', 'Yes', 'Yes'],
+            'residential_assets_value': [50000, 100000, 0],
+            'commercial_assets_value': [0, 0, 0],
+            'luxury_assets_value': [0, 20000, 5000],
+            'bank_asset_value': [0, 0, 0],
+            'property_area': ['Urban', 'Rural', 'Semiurban'],
+            'no_of_dependents': [0, 3, 1],
+        }
+    )
+    # a derived column in the input sends the preallocated path to stepwise
+    row = df.iloc[[1]].assign(total_assets=0.0)
+    expected = FeatureEngineer().fit(df).transform(row)
+    out = FeatureEngineer(preallocate=True).fit(df).transform(row)
+    pd.testing.assert_frame_equal(out, expected)
+    assert 'property_area=Semiurban' in out.columns
+
+
+def test_compact_transform_keeps_auc():
+    from sklearn.metrics import roc_auc_score
+
+    from scripts.bench_utils import loan_frame
+    from src.dataprep import clean
+    from src.models import logreg
+
+    df = clean(loan_frame(1500))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        full = FeatureEngineer().transform(df)
+        compact = FeatureEngineer(compact=True).transform(df)
+    assert compact['graduate_flag'].dtype == 'uint8'
+    assert compact['highrisk_combo_flag'].dtype == 'uint8'
+    assert compact['dscr'].dtype == 'float32'
+    assert compact['education'].dtype == 'category'
+    assert compact.memory_usage(deep=True).sum() < full.memory_usage(deep=True).sum()
+
+    aucs = []
+    for frame in (full, compact):
+        x, y = frame.drop(columns='loan_status'), frame['loan_status']
+        cat = x.select_dtypes(include=['object', 'category']).columns.tolist()
+        pipe = logreg.build_pipeline(cat, [c for c in x.columns if c not in cat])
+        pipe.fit(x, y)
+        aucs.append(roc_auc_score(y, pipe.predict_proba(x)[:, 1]))
+    assert abs(aucs[1] - aucs[0]) < 0.005
@@ -52,10 +52,10 @@ def test_grid_train_from_df() -> None:
 
 def test_grid_train_saves_best(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     fp = tmp_path / "model.joblib"
-    grid_train_from_df(df, "target", artefact_path=fp)
+    grid_train_from_df(df, "target", artefact_path=fp, cleaned=cleaned)
     assert fp.exists()
 
 
@@ -0,0 +1,84 @@
+import os
+
+import pandas as pd
+import pytest
+
+from scripts.bench_utils import loan_frame
+from src import ingest
+from src.dataprep import clean
+from src.features import FeatureEngineer
+from src.ingest import STORE_DIR, IngestStore, load_directory, load_directory_cleaned
+
+pytest.importorskip("pyarrow")
+
+
+def test_ingest_only_processes_new_partitions(tmp_path) -> None:
+    df = loan_frame(300)
+    parts = [df.iloc[:100], pd.concat([df.iloc[100:200], df.iloc[:10]])]
+    parts.append(pd.concat([df.iloc[200:], df.iloc[150:155]]))
+    for i, part in enumerate(parts[:2]):
+        part.to_csv(tmp_path / f"day{i}.csv", index=False)
+
+    assert len(load_directory(tmp_path)) == 200
+    parts[2].to_csv(tmp_path / "day2.csv", index=False)
+    store = IngestStore(tmp_path / STORE_DIR)
+    assert [p.name for p in store.pending(tmp_path.glob("*.csv"))] == ["day2.csv"]
+
+    out = load_directory(tmp_path)
+    store = IngestStore(tmp_path / STORE_DIR)
+    assert [p["rows_out"] for p in store.partitions] == [100, 100, 100]
+    fe = FeatureEngineer().fit(clean(parts[0]))
+    expected = fe.transform(clean(pd.concat(parts, ignore_index=True)))
+    pd.testing.assert_frame_equal(out, expected.reset_index(drop=True))
+    pd.testing.assert_frame_equal(fe.transform(load_directory_cleaned(tmp_path)), out)
+
+
+def test_ingest_rejects_changed_partition(tmp_path) -> None:
+    loan_frame(50).to_csv(tmp_path / "day0.csv", index=False)
+    load_directory(tmp_path)
+    loan_frame(50, seed=1).to_csv(tmp_path / "day0.csv", index=False)
+    with pytest.raises(ValueError):
+        load_directory(tmp_path)
+    store = IngestStore(tmp_path / STORE_DIR)
+    store.reset()
+    assert len(load_directory(tmp_path)) == 50
+
+
+def test_ingest_hashes_only_files_with_new_size_or_mtime(tmp_path, monkeypatch) -> None:
+    loan_frame(50).to_csv(tmp_path / "day0.csv", index=False)
+    load_directory(tmp_path)
+    hashed = []
+    sha256 = ingest.sha256
+    monkeypatch.setattr(ingest, "sha256", lambda p: hashed.append(p) or sha256(p))
+
+    loan_frame(50, seed=1).to_csv(tmp_path / "DAY1.CSV", index=False)
+    assert len(load_directory(tmp_path)) == 100
+    assert [p.name for p in hashed] == ["DAY1.CSV"]
+
+    st = (tmp_path / "day0.csv").stat()
+    os.utime(tmp_path / "day0.csv", ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    load_directory(tmp_path)
+    load_directory(tmp_path)
+    assert [p.name for p in hashed] == ["DAY1.CSV", "day0.csv"]
+
+
+def test_ingest_rerun_after_crash_between_writes(tmp_path, monkeypatch) -> None:
+    df = loan_frame(200)
+    df.iloc[:100].to_csv(tmp_path / "day0.csv", index=False)
+    load_directory(tmp_path)
+    df.iloc[100:].to_csv(tmp_path / "day1.csv", index=False)
+
+    def crash(self) -> None:
+        raise RuntimeError("killed before the manifest was written")
+
+    monkeypatch.setattr(IngestStore, "_save_manifest", crash)
+    with pytest.raises(RuntimeError):
+        load_directory(tmp_path)
+    monkeypatch.undo()
+
+    assert len(load_directory(tmp_path)) == 200
+    store = IngestStore(tmp_path / STORE_DIR)
+    assert [p["rows_out"] for p in store.partitions] == [100, 100]
+    assert sorted(p.name for p in store.root.glob("row_hashes*")) == [
+        "row_hashes-00001.npy"
+    ]
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pandas as pd
+import pytest
 from sklearn.datasets import make_classification
 from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression
 
-from src.pipeline_helpers import lr_steps, tree_steps, run_gs
+from src.pipeline_helpers import fit_cache, lr_steps, tree_steps, run_gs
 
 
 def test_lr_and_tree_steps() -> None:
@@ -32,3 +36,63 @@ def test_run_gs_returns_cv() -> None:
     grid = {"model__C": [0.1, 1]}
     gs = run_gs(X_df, y_ser, steps, LogisticRegression(max_iter=1000), grid)
     assert hasattr(gs, "best_estimator_")
+
+
+def test_run_gs_fit_cache_matches_uncached(tmp_path) -> None:
+    X, y = make_classification(n_samples=60, n_features=4, random_state=0)
+    X_df = pd.DataFrame(X, columns=["a", "b", "c", "d"])
+    steps = lr_steps(StandardScaler(), "passthrough")
+    grid = {"model__C": [0.1, 1, 10]}
+    est = LogisticRegression(max_iter=1000)
+    plain = run_gs(X_df, y, steps, est, grid, n_repeats=1, memory=None)
+    cached = run_gs(X_df, y, steps, est, grid, n_repeats=1, memory=tmp_path)
+    assert cached.best_params_ == plain.best_params_
+    assert cached.cv_results_["mean_test_score"].tolist() == pytest.approx(
+        plain.cv_results_["mean_test_score"].tolist()
+    )
+    assert any(tmp_path.iterdir())
+    auto = run_gs(X_df, y, steps, est, grid, n_repeats=1)
+    assert auto.best_estimator_.memory is None
+    with fit_cache() as location:
+        assert Path(location).is_dir()
+    assert not Path(location).exists()
+
+
+def test_run_gs_halving_drops_candidates() -> None:
+    X, y = make_classification(n_samples=300, n_features=4, random_state=0)
+    X_df = pd.DataFrame(X, columns=["a", "b", "c", "d"])
+    steps = tree_steps(StandardScaler(), "passthrough")
+    grid = {"model__n_estimators": [9, 27], "model__max_depth": [1, 2, 3, 4]}
+    est = RandomForestClassifier(random_state=0)
+    gs = run_gs(X_df, y, steps, est, grid, n_repeats=1, search="halving")
+    assert gs.n_candidates_[0] == 8 and gs.n_candidates_[-1] < 8
+    assert gs.n_resources_[0] < gs.n_resources_[-1] <= len(X_df)
+
+    gs = run_gs(
+        X_df,
+        y,
+        steps,
+        est,
+        grid,
+        n_repeats=1,
+        search="halving",
+        resource="model__n_estimators",
+    )
+    assert gs.n_candidates_[0] == 4
+    assert gs.n_resources_[-1] <= 27
+    with pytest.raises(ValueError):
+        run_gs(X_df, y, steps, est, grid, search="random")
+
+
+@pytest.mark.parametrize(
+    "kw",
+    [
+        {"staged": "model__n_estimators", "path": "model__C"},
+        {"path": "model__C", "prune": "model__ccp_alpha"},
+    ],
+)
+def test_run_gs_rejects_several_shortcuts(kw) -> None:
+    X, y = make_classification(n_samples=20, n_features=4, random_state=0)
+    steps = lr_steps(StandardScaler(), "passthrough")
+    with pytest.raises(ValueError, match="exclusive"):
+        run_gs(X, y, steps, LogisticRegression(), {"model__C": [1.0]}, **kw)
@@ -6,11 +6,19 @@ import subprocess
 import sysconfig
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 from sklearn.datasets import make_classification
 from sklearn.linear_model import LogisticRegression
 import joblib
 
+from scripts.bench_utils import loan_frame
+from src import predict
+from src.dataprep import clean
+from src.features import FeatureEngineer
+from src.models import cart
+
 
 def _toy_data() -> tuple[pd.DataFrame, pd.Series]:
     X, y = make_classification(
@@ -65,3 +73,117 @@ def test_cli_predict(tmp_path) -> None:
     assert out.exists()
     preds = pd.read_csv(out)
     assert len(preds) == len(df)
+
+
+def test_predict_chunked_matches_full(tmp_path) -> None:
+    df, y = _toy_data()
+    model = LogisticRegression(max_iter=1000).fit(df, y)
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(model, model_path)
+    data_path = tmp_path / "data.csv"
+    df.to_csv(data_path, index=False)
+
+    full = tmp_path / "full.csv"
+    chunked = tmp_path / "chunked.csv"
+    base = ["--model-path", str(model_path), "--data", str(data_path)]
+    predict.main([*base, "--out", str(full)])
+    predict.main([*base, "--out", str(chunked), "--chunk-size", "7"])
+
+    pd.testing.assert_frame_equal(pd.read_csv(full), pd.read_csv(chunked))
+
+
+def test_predict_chunk_size_one_matches_full_on_bundle(tmp_path) -> None:
+    raw = loan_frame(80)
+    raw.loc[raw.index[:4], "loan_term"] = 0
+    cleaned = clean(raw)
+    model_path = tmp_path / "cart.joblib"
+    cart.train_from_df(
+        FeatureEngineer().transform(cleaned), artefact_path=model_path, cleaned=cleaned
+    )
+    data_path = tmp_path / "data.csv"
+    raw.drop(columns=["loan_status"]).to_csv(data_path, index=False)
+
+    full = tmp_path / "full.csv"
+    chunked = tmp_path / "chunked.csv"
+    base = ["--model-path", str(model_path), "--data", str(data_path)]
+    predict.main([*base, "--out", str(full)])
+    predict.main([*base, "--out", str(chunked), "--chunk-size", "1"])
+
+    pd.testing.assert_frame_equal(pd.read_csv(full), pd.read_csv(chunked))
+
+
+def test_predict_chunked_rejects_bad_size(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        predict.predict_chunked(None, tmp_path / "x.csv", tmp_path / "o.csv", 0)
+
+
+def test_predict_parquet_roundtrip(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    df, y = _toy_data()
+    model = LogisticRegression(max_iter=1000).fit(df, y)
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(model, model_path)
+    data_path = tmp_path / "data.parquet"
+    df.to_parquet(data_path)
+
+    base = ["--model-path", str(model_path), "--data", str(data_path)]
+    predict.main([*base, "--out", str(tmp_path / "full.parquet")])
+    predict.main([*base, "--out", str(tmp_path / "c.arrow"), "--chunk-size", "6"])
+
+    expected = model.predict_proba(df)[:, 1]
+    full = pd.read_parquet(tmp_path / "full.parquet")["prediction"]
+    chunked = pd.read_feather(tmp_path / "c.arrow")["prediction"]
+    assert list(full) == pytest.approx(expected)
+    assert list(chunked) == pytest.approx(expected)
+
+
+def test_predict_many_merged_and_per_file(tmp_path) -> None:
+    df, y = _toy_data()
+    model = LogisticRegression(max_iter=1000).fit(df, y)
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(model, model_path)
+    parts = tmp_path / "parts"
+    parts.mkdir()
+    for i in range(4):
+        rows = np.arange(i * 6, min(i * 6 + 6, len(df)))
+        df.iloc[rows].to_csv(parts / f"part{i}.csv", index=False)
+
+    merged = tmp_path / "merged.csv"
+    predict.main(
+        ["--model-path", str(model_path), "--data", str(parts), "--out", str(merged)]
+        + ["--jobs", "2"]
+    )
+    res = pd.read_csv(merged)
+    assert list(res["source"].unique()) == [f"part{i}.csv" for i in range(4)]
+    assert list(res["prediction"]) == pytest.approx(model.predict_proba(df)[:, 1])
+
+    files = predict.expand_inputs(str(parts / "part[01].csv"))
+    stats = predict.predict_many(model_path, files, out_dir=tmp_path / "out")
+    assert [s["rows"] for s in stats] == [6, 6]
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+        "part0.csv",
+        "part1.csv",
+    ]
+    assert predict.worker_stats(stats)["files"].sum() == 2
+
+
+def test_predict_many_merged_streams_chunks(tmp_path, monkeypatch) -> None:
+    df, y = _toy_data()
+    model = LogisticRegression(max_iter=1000).fit(df, y)
+    model_path = tmp_path / "model.joblib"
+    joblib.dump(model, model_path)
+    files = [tmp_path / "part0.csv", tmp_path / "part1.csv"]
+    df.iloc[:10].to_csv(files[0], index=False)
+    df.iloc[10:].to_csv(files[1], index=False)
+
+    def whole_file(*args, **kwargs):
+        raise AssertionError("read the whole file")
+
+    monkeypatch.setattr(predict, "read_table", whole_file)
+    out = tmp_path / "merged.csv"
+    stats = predict.predict_many(model_path, files, out=out, chunk_size=3)
+    assert [s["rows"] for s in stats] == [10, 10]
+    res = pd.read_csv(out)
+    assert list(res["source"]) == ["part0.csv"] * 10 + ["part1.csv"] * 10
+    assert list(res["prediction"]) == pytest.approx(model.predict_proba(df)[:, 1])
+    assert predict._WORKER_MODEL is None
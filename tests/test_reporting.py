@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import io
+
 import pandas as pd
 
+from src import reporting
 from src.reporting import flatten_cv, flatten_metrics
 from src.report_helpers import conf_matrix_summary, group_metrics
 
@@ -55,3 +58,20 @@ def test_group_metrics() -> None:
     b = res[res["group"] == "B"].iloc[0]
     assert (a["n_pos"], a["n_neg"], a["TPR"]) == (1, 1, 1.0)
     assert (b["n_pos"], b["n_neg"], b["TPR"]) == (1, 1, 0.0)
+
+
+def test_dump_cart_params_reads_model_step_names(tmp_path, monkeypatch) -> None:
+    csv = tmp_path / "cv_results_tree_cart_prune.csv"
+    pd.DataFrame(
+        {
+            "param_model__ccp_alpha": [0.0, 0.01],
+            "param_model__class_weight": [None, "balanced"],
+            "rank_test_score": [2, 1],
+        }
+    ).to_csv(csv, index=False)
+    monkeypatch.setattr(reporting, "read_latest_glob", lambda pattern: csv)
+    out = io.StringIO()
+    reporting.dump_cart_params(out)
+    assert "ccp_alpha=0.01" in out.getvalue()
+    assert "class_weight=balanced" in out.getvalue()
+    assert "max_depth=None" in out.getvalue()
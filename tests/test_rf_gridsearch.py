@@ -35,9 +35,11 @@ def _toy_df(n: int = 30) -> pd.DataFrame:
 
 def test_rf_grid_search(tmp_path) -> None:
     df = _toy_df()
-    df = dataprep.clean(df)
-    df = FeatureEngineer().transform(df)
+    cleaned = dataprep.clean(df)
+    df = FeatureEngineer().transform(cleaned)
     artefact = tmp_path / "rf.joblib"
-    gs = random_forest.grid_train_from_df(df, "target", artefact_path=artefact)
+    gs = random_forest.grid_train_from_df(
+        df, "target", artefact_path=artefact, cleaned=cleaned
+    )
     assert isinstance(gs, GridSearchCV)
     assert artefact.exists()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.exceptions import NotFittedError
+
+from src import dataprep
+from src.features import FeatureEngineer
+from src.models import logreg
+from src.predict import predict_frame
+from src.scoring import ScoringModel, unwrap
+from src.split import stratified_split
+
+
+def _toy_df(n: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "income_annum": rng.normal(200_000, 50_000, n),
+            "loan_amount": rng.normal(100_000, 20_000, n),
+            "loan_term": rng.integers(6, 24, n),
+            "cibil_score": rng.integers(600, 750, n),
+            "education": rng.choice(["Graduate", "Not Graduate"], n),
+            "self_employed": rng.choice(["Yes", "No"], n),
+            "residential_assets_value": rng.uniform(50_000, 150_000, n),
+            "commercial_assets_value": rng.uniform(0, 100_000, n),
+            "luxury_assets_value": rng.uniform(0, 50_000, n),
+            "bank_asset_value": rng.uniform(0, 50_000, n),
+            "no_of_dependents": rng.integers(0, 4, n),
+            "loan_status": rng.choice(["Approved", "Rejected"], n),
+        }
+    )
+
+
+def test_scoring_model_matches_manual_path(tmp_path) -> None:
+    raw = _toy_df()
+    cleaned = dataprep.clean(raw)
+    df = FeatureEngineer().transform(cleaned)
+    fp = tmp_path / "logreg.joblib"
+    logreg.train_from_df(df, artefact_path=fp, cleaned=cleaned)
+
+    bundle = ScoringModel.load(fp)
+    assert isinstance(bundle, ScoringModel)
+    expected = unwrap(bundle).predict_proba(df.drop(columns=["loan_status"]))[:, 1]
+    assert np.allclose(bundle.score(raw), expected)
+    unlabeled = raw.drop(columns=["loan_status"])
+    assert np.allclose(predict_frame(bundle, unlabeled), expected)
+
+
+def test_scoring_model_keeps_rows() -> None:
+    raw = _toy_df()
+    df = FeatureEngineer().transform(dataprep.clean(raw))
+    x = df.drop(columns=["loan_status"])
+    cat_cols = x.select_dtypes(include=["object", "category"]).columns.tolist()
+    num_cols = [c for c in x.columns if c not in cat_cols]
+    pipe = logreg.build_pipeline(cat_cols, num_cols).fit(x, df["loan_status"])
+    bundle = ScoringModel(pipe, feature_engineer=FeatureEngineer().fit(x))
+    dup = pd.concat([raw.iloc[:3], raw.iloc[:3]], ignore_index=True)
+    assert len(bundle.score(dup)) == 6
+    with pytest.raises(NotFittedError):
+        ScoringModel(pipe).score(dup)
+
+
+def test_scoring_model_row_alone_matches_batch(tmp_path) -> None:
+    raw = _toy_df().assign(
+        gender=lambda d: np.where(d.index % 2, "M", "F"),
+        property_area=lambda d: np.array(["Rural", "Semiurban", "Urban"])[d.index % 3],
+    )
+    raw.loc[raw.index[:5], "loan_term"] = 0
+    cleaned = dataprep.clean(raw)
+    df = FeatureEngineer().transform(cleaned)
+    fp = tmp_path / "logreg.joblib"
+    logreg.train_from_df(df, artefact_path=fp, cleaned=cleaned)
+    bundle = ScoringModel.load(fp)
+
+    batch = bundle.score(raw)
+    alone = np.concatenate([bundle.score(raw.iloc[[i]]) for i in range(len(raw))])
+    np.testing.assert_allclose(alone, batch)
+    with pytest.raises(NotFittedError):
+        ScoringModel(bundle.pipeline).save(tmp_path / "unfitted.joblib")
+
+
+def test_bundle_engineer_fitted_on_cleaned_training_rows(tmp_path) -> None:
+    raw = _toy_df().assign(gender=lambda d: np.where(d.index % 2, "M", "F"))
+    cleaned = dataprep.clean(raw)
+    df = FeatureEngineer().transform(cleaned)
+    fp = tmp_path / "logreg.joblib"
+    with pytest.raises(ValueError):
+        logreg.train_from_df(df, artefact_path=fp)
+    logreg.train_from_df(df, artefact_path=fp, cleaned=cleaned)
+    fe = ScoringModel.load(fp).feature_engineer
+    assert fe.categories_["gender"] == ["F", "M"]
+    train, _, _ = stratified_split(df, "loan_status")
+    assert fe.loan_median_ == train["loan_amount"].median()
+
+    joblib.dump(unwrap(ScoringModel.load(fp)), tmp_path / "legacy.joblib")
+    with pytest.raises(TypeError):
+        ScoringModel.load(tmp_path / "legacy.joblib")
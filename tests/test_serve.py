@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import threading
+import urllib.request
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.datasets import make_classification
+from sklearn.linear_model import LogisticRegression
+
+from scripts.bench_utils import loan_frame
+from src.dataprep import clean
+from src.features import FeatureEngineer
+from src.models import logreg
+from src.scoring import ScoringModel
+from src.serve import MicroBatcher, load_models, make_server
+
+
+def _model() -> tuple[LogisticRegression, pd.DataFrame]:
+    X, y = make_classification(n_samples=40, n_features=3, n_informative=3,
+                               n_redundant=0, random_state=0)
+    df = pd.DataFrame(X, columns=["f0", "f1", "f2"])
+    return LogisticRegression(max_iter=1000).fit(df, y), df
+
+
+def test_micro_batcher_groups_rows() -> None:
+    model, df = _model()
+    batcher = MicroBatcher(model, max_batch_size=64, max_wait_ms=200)
+    rows = df.to_dict(orient="records")
+    preds = batcher.predict(rows)
+    batcher.close()
+    expected = model.predict_proba(df)[:, 1]
+    assert np.allclose(preds, expected)
+    assert batcher.n_batches < len(rows)
+
+
+def test_micro_batcher_isolates_bad_rows() -> None:
+    model, df = _model()
+    batcher = MicroBatcher(model, max_batch_size=8, max_wait_ms=200)
+    good = batcher.submit(df.iloc[0].to_dict())
+    bad = batcher.submit({"f0": 1.0})
+    assert np.isclose(good.result(5), model.predict_proba(df.iloc[[0]])[0, 1])
+    assert bad.exception(5) is not None
+    batcher.close()
+
+
+def test_micro_batcher_row_alone_matches_coalesced(tmp_path) -> None:
+    raw = loan_frame(60)
+    raw.loc[raw.index[:4], "loan_term"] = 0
+    cleaned = clean(raw)
+    logreg.train_from_df(
+        FeatureEngineer().transform(cleaned),
+        artefact_path=tmp_path / "lr.joblib",
+        cleaned=cleaned,
+    )
+    model = ScoringModel.load(tmp_path / "lr.joblib")
+    rows = raw.drop(columns=["loan_status"]).iloc[:20].to_dict(orient="records")
+
+    batcher = MicroBatcher(model, max_batch_size=64, max_wait_ms=50)
+    alone = [batcher.submit(row).result(5) for row in rows]
+    n_alone = batcher.n_batches
+    coalesced = batcher.predict(rows)
+    batcher.close()
+    assert n_alone == len(rows)
+    assert batcher.n_batches - n_alone < len(rows)
+    assert np.allclose(alone, coalesced)
+
+
+def test_server_roundtrip(tmp_path) -> None:
+    model, df = _model()
+    joblib.dump(model, tmp_path / "lr.joblib")
+    server = make_server(load_models([tmp_path / "lr.joblib"]), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/health") as resp:
+            assert json.load(resp) == {"models": ["lr"]}
+        body = json.dumps(df.iloc[:2].to_dict(orient="records")).encode()
+        req = urllib.request.Request(f"http://{host}:{port}/predict/lr", data=body)
+        with urllib.request.urlopen(req) as resp:
+            preds = json.load(resp)["prediction"]
+    finally:
+        server.shutdown()
+        server.server_close()
+        for b in server.batchers.values():
+            b.close()
+    assert np.allclose(preds, model.predict_proba(df.iloc[:2])[:, 1])
+
+
+def test_load_models_serves_only_bundles_from_directories(tmp_path) -> None:
+    model, _ = _model()
+    fe = FeatureEngineer().fit(clean(loan_frame(20)))
+    ScoringModel(model, feature_engineer=fe).save(tmp_path / "lr.joblib")
+    joblib.dump(model, tmp_path / "lr_calibrated.joblib")
+    joblib.dump({"C": 1.0}, tmp_path / "params.joblib")
+    assert list(load_models([tmp_path])) == ["lr"]
+    explicit = load_models([tmp_path / "lr_calibrated.joblib"])
+    assert isinstance(explicit["lr_calibrated"], LogisticRegression)
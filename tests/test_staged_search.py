@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.over_sampling import SMOTE
+from imblearn.pipeline import Pipeline
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
+
+from src.staged_search import (
+    PathGridSearchCV,
+    PrunedTreeSearchCV,
+    StagedGridSearchCV,
+    pruned_proba,
+    staged_proba,
+)
+
+
+def _data():
+    X, y = make_classification(n_samples=120, n_features=5, random_state=0)
+    return pd.DataFrame(X, columns=list("abcde")), pd.Series(y)
+
+
+def _mean_scores(gs) -> dict:
+    res = gs.cv_results_
+    keys = [str(sorted(p.items())) for p in res["params"]]
+    return dict(zip(keys, res["mean_test_score"]))
+
+
+def _ranks(gs) -> dict:
+    res = gs.cv_results_
+    keys = [str(sorted(p.items())) for p in res["params"]]
+    return dict(zip(keys, res["rank_test_score"].tolist()))
+
+
+@pytest.mark.parametrize(
+    "model", [RandomForestClassifier(random_state=0), GradientBoostingClassifier()]
+)
+def test_staged_proba_matches_smaller_model(model) -> None:
+    X, y = _data()
+    big = Pipeline([("prep", StandardScaler()), ("model", clone(model))])
+    big.set_params(model__n_estimators=12, model__random_state=0).fit(X, y)
+    small = Pipeline([("prep", StandardScaler()), ("model", clone(model))])
+    small.set_params(model__n_estimators=5, model__random_state=0).fit(X, y)
+    five, twelve = staged_proba(big, X, [5, 12])
+    np.testing.assert_allclose(five, small.predict_proba(X))
+    np.testing.assert_allclose(twelve, big.predict_proba(X))
+    with pytest.raises(ValueError):
+        staged_proba(big, X, [13])
+
+
+@pytest.mark.parametrize("sampler", ["passthrough", SMOTE(random_state=0)])
+def test_staged_search_matches_grid_search(sampler) -> None:
+    X, y = _data()
+    pipe = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("sampler", sampler),
+            ("model", RandomForestClassifier(random_state=0)),
+        ]
+    )
+    grid = {"model__n_estimators": [4, 8], "model__max_depth": [2, None]}
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    ref = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y)
+    gs = StagedGridSearchCV(pipe, grid, cv=cv).fit(X, y)
+
+    expected, got = _mean_scores(ref), _mean_scores(gs)
+    assert got.keys() == expected.keys()
+    for key, score in expected.items():
+        assert got[key] == pytest.approx(score)
+    assert gs.best_params_ == ref.best_params_
+    assert gs.best_score_ == pytest.approx(ref.best_score_)
+    assert isinstance(gs, GridSearchCV) and gs.n_splits_ == 3
+    assert gs.score(X, y) == pytest.approx(ref.score(X, y))
+    assert gs.predict_proba(X).shape == (len(X), 2)
+
+
+def test_unstaged_search_cv_results_match_grid_search() -> None:
+    X, y = _data()
+    pipe = Pipeline([("prep", StandardScaler()), ("model", LogisticRegression())])
+    # the repeated C ties, which GridSearchCV ranks with the lowest rank
+    grid = {"model__C": [1.0, 0.01, 1.0]}
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    ref = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y)
+    gs = StagedGridSearchCV(pipe, grid, stage_param=None, cv=cv).fit(X, y)
+
+    assert set(gs.cv_results_) == set(ref.cv_results_)
+    np.testing.assert_array_equal(
+        gs.cv_results_["rank_test_score"], ref.cv_results_["rank_test_score"]
+    )
+    assert gs.best_index_ == ref.best_index_
+    for key in ("mean_fit_time", "mean_score_time"):
+        assert (gs.cv_results_[key] > 0).all()
+    # pandas reads the results as it reads a GridSearchCV's
+    assert list(pd.DataFrame(gs.cv_results_)) == list(pd.DataFrame(ref.cv_results_))
+
+
+def test_path_search_matches_grid_search() -> None:
+    X, y = _data()
+    pipe = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("sampler", "passthrough"),
+            ("model", LogisticRegression(max_iter=1000)),
+        ]
+    )
+    grid = [
+        {
+            "model__solver": ["liblinear"],
+            "model__penalty": ["l1", "l2"],
+            "model__C": [10.0, 0.01, 1.0],
+            "sampler": ["passthrough", SMOTE(random_state=0)],
+        },
+        {
+            "model__solver": ["saga"],
+            "model__penalty": ["elasticnet"],
+            "model__l1_ratio": [0.5],
+            "model__C": [0.1, 1.0],
+            "model__tol": [1e-8],
+        },
+    ]
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    ref = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y)
+    gs = PathGridSearchCV(pipe, grid, cv=cv).fit(X, y)
+
+    expected, got = _mean_scores(ref), _mean_scores(gs)
+    assert got.keys() == expected.keys()
+    for key, score in expected.items():
+        assert got[key] == pytest.approx(score, abs=1e-6)
+    assert gs.best_params_ == ref.best_params_
+    assert set(gs.cv_results_) == set(ref.cv_results_)
+    assert (gs.cv_results_["mean_fit_time"] > 0).all()
+
+
+def test_path_search_ranks_ties_like_grid_search() -> None:
+    X, y = _data()
+    pipe = Pipeline([("prep", StandardScaler()), ("model", LogisticRegression())])
+    # liblinear matches exactly; the repeated C values tie
+    grid = {"model__solver": ["liblinear"], "model__C": [0.01, 1.0, 1.0, 10.0]}
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    ref = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y)
+    gs = PathGridSearchCV(pipe, grid, cv=cv).fit(X, y)
+    np.testing.assert_array_equal(
+        gs.cv_results_["rank_test_score"], ref.cv_results_["rank_test_score"]
+    )
+
+
+@pytest.mark.parametrize("kw", [{}, {"class_weight": "balanced", "max_depth": 4}])
+def test_pruned_proba_matches_refit(kw) -> None:
+    X, y = _data()
+    tree = DecisionTreeClassifier(random_state=0, **kw).fit(X, y)
+    alphas = [*tree.cost_complexity_pruning_path(X, y).ccp_alphas, 0.003, 1.0]
+    for alpha, proba in zip(alphas, pruned_proba(tree, X, alphas)):
+        ref = DecisionTreeClassifier(random_state=0, ccp_alpha=alpha, **kw)
+        np.testing.assert_allclose(proba, ref.fit(X, y).predict_proba(X))
+
+
+def test_pruned_search_matches_grid_search() -> None:
+    X, y = _data()
+    pipe = Pipeline(
+        [
+            ("prep", StandardScaler()),
+            ("sampler", SMOTE(random_state=0)),
+            ("model", DecisionTreeClassifier(random_state=0)),
+        ]
+    )
+    grid = {"model__ccp_alpha": [0.0, 0.005, 0.02], "model__max_depth": [3, None]}
+    cv = StratifiedKFold(3, shuffle=True, random_state=0)
+    ref = GridSearchCV(pipe, grid, cv=cv, scoring="roc_auc").fit(X, y)
+    gs = PrunedTreeSearchCV(pipe, grid, cv=cv).fit(X, y)
+
+    expected, got = _mean_scores(ref), _mean_scores(gs)
+    assert got.keys() == expected.keys()
+    for key, score in expected.items():
+        assert got[key] == pytest.approx(score)
+    assert gs.best_params_ == ref.best_params_
+    assert set(gs.cv_results_) == set(ref.cv_results_)
+    # large alphas prune both depths to the same tree, a tie
+    assert _ranks(gs) == _ranks(ref)
+
+
+def test_pruned_search_takes_alphas_from_path() -> None:
+    X, y = _data()
+    pipe = Pipeline([("model", DecisionTreeClassifier(random_state=0))])
+    gs = PrunedTreeSearchCV(pipe, {"model__max_depth": [None]}, n_alphas=5, cv=3)
+    gs.fit(X, y)
+    alphas = gs.cv_results_["param_model__ccp_alpha"]
+    path = DecisionTreeClassifier(random_state=0).cost_complexity_pruning_path(X, y)
+    assert 1 < len(alphas) <= 5
+    assert set(alphas) <= set(path.ccp_alphas[:-1])
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from src import dataprep
+from src.tabular_io import (
+    ChunkWriter,
+    infer_format,
+    iter_table,
+    read_table,
+    write_table,
+)
+
+pytest.importorskip("pyarrow")
+
+
+def _df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"a": range(10), "b": [x / 3 for x in range(10)], "c": list("abcdefghij")}
+    )
+
+
+def test_infer_format() -> None:
+    assert infer_format("x.parquet") == "parquet"
+    assert infer_format("x.feather") == "arrow"
+    assert infer_format("x.txt") == "csv"
+    assert infer_format("x.csv", "arrow") == "arrow"
+    with pytest.raises(ValueError):
+        infer_format("x.csv", "xlsx")
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_roundtrip_and_projection(tmp_path, suffix) -> None:
+    df = _df()
+    path = write_table(df, tmp_path / f"t{suffix}")
+    pd.testing.assert_frame_equal(read_table(path), df)
+    pd.testing.assert_frame_equal(
+        read_table(path, ["c", "a"])[["c", "a"]], df[["c", "a"]]
+    )
+    pd.testing.assert_frame_equal(dataprep.load_raw(path), df)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".arrow"])
+def test_chunks(tmp_path, suffix) -> None:
+    df = _df()
+    path = write_table(df, tmp_path / f"t{suffix}")
+    chunks = list(iter_table(path, 4))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    out = tmp_path / f"o{suffix}"
+    with ChunkWriter(out) as writer:
+        for c in chunks:
+            writer.write(c)
+    pd.testing.assert_frame_equal(read_table(out), df)